@@ -0,0 +1,164 @@
+# benchmarks/bench_api_articles.py
+"""
+/articles 부하 벤치마크 (기존 sync 구현 vs async + 전용 DB 워커 + 커넥션 풀)
+- legacy: 요청마다 새 연결 생성, sync def 엔드포인트 (FastAPI 스레드 풀에서 실행)
+- async : src/api.py 현재 구현 (API 전용 풀 연결, DB 전용 워커, 기본 설정 그대로), 응답 캐시 끔
+  → 모든 요청이 DB 조회 (legacy와 같은 조건)
+- cached: 같은 구현 + 응답 캐시(API_CACHE_TTL) → 같은 요청 반복이므로 대부분 캐시 적중
+- 행마다 DB 연결 대여 횟수(db) 출력 → 캐시 적중 여부 확인
+- 동시 요청 수(--concurrency)로 총 --requests건 호출 → 초당 요청 수, p50 / p99 지연 출력
+- 기본은 가짜 DB(연결/쿼리 지연을 sleep으로 흉내), --real 지정 시 .env의 실제 DB 사용
+- 사용법:
+    python benchmarks/bench_api_articles.py
+    python benchmarks/bench_api_articles.py --concurrency 128 --requests 5000 --connect-ms 20
+    python benchmarks/bench_api_articles.py --real
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import httpx
+from fastapi import FastAPI
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.db as db
+import src.api as api
+from src import async_db
+
+# ===========================================================
+# 1. 가짜 DB (연결 / 쿼리 지연만 흉내)
+# ===========================================================
+class FakeCursor:
+    def __init__(self, query_ms: float):
+        self.query_ms = query_ms
+        self.rows = []
+
+    def execute(self, sql, params=()):
+        time.sleep(self.query_ms / 1000)
+        limit = list(params)[-1]
+        now = datetime.now()
+        self.rows = [{
+            "id": i, "title": f"기사 {i}", "link": f"http://www.boannews.com/media/view.asp?idx={i}",
+            "category": "http://www.boannews.com/media/news_rss.xml?kind=1",
+            "fetched_at": now - timedelta(seconds=i),
+        } for i in range(limit)]
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+class FakeConn:
+    def __init__(self, query_ms: float):
+        self.query_ms = query_ms
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self.query_ms)
+
+    def ping(self, reconnect=False):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+def fake_connect(connect_ms: float, query_ms: float):
+    def connect():
+        time.sleep(connect_ms / 1000)
+        return FakeConn(query_ms)
+    return connect
+
+# ===========================================================
+# 2. 기존 구현 (요청마다 새 연결, sync def)
+# ===========================================================
+legacy_app = FastAPI()
+
+@legacy_app.get("/articles")
+def legacy_list_articles(limit: int = 100):
+    conn = db.connect()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(
+            "SELECT id, title, link, category, fetched_at FROM articles "
+            "ORDER BY fetched_at DESC LIMIT %s",
+            (limit,)
+        )
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+        conn.close()
+    for row in rows:
+        row["pub_date"] = row.pop("fetched_at").strftime("%Y-%m-%dT%H:%M:%SZ")
+        row["category"] = api.CATEGORY_MAPPING.get(row["category"], row["category"])
+    return {"articles": rows}
+
+# ===========================================================
+# 3. 부하 생성
+# ===========================================================
+async def run_load(app, concurrency: int, total: int, limit: int) -> dict:
+    latencies = []
+    counter = iter(range(total))
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            for _ in counter:
+                start = time.perf_counter()
+                resp = await client.get("/articles", params={"limit": limit})
+                resp.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50": latencies[len(latencies) // 2] * 1000,
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="/articles 부하 벤치마크")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--connect-ms", type=float, default=10.0, help="가짜 DB 연결 생성 지연")
+    parser.add_argument("--query-ms", type=float, default=5.0, help="가짜 DB 쿼리 지연")
+    parser.add_argument("--real", action="store_true", help="실제 DB 사용")
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)   # 요청별 로그 생략
+
+    if not args.real:
+        db.connect = fake_connect(args.connect_ms, args.query_ms)
+    db._pool = async_db._pool = None   # 교체한 connect로 풀 생성
+
+    print(f"동시 {args.concurrency}, 총 {args.requests}건, limit {args.limit}"
+          + ("" if args.real else f", 가짜 DB(연결 {args.connect_ms}ms / 쿼리 {args.query_ms}ms)"))
+    print(f"{'impl':<8} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'db':>8}")
+    pool = async_db.get_api_pool()
+    cache_ttl = api.articles_cache.ttl
+    # (이름, 앱, 응답 캐시 TTL): TTL < 0이면 캐시 항목이 바로 만료 → 매 요청 DB 조회
+    for name, app, ttl in (("legacy", legacy_app, None), ("async", api.app, -1.0), ("cached", api.app, cache_ttl)):
+        if ttl is not None:
+            api.articles_cache.clear()
+            api.articles_cache.ttl = ttl
+        before = pool.stats()
+        result = asyncio.run(run_load(app, args.concurrency, args.requests, args.limit))
+        after = pool.stats()
+        acquired = "-" if ttl is None else (after["hits"] + after["misses"]) - (before["hits"] + before["misses"])
+        print(f"{name:<8} {result['rps']:>10.0f} {result['p50']:>10.1f} {result['p99']:>10.1f} {acquired:>8}")
+    print(f"API 풀 지표: {pool.stats()}")
+
+if __name__ == "__main__":
+    main()
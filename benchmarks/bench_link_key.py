@@ -0,0 +1,103 @@
+# benchmarks/bench_link_key.py
+"""
+중복 제거 키 벤치마크 (VARCHAR link UNIQUE vs BIGINT link_hash UNIQUE)
+- 임시 테이블 2개에 같은 링크 N건을 배치 INSERT IGNORE → 초당 INSERT 수 비교
+- information_schema.TABLES의 INDEX_LENGTH로 인덱스 크기 비교
+- 현재 articles / articles_old 인덱스 크기도 함께 출력
+- DB 필요 (.env의 DB_* 설정 사용), 임시 테이블은 종료 시 삭제
+- 사용법:
+    python benchmarks/bench_link_key.py
+    python benchmarks/bench_link_key.py --rows 200000 --batch 500
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import get_connection
+from src.hashing import link_hash
+
+TABLES = {
+    "bench_link_varchar": (
+        "id INT AUTO_INCREMENT PRIMARY KEY, link VARCHAR(500) NOT NULL, UNIQUE KEY uq_link (link)",
+        "INSERT IGNORE INTO bench_link_varchar (link) VALUES (%s)",
+        lambda link: (link,),
+    ),
+    "bench_link_hash": (
+        "id INT AUTO_INCREMENT PRIMARY KEY, link VARCHAR(500) NOT NULL, "
+        "link_hash BIGINT UNSIGNED NOT NULL, UNIQUE KEY uq_link_hash (link_hash)",
+        "INSERT IGNORE INTO bench_link_hash (link, link_hash) VALUES (%s, %s)",
+        lambda link: (link, link_hash(link)),
+    ),
+}
+
+def make_links(rows: int) -> list:
+    """실제 기사 URL과 비슷한 길이의 링크 생성"""
+    return [
+        f"https://www.boannews.com/media/view.asp?idx={100000 + i}&kind=1&page=1&search=title"
+        for i in range(rows)
+    ]
+
+def index_sizes(cursor, tables) -> dict:
+    cursor.execute("ANALYZE TABLE " + ", ".join(tables))
+    cursor.fetchall()
+    placeholders = ", ".join(["%s"] * len(tables))
+    cursor.execute(
+        "SELECT TABLE_NAME, DATA_LENGTH, INDEX_LENGTH FROM information_schema.TABLES "
+        f"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN ({placeholders})",
+        tuple(tables),
+    )
+    return {name: (data, index) for name, data, index in cursor.fetchall()}
+
+def bench_table(conn, name: str, links: list, batch: int) -> float:
+    ddl, sql, row = TABLES[name]
+    cursor = conn.cursor()
+    cursor.execute(f"DROP TABLE IF EXISTS {name}")
+    cursor.execute(f"CREATE TABLE {name} ({ddl}) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4")
+
+    start = time.perf_counter()
+    for i in range(0, len(links), batch):
+        cursor.executemany(sql, [row(link) for link in links[i:i + batch]])
+        conn.commit()
+    elapsed = time.perf_counter() - start
+    cursor.close()
+    return len(links) / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="link vs link_hash 중복 키 벤치마크")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--batch", type=int, default=200)
+    args = parser.parse_args()
+
+    conn = get_connection()
+    if not conn:
+        print("DB 연결 실패")
+        sys.exit(1)
+
+    links = make_links(args.rows)
+    try:
+        rates = {name: bench_table(conn, name, links, args.batch) for name in TABLES}
+        cursor = conn.cursor()
+        sizes = index_sizes(cursor, list(TABLES) + ["articles", "articles_old"])
+
+        print(f"링크 {args.rows}건, 배치 {args.batch}건")
+        print(f"{'table':<20} {'rows/s':>10} {'index MB':>10} {'data MB':>10}")
+        for name, rate in rates.items():
+            data, index = sizes.get(name, (0, 0))
+            print(f"{name:<20} {rate:>10.0f} {index / 1048576:>10.2f} {data / 1048576:>10.2f}")
+        for name in ("articles", "articles_old"):
+            if name in sizes:
+                data, index = sizes[name]
+                print(f"{name:<20} {'-':>10} {index / 1048576:>10.2f} {data / 1048576:>10.2f}")
+
+        for name in TABLES:
+            cursor.execute(f"DROP TABLE IF EXISTS {name}")
+        cursor.close()
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/bench_rss_parser.py
+"""
+RSS 파서 백엔드 벤치마크 (fast vs feedparser)
+- 기록된 피드 본문(기본: tests/fixtures/*.xml)을 백엔드별로 반복 파싱
+- entry당 파싱 시간, 최대 메모리(tracemalloc) 비교
+- 사용법:
+    python benchmarks/bench_rss_parser.py
+    python benchmarks/bench_rss_parser.py --dir 저장한_피드_폴더 --repeat 200
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.rss import PARSER_BACKENDS, decode_feed
+
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures")
+
+def load_bodies(directory: str) -> list:
+    """피드 본문 로드 후 디코딩 (디코딩 비용은 측정에서 제외)"""
+    texts = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.xml"))):
+        with open(path, "rb") as f:
+            text, _ = decode_feed(f.read())
+        texts.append(text)
+    return texts
+
+def bench_backend(name: str, texts: list, repeat: int) -> dict:
+    parse = PARSER_BACKENDS[name]
+
+    # 1) 시간 측정
+    entries = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            entries += len(parse(text)["entries"])
+    elapsed = time.perf_counter() - start
+
+    # 2) 최대 메모리 측정 (1회 파싱 기준)
+    tracemalloc.start()
+    for text in texts:
+        parse(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "backend": name,
+        "entries": entries,
+        "per_entry_us": elapsed / max(entries, 1) * 1e6,
+        "total_s": elapsed,
+        "peak_kb": peak / 1024,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="RSS 파서 백엔드 벤치마크")
+    parser.add_argument("--dir", default=DEFAULT_DIR, help="피드 본문(*.xml) 폴더")
+    parser.add_argument("--repeat", type=int, default=100, help="반복 횟수")
+    args = parser.parse_args()
+
+    texts = load_bodies(args.dir)
+    if not texts:
+        print(f"피드 파일 없음: {args.dir}")
+        return
+
+    print(f"피드 {len(texts)}개, 반복 {args.repeat}회")
+    print(f"{'backend':<12}{'us/entry':>12}{'total(s)':>12}{'peak(KB)':>12}")
+    results = [bench_backend(name, texts, args.repeat) for name in ("feedparser", "fast")]
+    for r in results:
+        print(f"{r['backend']:<12}{r['per_entry_us']:>12.1f}{r['total_s']:>12.3f}{r['peak_kb']:>12.1f}")
+
+    base, fast = results
+    print(f"\n속도 향상: {base['per_entry_us'] / max(fast['per_entry_us'], 1e-9):.1f}배, "
+          f"메모리 감소: {base['peak_kb'] / max(fast['peak_kb'], 1e-9):.1f}배")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_serialize_articles.py
+"""
+/articles 응답 직렬화 마이크로 벤치마크 (DB 불필요)
+- fastapi : dict 반환 시 FastAPI 기본 경로 (행 가공 → 모델 검증 → jsonable_encoder → json.dumps)
+- pydantic: 이전 구현 (행 가공 → ArticlesResponse.model_validate → model_dump_json)
+- fast    : src/serialize.articles_body (DB 행 → JSON bytes, 모델 검증 없음, orjson 사용 가능 시 orjson)
+- json    : fast와 같은 경로를 표준 json으로 (orjson 미설치 환경의 대체 경로)
+- gzip    : fast 결과 gzip 압축 비용 (캐시 미스 시 1회)
+- 행 수별(기본 100 / 1,000 / 10,000) 1회 직렬화 평균 시간(ms) 출력
+- 사용법:
+    python benchmarks/bench_serialize_articles.py
+    python benchmarks/bench_serialize_articles.py --rows 100 1000 10000 --repeat 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.api as api
+from src import serialize
+from src.response_cache import compress_body
+
+# ===========================================================
+# 1. 테스트 데이터 (DB 조회 결과 형태)
+# ===========================================================
+def make_rows(n: int) -> list:
+    urls = list(api.CATEGORY_MAPPING)
+    now = datetime.now()
+    return [{
+        "id": i,
+        "title": f"[보안] 랜섬웨어 공격 동향 분석 보고서 발표 {i}",
+        "link": f"http://www.boannews.com/media/view.asp?idx={100000 + i}&kind=1",
+        "category": urls[i % len(urls)],
+        "fetched_at": now - timedelta(seconds=i),
+    } for i in range(n)]
+
+# ===========================================================
+# 2. 구현별 직렬화
+# ===========================================================
+def serialize_fastapi(rows):
+    rows = [api.format_article_row(dict(row)) for row in rows]
+    payload = api.ArticlesResponse.model_validate({"articles": rows, "next_cursor": None})
+    return json.dumps(jsonable_encoder(payload), ensure_ascii=False).encode("utf-8")
+
+def serialize_pydantic(rows):
+    rows = [api.format_article_row(dict(row)) for row in rows]
+    payload = api.ArticlesResponse.model_validate({"articles": rows, "next_cursor": None})
+    return payload.model_dump_json().encode("utf-8")
+
+def serialize_fast(rows):
+    return serialize.articles_body(rows, None, api.CATEGORY_MAPPING)
+
+def serialize_json(rows):
+    dumps, serialize.dumps = serialize.dumps, serialize.json_dumps
+    try:
+        return serialize.articles_body(rows, None, api.CATEGORY_MAPPING)
+    finally:
+        serialize.dumps = dumps
+
+def main():
+    parser = argparse.ArgumentParser(description="/articles 직렬화 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"인코더: {'orjson' if serialize.orjson is not None else 'json (orjson 미설치)'}")
+    print(f"{'rows':>8} {'fastapi ms':>12} {'pydantic ms':>12} {'fast ms':>10} {'json ms':>10} "
+          f"{'gzip ms':>10} {'배율':>8} {'배율(json)':>10}")
+    for n in args.rows:
+        rows = make_rows(n)
+        body = serialize_fast(rows)
+        assert body == serialize_pydantic(rows) == serialize_json(rows)   # 출력 동일 확인
+        number = max(1, args.repeat * 1000 // n)
+        times = {
+            name: min(timeit.repeat(lambda f=f: f(rows), number=number, repeat=3)) / number * 1000
+            for name, f in (("fastapi", serialize_fastapi), ("pydantic", serialize_pydantic),
+                            ("fast", serialize_fast), ("json", serialize_json))
+        }
+        gzip_ms = min(timeit.repeat(lambda: compress_body(body, "gzip"), number=number, repeat=3)) / number * 1000
+        print(f"{n:>8} {times['fastapi']:>12.3f} {times['pydantic']:>12.3f} {times['fast']:>10.3f} "
+              f"{times['json']:>10.3f} {gzip_ms:>10.3f} {times['pydantic'] / times['fast']:>7.1f}x "
+              f"{times['pydantic'] / times['json']:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
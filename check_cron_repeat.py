@@ -31,7 +31,8 @@ def check_db_summary():
     """
     1. articles_old에 아카이브된 기사 수 확인
     2. articles에 남아있는 원본 기사 수 확인
-    3. articles_old에서 중복 링크 확인
+       (1, 2는 테이블 직접 집계, 기준 시각 그대로 → fetched_at 인덱스 범위 스캔)
+    3. articles_old에서 중복 링크 확인 (link_hash 인덱스 사용, 두 레이아웃 모두)
     """
     conn = get_connection()
     if not conn:
@@ -54,9 +55,10 @@ def check_db_summary():
         )
         articles_count = cursor.fetchone()[0]
 
-        # articles_old 중복 링크 확인
+        # articles_old 중복 링크 확인 (고유 키가 있어도 점검: 키 추가 전 데이터 / 파티션 레이아웃)
         cursor.execute(
-            "SELECT link, COUNT(*) AS cnt FROM articles_old GROUP BY link HAVING COUNT(*) > 1"
+            "SELECT MIN(link), COUNT(*) AS cnt FROM articles_old WHERE link_hash IS NOT NULL "
+            "GROUP BY link_hash HAVING COUNT(*) > 1"
         )
         duplicates = cursor.fetchall()
 
@@ -7,21 +7,11 @@
 # - 메일 테스트
 # ============================================================
 
-import pymysql
 import subprocess
 from datetime import datetime, timedelta
 import os
 
-# =========================
-# DB 접속 정보
-# =========================
-DB = {
-    "host": "localhost",
-    "user": "newsbot",
-    "password": "newsbot_pass!",
-    "database": "boannews",
-    "charset": "utf8mb4"
-}
+from src.db import get_connection, get_pool
 
 # =========================
 # 로그 파일 경로
@@ -40,10 +30,13 @@ yesterday_end = today_start
 # =========================
 # DB 연결
 # =========================
-conn = pymysql.connect(**DB)
+conn = get_connection()   # 공용 풀 (접속 정보는 .env의 DB_*)
+if not conn:
+    raise SystemExit("[ERROR] DB 연결 실패")
 cur = conn.cursor()
 
 def check_articles(start, end):
+    # 건수: articles(아카이브 전 원본)만, 정확한 시간 범위 (idx_articles_fetched_at 범위 스캔)
     cur.execute("""
         SELECT COUNT(*) FROM articles
         WHERE fetched_at >= %s AND fetched_at < %s
@@ -104,4 +97,5 @@ print("\n테스트 메일 발송 완료 ✅")
 
 cur.close()
 conn.close()
+get_pool().log_stats()
 
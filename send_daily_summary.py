@@ -7,11 +7,13 @@
 # - cron 로그에 실행 시간 표시
 # ============================================================
 
-import pymysql
 import subprocess
 from datetime import datetime, timedelta
 import re
 
+from src.db import get_connection
+from src.timerange import fetch_digest
+
 # ============================================================
 # 1. 메인 함수 정의
 # ============================================================
@@ -27,17 +29,6 @@ def send_daily_summary():
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         print(f"[{now}] {msg}")
 
-    # ============================================================
-    # 1-2. DB 접속 정보 (MariaDB)
-    # ============================================================
-    DB = {
-        "host": "localhost",            # DB 서버 주소
-        "user": "newsbot",              # DB 사용자
-        "password": "newsbot_pass!",    # DB 비밀번호
-        "database": "boannews",         # 사용할 DB 이름
-        "charset": "utf8mb4"
-    }
-
     # ============================================================
     # 2. RSS URL → 카테고리 이름 매핑
     # ============================================================
@@ -71,48 +62,33 @@ def send_daily_summary():
     log(f"집계 범위: {start_dt} ~ {end_dt}")
 
     # ============================================================
-    # 4. DB 연결
+    # 4. DB 연결 (공용 풀, 접속 정보는 .env의 DB_*)
     # ============================================================
-    conn = pymysql.connect(**DB)
-    cur = conn.cursor()
+    conn = get_connection()
+    if not conn:
+        raise RuntimeError("DB 연결 실패")
+    # 전체 상위 5건 + 카테고리별 상위 3건을 한 번에 조회
+    # (집계 범위가 이미 아카이브됐으면 articles_old도 함께, src/timerange.py)
+    try:
+        top_rows, rows_by_category = fetch_digest(conn, start_dt, end_dt, overall=5, per_category=3)
+    finally:
+        conn.close()
 
     # ============================================================
-    # 5. 전체기사 조회
+    # 5. 전체기사
     # ============================================================
-    cur.execute("""
-        SELECT title, link
-        FROM articles
-        WHERE fetched_at >= %s AND fetched_at < %s
-        ORDER BY fetched_at ASC
-        LIMIT 5
-    """, (start_dt, end_dt))
-
-    articles_by_category = {"전체기사": cur.fetchall()}
+    articles_by_category = {"전체기사": [(row["title"], row["link"]) for row in top_rows]}
 
     # ============================================================
-    # 6. 카테고리별 조회
+    # 6. 카테고리별 (전체기사에 이미 있는 제목은 중복 제거)
     # ============================================================
+    existing_titles = {t for (t, _) in articles_by_category["전체기사"]}
     for url, cat_name in CATEGORY_MAP.items():
-        cur.execute("""
-            SELECT title, link
-            FROM articles
-            WHERE fetched_at >= %s
-              AND fetched_at < %s
-              AND category = %s
-            ORDER BY fetched_at ASC
-            LIMIT 3
-        """, (start_dt, end_dt, url))
-
-        rows = cur.fetchall()
-        # 전체기사에 이미 있는 제목은 중복 제거
-        existing_titles = {t for (t, _) in articles_by_category["전체기사"]}
         articles_by_category[cat_name] = [
-            (t, l) for (t, l) in rows if t not in existing_titles
+            (row["title"], row["link"]) for row in rows_by_category.get(url, [])
+            if row["title"] not in existing_titles
         ]
 
-    cur.close()
-    conn.close()
-
     # ============================================================
     # 7. HTML 정제 함수
     # ============================================================
@@ -172,6 +148,8 @@ Content-Type: text/html; charset=UTF-8
         text=True
     )
     proc.communicate(mail_body)
+    if proc.returncode != 0:
+        raise RuntimeError(f"sendmail 종료 코드 {proc.returncode}")
 
     log(f"메일 발송 완료 (총 {total_articles}건)")
     if total_articles == 0:
@@ -7,20 +7,14 @@
 # - 실제 메일 발송 없이 본문 출력
 # ============================================================
 
-import pymysql
 from datetime import datetime, timedelta
 import re
 
+from src.db import get_connection
+
 # =========================
-# 1. DB 접속 정보
+# 1. DB 접속 정보: 공용 풀 사용 (.env의 DB_HOST / DB_USER / DB_PASSWORD / DB_NAME)
 # =========================
-DB = {
-    "host": "localhost",
-    "user": "newsbot",
-    "password": "newsbot_pass!",
-    "database": "boannews",
-    "charset": "utf8mb4"
-}
 
 # =========================
 # 2. RSS URL → 카테고리 이름 매핑
@@ -55,7 +49,9 @@ end_dt = datetime.combine(today, datetime.min.time())
 # =========================
 # 4. DB 연결 및 조회
 # =========================
-conn = pymysql.connect(**DB)
+conn = get_connection()
+if not conn:
+    raise SystemExit("[ERROR] DB 연결 실패")
 cur = conn.cursor()
 
 # 전체기사 조회
@@ -1,33 +1,79 @@
 # ============================================================
 # src/api.py
 # FastAPI 서버 - BoanNews RSS API
-# - 뉴스 조회: /articles
-# - 일간 요약 메일 발송: /send-summary
+# - 뉴스 조회: /articles (키셋 커서 페이지네이션, category / since / until 필터)
+#   · articles + articles_old 통합 조회 (범위가 아카이브 경계에 닿을 때만 articles_old, src/timerange.py)
+#   · async 엔드포인트, DB 조회는 전용 워커(src/async_db.py)에서 실행
+#   · 응답 캐시(TTL/LRU) + ETag/304, 수집기가 기사 버전을 올리면 캐시 무효화
+#   · DB 행 → JSON bytes 직접 직렬화(src/serialize.py), gzip / br 압축 협상
+# - 새 기사 실시간 알림: /articles/stream (SSE, 수집기 → 로컬 소켓 → EventHub, src/events.py)
+# - 기사 검색: /search (제목+요약 bigram 역색인, src/search_index.py)
+# - 대량 내보내기: /export (articles + articles_old, NDJSON / CSV 스트리밍, src/export.py)
+# - 일간 요약 메일 발송: /send-summary (백그라운드 작업, 작업 ID 즉시 반환, /send-summary/{job_id}로 상태 조회)
+# - 기사 수 통계: /stats (카테고리/시간별 카운터 합산, src/stats.py)
+# - DB 커넥션 풀 지표: /pool-stats (요청마다 연결을 새로 만들지 않고 공용 풀 사용)
 # - CORS 허용, pub_date alias 적용, RSS URL → DB 키 매핑
 # ============================================================
 
 import sys
 import os
-from typing import List
-from datetime import datetime
+import asyncio
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import List, Optional
+from datetime import date, datetime
 
 # 상위 경로 import 허용
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
-from src.db import get_connection
+from src.db import get_pool
+from src import async_db
+from src.article_query import InvalidCursor, decode_cursor, split_page
+from src.events import EventHub, start_bridge, stop_bridge
+from src.db_pool import PoolTimeout
+from src.export import FORMATS, close_export_pool, export_filename, export_stream, get_export_pool
+from src.jobs import JobManager, JobQueueFull
+from src.stats import category_counts, hourly_counts
+from src.timerange import fetch_page, to_db_time
+from src.response_cache import (
+    ResponseCache, compress_body, etag_matches, negotiate_encoding, read_articles_version,
+)
+from src.serialize import articles_body
+from src.search_index import SearchIndex
 import send_daily_summary as sds
 
 # ============================
 # FastAPI 앱 생성
 # ============================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 수집기 새 기사 알림 수신 (실패해도 API는 계속 동작, 워커 여러 개면 1개만 수신 가능)
+    bridge = None
+    try:
+        bridge = await start_bridge(on_crawler_event)
+    except Exception as e:
+        logging.warning(f"이벤트 소켓 수신 불가, /articles/stream 알림 비활성: {e}")
+    yield
+    if bridge is not None:
+        stop_bridge(bridge)
+    # 종료 시 백그라운드 작업 / DB 워커 / 풀 연결 정리
+    jobs.shutdown()
+    async_db.shutdown()
+    get_pool().close_all()
+    close_export_pool()
+
 app = FastAPI(
     title="BoanNews RSS API",
     description="BoanNews RSS 크롤러 API - 뉴스 조회 및 일간 요약 메일 발송",
-    version="1.0"
+    version="1.0",
+    lifespan=lifespan
 )
 
 # ============================
@@ -53,6 +99,27 @@ class Article(BaseModel):
 
 class ArticlesResponse(BaseModel):
     articles: List[Article] = Field(..., description="뉴스 리스트")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+class CategoryStats(BaseModel):
+    category: Optional[str] = Field(None, description="카테고리 (DB 키 기준, 없으면 null)")
+    live: int = Field(..., description="articles 기사 수")
+    archived: int = Field(..., description="articles_old 기사 수")
+
+class HourStats(BaseModel):
+    hour: datetime = Field(..., description="수집 시각 (정시 단위)")
+    live: int
+    archived: int
+
+class StatsResponse(BaseModel):
+    live: int = Field(..., description="articles 기사 수 합계")
+    archived: int = Field(..., description="articles_old 기사 수 합계")
+    categories: List[CategoryStats] = Field(..., description="카테고리별 기사 수")
+    hourly: Optional[List[HourStats]] = Field(None, description="시간별 기사 수 (hourly=true일 때)")
+
+class SearchResponse(BaseModel):
+    articles: List[Article] = Field(..., description="검색 결과 (일치 토큰 수 → 최신순)")
+    took_ms: float = Field(..., description="검색 소요 시간 (ms)")
 
 # ============================
 # RSS URL → DB 키 매핑
@@ -79,55 +146,273 @@ CATEGORY_MAPPING = {
     "http://www.boannews.com/media/news_rss.xml?skind=6": "policy",
 }
 
+# DB 키 → RSS URL (category 필터용)
+CATEGORY_URLS = {key: url for url, key in CATEGORY_MAPPING.items()}
+
+# /articles 응답 캐시 (키: 기사 버전 + 쿼리 파라미터)
+articles_cache = ResponseCache()
+
+# 메일 발송 등 백그라운드 작업
+jobs = JobManager()
+
+# 새 기사 SSE 구독자
+event_hub = EventHub()
+
+def on_crawler_event(event_type: str, data) -> None:
+    """수집기 알림 → 카테고리를 DB 키로 바꿔 구독자에게 전달"""
+    if event_type == "articles":
+        for article in data:
+            article["category"] = CATEGORY_MAPPING.get(article.get("category"), article.get("category"))
+    event_hub.publish(event_type, data)
+
+# 검색 색인 (수집기가 세그먼트를 추가하면 검색 시 다시 로드)
+search_index = SearchIndex()
+
+def format_article_row(row: dict) -> dict:
+    """datetime → ISO8601, RSS URL → DB 키 매핑 적용"""
+    row["pub_date"] = row.pop("fetched_at").strftime("%Y-%m-%dT%H:%M:%SZ")
+    # URL → DB 키 변환
+    row["category"] = CATEGORY_MAPPING.get(row["category"], row["category"])
+    return row
+
 # ============================
 # 1. 뉴스 조회 API
 # ============================
 @app.get("/articles", response_model=ArticlesResponse, summary="최신 뉴스 조회", tags=["뉴스 조회"])
-def list_articles(limit: int = 100):
+async def list_articles(
+    request: Request,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    category: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
     """
     최신 뉴스 조회 API
-    - limit: 반환할 뉴스 건수 (기본 100)
+    - limit: 반환할 뉴스 건수 (기본 100, 최대 500)
+    - cursor: 이전 응답의 next_cursor (없으면 첫 페이지)
+    - category: CATEGORY_MAPPING의 DB 키 (예: incidents)
+    - since / until: 수집 시각 범위 (since 이상, until 미만)
+    - 응답에 ETag 포함, If-None-Match가 같으면 304 (본문 없음)
     """
-    try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
+    # 시간대 표기(Z / +09:00)와 관계없이 같은 시각은 같은 캐시 키
+    since, until = to_db_time(since), to_db_time(until)
+    # Accept-Encoding에 따라 gzip / br 압축 (압축본은 별도 ETag로 캐시)
+    key = (read_articles_version(), limit, cursor, category, since, until)
+    cached = articles_cache.get(key)
+    if cached is None:
+        cached = articles_cache.put(key, await _load_articles(limit, cursor, category, since, until))
 
-        cursor.execute(
-            "SELECT id, title, link, category, fetched_at FROM articles "
-            "ORDER BY fetched_at DESC LIMIT %s",
-            (limit,)
-        )
-        rows = cursor.fetchall()
+    headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}   # 매번 재검증, 변경 없으면 304
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"), len(cached[1]))
+    if encoding:
+        variant = articles_cache.get(key + (encoding,))
+        if variant is None:
+            variant = articles_cache.put(key + (encoding,), compress_body(cached[1], encoding))
+        cached = variant
+        headers["Content-Encoding"] = encoding
+    etag, body = cached
 
+    headers["ETag"] = etag
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+async def _load_articles(limit: int, cursor: Optional[str], category: Optional[str],
+                         since: Optional[datetime], until: Optional[datetime]) -> bytes:
+    """DB 조회 후 ArticlesResponse 형식 JSON bytes로 직렬화 (캐시 미스 시에만 실행)"""
+    category_url = None
+    if category:
+        category_url = CATEGORY_URLS.get(category)
+        if category_url is None:
+            raise HTTPException(status_code=400, detail=f"알 수 없는 카테고리: {category}")
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        # limit + 1건 조회 → 다음 페이지 존재 여부 판단
+        rows = await async_db.run_db(fetch_page, limit + 1, category_url, since, until, after)
+        rows, next_cursor = split_page(rows, limit)
     except Exception as e:
         raise RuntimeError(f"DB 조회 실패: {e}")
-    finally:
-        cursor.close()
-        conn.close()
 
-    # ============================
-    # datetime → ISO8601, RSS URL → DB 키 매핑 적용
-    # ============================
-    for row in rows:
-        row["pub_date"] = row.pop("fetched_at").strftime("%Y-%m-%dT%H:%M:%SZ")
-        # URL → DB 키 변환
-        row["category"] = CATEGORY_MAPPING.get(row["category"], row["category"])
+    # DB 행은 타입이 정해져 있으므로 모델 검증 없이 바로 직렬화 (응답 형식은 ArticlesResponse와 동일)
+    return articles_body(rows, next_cursor, CATEGORY_MAPPING)
 
-    return {"articles": rows}
+@app.get("/articles/stream", summary="새 기사 실시간 알림 (SSE)", tags=["뉴스 조회"])
+async def stream_articles(last_event_id: Optional[int] = Header(None)):
+    """
+    Server-Sent Events로 새 기사 알림
+    - event: articles, data: [{title, link, category, published}, ...] (수집기 commit 직후)
+    - 이벤트가 없으면 주기적으로 주석 줄(: ping) 전송
+    - 재연결 시 Last-Event-ID 이후 놓친 이벤트 재전송 (최근 기록 범위 안에서)
+    - 연결된 클라이언트는 /articles 폴링 불필요
+    """
+    return StreamingResponse(
+        event_hub.stream(last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 # ============================
 # 2. 일간 뉴스 요약 메일 발송 API
 # ============================
-@app.get("/send-summary", summary="일간 뉴스 요약 메일 발송", tags=["메일 발송"])
+@app.get("/send-summary", status_code=202, summary="일간 뉴스 요약 메일 발송", tags=["메일 발송"])
 def send_summary():
     """
-    /send-summary 호출 시 send_daily_summary.py 함수를 실행하여
-    어제~오늘 수집 뉴스 헤드라인을 HTML 메일로 발송
+    send_daily_summary.py 발송 작업을 백그라운드 워커에 등록하고 작업 ID를 바로 반환
+    - 같은 날짜 요약이 이미 대기/실행 중이면 새로 보내지 않고 기존 작업 반환 (deduplicated: true)
+    - 진행 상태는 /send-summary/{job_id}로 조회
+    """
+    try:
+        job, created = jobs.submit("send-summary", sds.send_daily_summary,
+                                   key=f"send-summary:{date.today()}")
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+    return {"job_id": job.id, "status": job.status, "deduplicated": not created}
+
+@app.get("/send-summary/{job_id}", summary="메일 발송 작업 상태", tags=["메일 발송"])
+def send_summary_status(job_id: str):
+    """
+    작업 상태: queued / running / succeeded / failed (실패 시 error 포함)
     """
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업 없음: {job_id}")
+    return job.to_dict()
+
+# ============================
+# 3. DB 커넥션 풀 지표 API
+# ============================
+@app.get("/pool-stats", summary="DB 커넥션 풀 지표", tags=["운영"])
+def pool_stats():
+    """
+    공용 커넥션 풀 재사용(hit) / 신규 생성(miss) / 대기 시간 지표
+    - api: API 조회 전용 풀(src/async_db.py) 지표
+    """
+    return {**get_pool().stats(), "api": async_db.get_api_pool().stats()}
+
+# ============================
+# 4. 기사 검색 API
+# ============================
+@app.get("/search", response_model=SearchResponse, summary="기사 검색", tags=["뉴스 조회"])
+async def search_articles(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+):
+    """
+    제목 + 요약 검색 (articles + articles_old 전체)
+    - q: 검색어 (2글자 이상, 글자 2개 단위로 비교)
+    - limit: 반환할 기사 수 (기본 20, 최대 100)
+    """
+    start = time.perf_counter()
+    hits = await asyncio.to_thread(search_index.search, q, limit)
+    if not hits:
+        return {"articles": [], "took_ms": (time.perf_counter() - start) * 1000}
+
+    # 색인 결과 link_hash로 기사 조회 (고유 키 조회, 양쪽 테이블)
+    hashes = [hit.link_hash for hit in hits]
+    placeholders = ", ".join(["%s"] * len(hashes))
+    columns = "id, title, link, category, fetched_at, link_hash"
+    rows = await async_db.fetch_all(
+        f"SELECT {columns} FROM articles WHERE link_hash IN ({placeholders}) "
+        f"UNION ALL SELECT {columns} FROM articles_old WHERE link_hash IN ({placeholders})",
+        hashes + hashes,
+    )
+    by_hash = {}
+    for row in rows:
+        by_hash.setdefault(row.pop("link_hash"), row)   # articles 우선
+    articles = [format_article_row(by_hash[h]) for h in hashes if h in by_hash]
+    return {"articles": articles, "took_ms": (time.perf_counter() - start) * 1000}
+
+# ============================
+# 5. 대량 내보내기 API
+# ============================
+@app.get("/export", summary="기사 대량 내보내기", tags=["뉴스 조회"])
+def export_articles(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    category: Optional[str] = None,
+    gzip: bool = False,
+):
+    """
+    수집 시각 범위의 기사 전체를 파일로 스트리밍 (articles_old → articles 순)
+    - format: ndjson (한 줄에 기사 하나) / csv
+    - since / until: 수집 시각 범위 (since 이상, until 미만)
+    - category: CATEGORY_MAPPING의 DB 키
+    - gzip: true면 .gz 파일로 압축하면서 전송
+    - 서버 측 커서로 조금씩 읽어 보내므로 건수와 관계없이 메모리 사용량 일정
+    - 동시 내보내기는 EXPORT_MAX_STREAMS개까지 (전용 연결 풀), 초과 시 503
+    """
+    category_url = None
+    if category:
+        category_url = CATEGORY_URLS.get(category)
+        if category_url is None:
+            raise HTTPException(status_code=400, detail=f"알 수 없는 카테고리: {category}")
+    since, until = to_db_time(since), to_db_time(until)   # 스트림 시작 전에 변환 (헤더 전송 후 실패 방지)
+
     try:
-        sds.send_daily_summary()
+        conn = get_export_pool().acquire(timeout=0)
+    except PoolTimeout:
+        raise HTTPException(status_code=503, detail="동시 내보내기 한도 초과, 잠시 후 다시 시도",
+                            headers={"Retry-After": "30"})
     except Exception as e:
-        raise RuntimeError(f"메일 발송 실패: {e}")
+        logging.error(f"내보내기 DB 연결 실패: {e}")
+        raise HTTPException(status_code=503, detail="DB 연결 실패")
+
+    filename = export_filename(format, since, until, gzip)
+    body = _export_body(conn, format, since, until, category_url, gzip)
+    weakref.finalize(body, conn.close)   # 스트림 시작 전에 끊긴 경우에도 연결 반환
+    return StreamingResponse(
+        body,
+        media_type="application/gzip" if gzip else FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+def _export_body(conn, fmt, since, until, category_url, compress):
+    """스트림이 끝나거나 클라이언트가 끊으면 연결 반환 (sync 제너레이터 → 스레드 풀에서 순회)"""
+    try:
+        yield from export_stream(conn, fmt, since, until, category_url, compress)
+    finally:
+        conn.close()
 
-    return {"status": "메일 발송 완료"}
+# ============================
+# 6. 기사 수 통계 API
+# ============================
+@app.get("/stats", response_model=StatsResponse, summary="기사 수 통계", tags=["운영"])
+async def article_stats(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    hourly: bool = False,
+):
+    """
+    카테고리별 기사 수 (articles / articles_old)
+    - since / until: 수집 시각 범위 (시간 단위 집계, since 이상 until 미만)
+    - hourly: true면 시간별 건수도 포함
+    - 수집/아카이브 시 갱신되는 article_stats 합산 → 기사 테이블을 스캔하지 않음
+    """
+    return await async_db.run_db(_load_stats, since, until, hourly)
+
+def _load_stats(conn, since, until, hourly):
+    cursor = conn.cursor()
+    try:
+        counts = category_counts(cursor, since, until)
+        hours = hourly_counts(cursor, since, until) if hourly else None
+    finally:
+        cursor.close()
 
+    categories = [
+        {"category": CATEGORY_MAPPING.get(url, url), **count}
+        for url, count in sorted(counts.items(), key=lambda item: -(item[1]["live"] + item[1]["archived"]))
+    ]
+    return {
+        "live": sum(c["live"] for c in categories),
+        "archived": sum(c["archived"] for c in categories),
+        "categories": categories,
+        "hourly": [{"hour": h, "live": live, "archived": archived} for h, live, archived in hours]
+        if hours is not None else None,
+    }
@@ -0,0 +1,269 @@
+# src/archive.py
+"""
+articles → articles_old 아카이브 엔진
+- 서버 측 INSERT ... SELECT + DELETE를 id 범위(청크) 단위로 실행, 청크마다 commit
+- Python으로 행을 가져오지 않음 → 메모리 일정, 잠금 시간 짧음
+- 진행 상황(cutoff, 마지막 id)을 archive_checkpoint 테이블에 기록 → 중단 후 재실행 시 이어서 진행
+- ARTICLES_LAYOUT=partitioned: 기준 시각 이전 파티션을 통째로 교체(EXCHANGE PARTITION)
+  · articles 파티션 → 교체용 테이블 → articles_old 파티션, 이후 articles 파티션 DROP
+  · 행 복사 없이 메타데이터 작업만 수행 → 데이터 양과 무관하게 일정 시간
+  · 파티션 테이블에는 link_hash 고유 키가 없음 → 이미 articles_old에 있는 링크는
+    교체용 테이블 단계에서 기존 행에 내용만 반영하고 제거 (일반 레이아웃의 ON DUPLICATE KEY UPDATE와 동일)
+- 옮긴 기사 수는 article_stats(카테고리/시간별 건수)에 반영 (src/stats.py)
+"""
+
+import logging
+import os
+from datetime import datetime, time, timedelta
+
+from .db import ARTICLES_LAYOUT, get_connection
+from .response_cache import bump_archive_version, bump_articles_version
+from .stats import record_moved
+from .partitions import PARTITION_DAYS_AHEAD, ensure_partitions, list_partitions, split_max_partition
+
+# ===========================================================
+# 1. 설정 / SQL
+# ===========================================================
+ARCHIVE_CHUNK_SIZE = int(os.getenv("ARCHIVE_CHUNK_SIZE", "1000"))  # 청크당 id 범위 크기
+CHECKPOINT_NAME = "articles"
+SWAP_TABLE = "articles_swap"  # 파티션 교체용 (파티션 없는 articles 복제 테이블)
+
+ARCHIVE_COLUMNS = "id, title, link, link_hash, content_hash, published, summary, source, category, author, fetched_at"
+
+CREATE_CHECKPOINT_SQL = """
+    CREATE TABLE IF NOT EXISTS archive_checkpoint (
+        name VARCHAR(64) NOT NULL PRIMARY KEY,
+        status VARCHAR(16) NOT NULL,
+        cutoff DATETIME NOT NULL,
+        last_id BIGINT NOT NULL,
+        max_id BIGINT NOT NULL,
+        archived_upto DATETIME NULL,
+        updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    )
+"""
+
+SELECT_CHECKPOINT_SQL = """
+    SELECT status, cutoff, last_id, max_id FROM archive_checkpoint WHERE name = %s
+"""
+
+SELECT_RANGE_SQL = """
+    SELECT MIN(id), MAX(id) FROM articles WHERE fetched_at <= %s
+"""
+
+START_CHECKPOINT_SQL = """
+    INSERT INTO archive_checkpoint (name, status, cutoff, last_id, max_id)
+    VALUES (%s, 'running', %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        status = 'running', cutoff = VALUES(cutoff), last_id = VALUES(last_id), max_id = VALUES(max_id)
+"""
+
+# 이미 있는 행은 content_hash가 다를 때만 내용 컬럼 갱신 (ODKU는 왼쪽부터 적용 → content_hash는 마지막)
+COPY_CHUNK_SQL = f"""
+    INSERT INTO articles_old ({ARCHIVE_COLUMNS})
+    SELECT {ARCHIVE_COLUMNS} FROM articles
+    WHERE id BETWEEN %s AND %s AND fetched_at <= %s
+    ON DUPLICATE KEY UPDATE
+        title = IF(content_hash <=> VALUES(content_hash), title, VALUES(title)),
+        summary = IF(content_hash <=> VALUES(content_hash), summary, VALUES(summary)),
+        published = IF(content_hash <=> VALUES(content_hash), published, VALUES(published)),
+        author = IF(content_hash <=> VALUES(content_hash), author, VALUES(author)),
+        category = VALUES(category),
+        content_hash = VALUES(content_hash)
+"""
+
+MOVED_CHUNK_WHERE = "WHERE a.id BETWEEN %s AND %s AND a.fetched_at <= %s"
+
+# 파티션 레이아웃: 교체용 테이블 행 중 articles_old에 이미 있는 링크 → 기존 행 갱신 후 교체용 테이블에서 삭제
+MERGE_SWAP_DUPLICATES_SQL = f"""
+    UPDATE articles_old o JOIN {SWAP_TABLE} s ON o.link_hash = s.link_hash
+    SET o.title = s.title, o.summary = s.summary, o.published = s.published, o.author = s.author,
+        o.category = s.category, o.content_hash = s.content_hash
+    WHERE NOT (o.content_hash <=> s.content_hash)
+"""
+
+DELETE_SWAP_DUPLICATES_SQL = f"""
+    DELETE s FROM {SWAP_TABLE} s JOIN articles_old o ON o.link_hash = s.link_hash
+"""
+
+DELETE_CHUNK_SQL = """
+    DELETE FROM articles WHERE id BETWEEN %s AND %s AND fetched_at <= %s
+"""
+
+ADVANCE_CHECKPOINT_SQL = """
+    UPDATE archive_checkpoint SET last_id = %s WHERE name = %s
+"""
+
+FINISH_CHECKPOINT_SQL = """
+    UPDATE archive_checkpoint
+    SET status = 'done',
+        archived_upto = IF(archived_upto IS NULL OR archived_upto < cutoff, cutoff, archived_upto)
+    WHERE name = %s
+"""
+
+# ===========================================================
+# 2. 아카이브 실행
+# ===========================================================
+def _start_or_resume(cursor, conn, days: int):
+    """진행 중인 작업이 있으면 이어서, 없으면 새 작업 시작 → (cutoff, last_id, max_id) 또는 None"""
+    cursor.execute(SELECT_CHECKPOINT_SQL, (CHECKPOINT_NAME,))
+    row = cursor.fetchone()
+    if row and row[0] == "running":
+        _, cutoff, last_id, max_id = row
+        logging.info(f"중단된 아카이브 재개: cutoff={cutoff}, 마지막 id={last_id}, 최대 id={max_id}")
+        return cutoff, last_id, max_id
+
+    cutoff = (datetime.now() - timedelta(days=days)).replace(microsecond=0)
+    cursor.execute(SELECT_RANGE_SQL, (cutoff,))
+    min_id, max_id = cursor.fetchone()
+    if min_id is None:
+        return None
+
+    cursor.execute(START_CHECKPOINT_SQL, (CHECKPOINT_NAME, cutoff, min_id - 1, max_id))
+    conn.commit()
+    bump_archive_version()   # API 경계 캐시 무효화 (이동 전)
+    return cutoff, min_id - 1, max_id
+
+def _archive_chunks(cursor, conn, days: int, chunk_size: int, progress: dict) -> int:
+    """일반 레이아웃: id 범위 청크 단위 INSERT ... SELECT + DELETE (progress["moved"]: commit된 건수)"""
+    job = _start_or_resume(cursor, conn, days)
+    if job is None:
+        logging.info("아카이브 대상 없음")
+        return 0
+
+    moved = 0
+    cutoff, last_id, max_id = job
+    while last_id < max_id:
+        lo, hi = last_id + 1, min(last_id + chunk_size, max_id)
+        record_moved(cursor, "articles", MOVED_CHUNK_WHERE, (lo, hi, cutoff))   # 복사 전에 집계
+        cursor.execute(COPY_CHUNK_SQL, (lo, hi, cutoff))
+        cursor.execute(DELETE_CHUNK_SQL, (lo, hi, cutoff))
+        moved += max(cursor.rowcount, 0)
+        cursor.execute(ADVANCE_CHECKPOINT_SQL, (hi, CHECKPOINT_NAME))
+        conn.commit()
+        progress["moved"] = moved
+        last_id = hi
+
+    cursor.execute(FINISH_CHECKPOINT_SQL, (CHECKPOINT_NAME,))
+    conn.commit()
+    logging.info(f"{moved}건 아카이브 완료 (articles → articles_old)")
+    return moved
+
+def _prepare_swap_table(cursor) -> bool:
+    """교체용 테이블 준비, 이전 실행이 남긴 행이 있으면 True (해당 파티션 이어서 처리)"""
+    cursor.execute(f"SHOW TABLES LIKE '{SWAP_TABLE}'")
+    if cursor.fetchone():
+        cursor.execute(f"SELECT 1 FROM {SWAP_TABLE} LIMIT 1")
+        if cursor.fetchone():
+            return True
+        cursor.execute(f"DROP TABLE {SWAP_TABLE}")  # 비어 있으면 현재 스키마로 다시 생성
+    cursor.execute(f"CREATE TABLE {SWAP_TABLE} LIKE articles")
+    cursor.execute(f"ALTER TABLE {SWAP_TABLE} REMOVE PARTITIONING")
+    return False
+
+def _move_partition(cursor, conn, name: str, upper, pending: bool) -> int:
+    """
+    articles 파티션 1개 → articles_old (pending=True면 교체용 테이블에 이미 행이 있음)
+    - 반환: articles에서 옮긴 행 수 (articles_old에 이미 있던 링크 포함)
+    """
+    upper_dt = datetime.combine(upper, time.min)
+    cursor.execute(START_CHECKPOINT_SQL, (CHECKPOINT_NAME, upper_dt, 0, 0))
+    conn.commit()
+    bump_archive_version()   # API 경계 캐시 무효화 (교체 전)
+
+    # 1) articles 파티션 → 교체용 테이블
+    if not pending:
+        cursor.execute(f"ALTER TABLE articles EXCHANGE PARTITION {name} WITH TABLE {SWAP_TABLE}")
+        record_moved(cursor, SWAP_TABLE)   # 다음 DDL에서 함께 commit
+    cursor.execute(f"SELECT COUNT(*) FROM {SWAP_TABLE}")
+    moved = cursor.fetchone()[0]
+
+    # 1-1) 이미 아카이브된 링크 정리 (재실행해도 결과 동일)
+    cursor.execute(MERGE_SWAP_DUPLICATES_SQL)
+    cursor.execute(DELETE_SWAP_DUPLICATES_SQL)
+    if cursor.rowcount > 0:
+        logging.info(f"articles_old에 이미 있는 링크 {cursor.rowcount}건 병합: {name}")
+
+    # 2) articles_old에 같은 파티션 준비 (마지막 파티션 뒤에만 추가 가능)
+    old_parts = dict(list_partitions(cursor, "articles_old"))
+    if name not in old_parts:
+        uppers = [u for u in old_parts.values() if u is not None]
+        if not uppers or upper > max(uppers):
+            split_max_partition(cursor, "articles_old", [(name, upper)])
+            old_parts[name] = upper
+
+    # 3) 교체용 테이블 → articles_old 파티션 (비어 있는 파티션만 교체, 아니면 행 복사로 대체)
+    swapped = False
+    if name in old_parts:
+        cursor.execute(f"SELECT 1 FROM articles_old PARTITION ({name}) LIMIT 1")
+        if not cursor.fetchone():
+            cursor.execute(f"ALTER TABLE articles_old EXCHANGE PARTITION {name} WITH TABLE {SWAP_TABLE}")
+            swapped = True
+    if not swapped:
+        logging.warning(f"articles_old 파티션 교체 불가, 행 복사로 처리: {name}")
+        cursor.execute(f"INSERT IGNORE INTO articles_old SELECT * FROM {SWAP_TABLE}")
+        cursor.execute(f"TRUNCATE TABLE {SWAP_TABLE}")
+
+    # 4) 빈 articles 파티션 제거 + 메타데이터 갱신
+    cursor.execute(f"ALTER TABLE articles DROP PARTITION {name}")
+    cursor.execute(FINISH_CHECKPOINT_SQL, (CHECKPOINT_NAME,))
+    conn.commit()
+    return moved
+
+def _archive_partitions(cursor, conn, days: int, progress: dict) -> int:
+    """파티션 레이아웃: 기준 시각 이전 파티션 교체, 이동한 기사 수 반환 (progress["moved"]: commit된 건수)"""
+    ensure_partitions(cursor, "articles", datetime.now().date() + timedelta(days=PARTITION_DAYS_AHEAD))
+    ensure_partitions(cursor, "articles_old", datetime.now().date())
+
+    cutoff = datetime.now() - timedelta(days=days)
+    pending = _prepare_swap_table(cursor)
+
+    moved = partitions = 0
+    for name, upper in list_partitions(cursor, "articles"):
+        if upper is None or datetime.combine(upper, time.min) > cutoff:
+            break
+        moved += _move_partition(cursor, conn, name, upper, pending)
+        progress["moved"] = moved
+        pending = False
+        partitions += 1
+
+    if partitions:
+        logging.info(f"{moved}건 아카이브 완료 (articles → articles_old, 파티션 {partitions}개 교체)")
+    else:
+        logging.info("아카이브 대상 없음")
+    return moved
+
+def archive_old_articles(days: int = 1, chunk_size: int = ARCHIVE_CHUNK_SIZE, conn=None,
+                         layout: str = ARTICLES_LAYOUT) -> int:
+    """
+    fetched_at이 days일 이전인 기사를 articles_old로 이동
+    - chunk_size: 한 번에 처리할 id 범위 (청크마다 commit, 일반 레이아웃)
+    - layout="partitioned": 파티션 교체 방식
+    - conn 미전달 시 새 연결 생성 후 종료 시 닫음
+    - commit된 이동이 있을 때만(실패 전 commit된 청크 포함) 기사 버전 갱신 → API 캐시 무효화
+    - 반환: 이동한 기사 수 (실패 시 그 전까지 commit된 건수)
+    """
+    close_conn = conn is None
+    if conn is None:
+        conn = get_connection()
+    if not conn:
+        logging.error("DB 연결 실패. 아카이브 중단.")
+        return 0
+
+    cursor = conn.cursor()
+    progress = {"moved": 0}
+    try:
+        cursor.execute(CREATE_CHECKPOINT_SQL)
+        if layout == "partitioned":
+            _archive_partitions(cursor, conn, days, progress)
+        else:
+            _archive_chunks(cursor, conn, days, chunk_size, progress)
+    except Exception as e:
+        conn.rollback()
+        logging.error(f"아카이브 실패 (다음 실행 시 이어서 진행): {e}")
+    finally:
+        cursor.close()
+        if close_conn:
+            conn.close()
+    if progress["moved"]:
+        bump_articles_version()
+    return progress["moved"]
@@ -0,0 +1,87 @@
+# src/article_query.py
+"""
+기사 목록 조회 쿼리 (API /articles 공용)
+- 정렬: (fetched_at, id) 내림차순 → 키셋(keyset) 페이지네이션
+- 커서: 마지막 행의 (fetched_at, id)를 base64로 감싼 불투명 문자열
+  · OFFSET 없이 "커서보다 작은 행"부터 읽음 → 몇 번째 페이지든 비용 동일
+- 필터: category(RSS URL), since(이상), until(미만)
+- 인덱스: idx_articles_fetched_at / idx_articles_category_fetched_at (보조 인덱스에 id 포함)
+"""
+
+import base64
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+LIST_COLUMNS = "id, title, link, category, fetched_at"
+
+class InvalidCursor(ValueError):
+    """디코딩할 수 없는 커서"""
+
+# ===========================================================
+# 1. 커서 인코딩 / 디코딩
+# ===========================================================
+def encode_cursor(fetched_at: datetime, article_id: int) -> str:
+    raw = f"{fetched_at.isoformat()}|{article_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        fetched_at, article_id = raw.split("|")
+        return datetime.fromisoformat(fetched_at), int(article_id)
+    except Exception as e:
+        raise InvalidCursor(f"잘못된 커서: {cursor}") from e
+
+# ===========================================================
+# 2. 쿼리 생성
+# ===========================================================
+def build_range_query(table: str, columns: str, limit: int, category: Optional[str] = None,
+                      since: Optional[datetime] = None, until: Optional[datetime] = None,
+                      after: Optional[Tuple[datetime, int]] = None,
+                      ascending: bool = False) -> Tuple[str, list]:
+    """
+    수집 시각 범위 조회 SQL + 파라미터 (limit건)
+    - after: 이 (fetched_at, id) 다음 행부터 (정렬 방향 기준, 키셋)
+    """
+    where: List[str] = []
+    params: list = []
+    if category:
+        where.append("category = %s")
+        params.append(category)
+    if since:
+        where.append("fetched_at >= %s")
+        params.append(since)
+    if until:
+        where.append("fetched_at < %s")
+        params.append(until)
+    if after:
+        last_fetched_at, last_id = after
+        op = ">" if ascending else "<"
+        where.append(f"(fetched_at {op} %s OR (fetched_at = %s AND id {op} %s))")
+        params.extend([last_fetched_at, last_fetched_at, last_id])
+
+    direction = "ASC" if ascending else "DESC"
+    sql = f"SELECT {columns} FROM {table}"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += f" ORDER BY fetched_at {direction}, id {direction} LIMIT %s"
+    params.append(limit)
+    return sql, params
+
+def build_list_query(limit: int, category: Optional[str] = None, since: Optional[datetime] = None,
+                     until: Optional[datetime] = None, cursor: Optional[str] = None,
+                     table: str = "articles") -> Tuple[str, list]:
+    """
+    목록 조회 SQL + 파라미터 (최신순)
+    - limit + 1건 조회 → 다음 페이지 존재 여부 판단 (split_page)
+    """
+    after = decode_cursor(cursor) if cursor else None
+    return build_range_query(table, LIST_COLUMNS, limit + 1, category, since, until, after)
+
+def split_page(rows: list, limit: int) -> Tuple[list, Optional[str]]:
+    """limit + 1건 조회 결과 → (현재 페이지 행, 다음 커서 또는 None)"""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last["fetched_at"], last["id"])
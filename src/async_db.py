@@ -0,0 +1,87 @@
+# src/async_db.py
+"""
+API용 비동기 DB 접근 계층
+- 전용 스레드 풀(API_DB_WORKERS개)에서 API 전용 커넥션 풀 연결로 쿼리 실행
+- 워커 수 = 풀 크기 → 워커는 연결을 기다리지 않고, 초과 요청은 이벤트 루프에서 대기
+  · 기본 40: FastAPI(sync def) 스레드 풀과 같은 크기 → 요청마다 연결을 만들던 기존 처리량 이상
+    (공용 풀 DB_POOL_SIZE=5는 수집기 / 백그라운드 작업 기준이라 API 조회에는 작음)
+  · /send-summary 등 백그라운드 작업은 공용 풀, /export 스트리밍은 내보내기 전용 풀 (src/export.py)
+  · DB max_connections는 API_DB_WORKERS + DB_POOL_SIZE + EXPORT_MAX_STREAMS 이상 필요
+- FastAPI 기본 스레드 풀(sync def 엔드포인트용)을 DB 대기로 점유하지 않음
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+# ===========================================================
+# 1. 설정
+# ===========================================================
+API_DB_WORKERS = int(os.getenv("API_DB_WORKERS", "40"))   # DB 전용 워커 수 (= API 전용 풀 크기)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_pool = None
+
+def get_api_pool():
+    """API 조회 전용 커넥션 풀 (첫 호출 시 생성)"""
+    global _pool
+    if _pool is None:
+        from .db import connect
+        from .db_pool import ConnectionPool
+        _pool = ConnectionPool(connect, size=API_DB_WORKERS)
+    return _pool
+
+def get_connection():
+    """API 전용 풀에서 연결 대여 (실패 시 None)"""
+    try:
+        return get_api_pool().acquire()
+    except Exception as e:
+        logging.error(f"API DB 연결 실패: {e}")
+        return None
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=API_DB_WORKERS, thread_name_prefix="api-db")
+    return _executor
+
+def shutdown() -> None:
+    """워커 종료 후 풀 연결 정리"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+    if _pool is not None:
+        _pool.close_all()
+
+# ===========================================================
+# 2. 실행
+# ===========================================================
+def _with_connection(func: Callable, *args):
+    """워커 스레드에서 연결 대여 → func(conn, *args) → 반환"""
+    conn = get_connection()
+    if not conn:
+        raise RuntimeError("DB 연결 실패")
+    try:
+        return func(conn, *args)
+    finally:
+        conn.close()
+
+async def run_db(func: Callable, *args):
+    """func(conn, *args)를 DB 전용 워커에서 실행하고 결과 반환"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), _with_connection, func, *args)
+
+def _fetch_all(conn, sql: str, params) -> list:
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+async def fetch_all(sql: str, params=()) -> list:
+    """SELECT 결과를 dict 리스트로 반환"""
+    return await run_db(_fetch_all, sql, params)
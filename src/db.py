@@ -1,62 +1,154 @@
 """프로그램 실행 진입점, 각 모듈 연계. DB 연결, 테이블 구조, CRUD"""
 # src/db.py
 import os
+import logging
+from typing import Optional
 import mysql.connector
-from mysql.connector import Error
 from dotenv import load_dotenv
+from .hashing import content_hash, link_hash
+from .db_pool import ConnectionPool
+from .stats import record_inserted
 load_dotenv()   # .env 파일 로드
 
+# 크롤러 / API / 일간 요약 / 점검 스크립트 공용 접속 정보 (.env)
+DB_CONFIG = {
+    "host": os.getenv("DB_HOST", "localhost"),     # MariaDB 서버 주소
+    "port": int(os.getenv("DB_PORT", "3306")),
+    "user": os.getenv("DB_USER"),                  # DB 사용자
+    "password": os.getenv("DB_PASSWORD"),          # DB 비밀번호
+    "database": os.getenv("DB_NAME", "boannews"),  # 사용할 DB
+    "charset": "utf8mb4",
+}
+
+DB_BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", "200"))  # 일괄 저장 시 한 번에 보낼 행 수
+ARTICLES_LAYOUT = os.getenv("ARTICLES_LAYOUT", "standard")  # standard / partitioned (fetched_at RANGE 파티션)
+
+INSERT_ARTICLE_SQL = """
+    INSERT IGNORE INTO articles
+    (title, link, link_hash, content_hash, published, summary, source, category, author)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+# 내용이 바뀐 기사만 갱신 (link_hash로 찾음)
+UPDATE_ARTICLE_SQL = """
+    UPDATE articles
+    SET title = %s, summary = %s, published = %s, author = %s, content_hash = %s
+    WHERE link_hash = %s
+"""
+
+SELECT_CONTENT_HASH_SQL = "SELECT link_hash, content_hash FROM articles WHERE link_hash IN ({})"
+
+_pool = None
+
+def connect():
+    """새 MariaDB 연결 (풀 내부에서 사용)"""
+    return mysql.connector.connect(**DB_CONFIG)
+
+def get_pool() -> ConnectionPool:
+    """프로세스 공용 커넥션 풀 (첫 호출 시 생성)"""
+    global _pool
+    if _pool is None:
+        _pool = ConnectionPool(connect)
+    return _pool
+
 def get_connection():
-    """MariaDB 연결 후 connection 반환"""
+    """
+    공용 풀에서 MariaDB connection 대여
+    - 반환된 connection의 close()는 연결을 끊지 않고 풀에 반환
+    - 연결 실패 / 대기 시간 초과 시 None
+    """
     try:
-        conn = mysql.connector.connect(
-            host=os.getenv("DB_HOST"),               # MariaDB 서버 주소
-            #host='잘못된 주소',                     # DB 연결 실패 테스트
-            user=os.getenv("DB_USER"),              # DB 사용자
-            password=os.getenv("DB_PASSWORD"),       # DB 비밀번호
-            database=os.getenv("DB_NAME")            # 사용할 DB
-        )
-        return conn
-    except Error as e:
+        return get_pool().acquire()
+    except Exception as e:
         print("DB 연결 실패:", e)
         return None
 
-def save_article(conn, article):
+def article_fingerprint(article) -> int:
+    """기사 내용 지문 (수집 시 계산한 content_hash 우선, 없으면 계산)"""
+    fingerprint = article.get('content_hash')
+    if fingerprint is None:
+        fingerprint = content_hash(
+            article['title'], article['summary'], article['author'], article['published']
+        )
+    return fingerprint
+
+def _article_row(article) -> tuple:
+    return (
+        article['title'],
+        article['link'],
+        link_hash(article['link']),
+        article_fingerprint(article),
+        article['published'],
+        article['summary'],
+        article['source'],
+        article['category'],
+        article['author']
+    )
+
+def save_articles(conn, articles, batch_size: int = DB_BATCH_SIZE, inserted: Optional[list] = None) -> dict:
+    """
+    기사 여러 건 일괄 저장 (내용 변경 감지)
+    - batch_size 단위로 기존 행의 content_hash 조회 (link_hash IN 1회)
+    - 없는 기사: multi-row INSERT IGNORE / 지문이 다른 기사: 일괄 UPDATE / 같은 기사: 건너뜀
+    - 같은 배치 안에서 링크가 겹치면 첫 기사만 INSERT (나머지는 ignored)
+    - 전체를 하나의 트랜잭션으로 처리, commit 1회
+    - 신규 기사는 같은 트랜잭션에서 article_stats(카테고리/시간별 건수)에 반영
+    - inserted 전달 시 commit 성공한 신규 기사 dict를 추가 (새 기사 알림용)
+    - 반환: {"inserted": 신규, "updated": 수정, "ignored": 변경 없음/중복, "failed": 실패} 건수
+    """
+    result = {"inserted": 0, "updated": 0, "ignored": 0, "failed": 0}
+    if not articles:
+        return result
+
     cursor = conn.cursor()
+    new_articles = []
     try:
-        cursor.execute("""
-            INSERT IGNORE INTO articles
-            (title, link, published, summary, source, category, author)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """, (
-            article['title'],
-            article['link'],
-            article['published'],
-            article['summary'],
-            article['source'],
-            article['category'],
-            article['author']
-        ))
+        for i in range(0, len(articles), batch_size):
+            batch = articles[i:i + batch_size]
+            rows = [_article_row(a) for a in batch]
+            hashes = list({row[2] for row in rows})
+            cursor.execute(SELECT_CONTENT_HASH_SQL.format(", ".join(["%s"] * len(hashes))), hashes)
+            existing = dict(cursor.fetchall())
+
+            new_rows, changed_rows = [], []
+            new_hashes = set()
+            for article, row in zip(batch, rows):
+                if row[2] not in existing:
+                    # 같은 배치 안 중복 링크(여러 피드에 실린 기사)는 1건만 INSERT
+                    # (partitioned 레이아웃은 link 유니크 키가 없어 INSERT IGNORE로 걸러지지 않음)
+                    if row[2] in new_hashes:
+                        continue
+                    new_hashes.add(row[2])
+                    new_rows.append(row)
+                    new_articles.append(article)
+                elif existing[row[2]] != row[3]:
+                    existing[row[2]] = row[3]   # 같은 배치 안 중복 링크는 1회만 갱신
+                    changed_rows.append((row[0], row[5], row[4], row[8], row[3], row[2]))
+
+            if new_rows:
+                cursor.executemany(INSERT_ARTICLE_SQL, new_rows)
+                result["inserted"] += max(cursor.rowcount, 0)
+                record_inserted(cursor, list(new_hashes))
+            if changed_rows:
+                cursor.executemany(UPDATE_ARTICLE_SQL, changed_rows)
+                result["updated"] += len(changed_rows)
         conn.commit()  # 이 줄이 반드시 필요
+        result["ignored"] = len(articles) - result["inserted"] - result["updated"]
+        if inserted is not None:
+            inserted.extend(new_articles)
     except Exception as e:
         conn.rollback()
-        logging.error(f"DB 저장 실패: {e}")
+        logging.error(f"DB 일괄 저장 실패: {e}")
+        result = {"inserted": 0, "updated": 0, "ignored": 0, "failed": len(articles)}
     finally:
         cursor.close()
+    return result
 
-def archive_old_articles(conn, days: int = 1):
-    """articles → articles_old 이관 후 articles 정리"""
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        INSERT INTO articles_old
-        SELECT * FROM articles
-        WHERE fetched_at < NOW() - INTERVAL %s DAY
-    """, (days,))
-
-    cursor.execute("""
-        DELETE FROM articles
-        WHERE fetched_at < NOW() - INTERVAL %s DAY
-    """, (days,))
+def save_article(conn, article) -> bool:
+    """기사 1건 저장 (신규면 INSERT, 내용이 바뀌었으면 UPDATE), 성공 시 True"""
+    return save_articles(conn, [article])["failed"] == 0
 
-    conn.commit()
+def archive_old_articles(conn, days: int = 1) -> int:
+    """articles → articles_old 이관 후 articles 정리 (src/archive.py 엔진 사용)"""
+    from .archive import archive_old_articles as run_archive  # 순환 import 방지
+    return run_archive(days=days, conn=conn)
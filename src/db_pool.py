@@ -0,0 +1,187 @@
+# src/db_pool.py
+"""
+공용 DB 커넥션 풀 (크롤러 / API / 일간 요약 / 점검 스크립트 공용)
+- 최대 DB_POOL_SIZE개까지 연결 생성, 반환된 연결은 재사용 (LIFO)
+- 대여 시 일정 시간 이상 놀던 연결은 ping으로 상태 확인, 끊긴 연결은 새로 생성
+- DB_POOL_RECYCLE초 지난 연결은 반환 시 닫음 (서버 wait_timeout 대비)
+- 모두 사용 중이면 DB_POOL_TIMEOUT초까지 대기 후 PoolTimeout
+- 지표: 재사용(hit) / 신규 생성(miss) / 대기 횟수·시간 / 타임아웃 / 폐기 건수
+- 대여한 연결은 PooledConnection 래퍼 → 기존 코드처럼 close() 호출 시 풀에 반환
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+# ===========================================================
+# 1. 설정
+# ===========================================================
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))                    # 최대 연결 수
+DB_POOL_RECYCLE = float(os.getenv("DB_POOL_RECYCLE", "3600"))         # 연결 재생성 주기(초)
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))           # 대여 대기 한도(초)
+DB_POOL_PING_AFTER = float(os.getenv("DB_POOL_PING_AFTER", "30"))     # 이 시간 이상 놀던 연결만 ping(초)
+
+class PoolTimeout(Exception):
+    """DB_POOL_TIMEOUT 안에 빈 연결을 얻지 못함"""
+
+# ===========================================================
+# 2. 대여 연결 래퍼
+# ===========================================================
+class PooledConnection:
+    """원본 연결 래퍼, close() 시 풀에 반환 (나머지 속성은 원본에 위임)"""
+
+    def __init__(self, pool: "ConnectionPool", conn, created_at: float):
+        self._pool = pool
+        self._conn = conn
+        self._created_at = created_at
+
+    def __getattr__(self, name):
+        if self._conn is None:
+            raise AttributeError(f"반환된 연결 사용: {name}")
+        return getattr(self._conn, name)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._pool.release(conn, self._created_at)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+# ===========================================================
+# 3. 커넥션 풀
+# ===========================================================
+class ConnectionPool:
+    def __init__(self, connect: Callable, size: int = DB_POOL_SIZE, recycle: float = DB_POOL_RECYCLE,
+                 timeout: float = DB_POOL_TIMEOUT, ping_after: float = DB_POOL_PING_AFTER):
+        self.connect = connect
+        self.size = size
+        self.recycle = recycle
+        self.timeout = timeout
+        self.ping_after = ping_after
+        self._idle = []             # [(conn, 생성 시각, 반환 시각)]
+        self._opened = 0            # 생성된 연결 수 (대여 중 + 대기 중)
+        self._cond = threading.Condition()
+        self.metrics = {
+            "hits": 0, "misses": 0, "waits": 0, "wait_time": 0.0, "max_wait": 0.0,
+            "timeouts": 0, "recycled": 0, "broken": 0,
+        }
+
+    # ---------------- 상태 확인 ----------------
+    @staticmethod
+    def _is_alive(conn) -> bool:
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _discard(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    # ---------------- 대여 / 반환 ----------------
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """연결 대여, 대기 한도 초과 시 PoolTimeout"""
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        waited = False
+
+        while True:
+            with self._cond:
+                while not self._idle and self._opened >= self.size:
+                    remaining = timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        self.metrics["timeouts"] += 1
+                        raise PoolTimeout(f"DB 연결 대기 시간 초과 ({timeout}s, 풀 크기 {self.size})")
+                    waited = True
+                    self._cond.wait(remaining)
+
+                if self._idle:
+                    conn, created_at, released_at = self._idle.pop()
+                else:
+                    conn = None
+                    self._opened += 1
+
+            if conn is not None:
+                # 오래 놀던 연결만 ping, 끊겼으면 버리고 다시 대여
+                if time.monotonic() - released_at < self.ping_after or self._is_alive(conn):
+                    self._record(start, waited, hit=True)
+                    return PooledConnection(self, conn, created_at)
+                self._discard(conn)
+                with self._cond:
+                    self.metrics["broken"] += 1
+                    self._opened -= 1
+                    self._cond.notify()
+                continue
+
+            try:
+                conn = self.connect()
+            except Exception:
+                with self._cond:
+                    self._opened -= 1
+                    self._cond.notify()
+                raise
+            self._record(start, waited, hit=False)
+            return PooledConnection(self, conn, time.monotonic())
+
+    def _record(self, start: float, waited: bool, hit: bool) -> None:
+        elapsed = time.monotonic() - start
+        with self._cond:
+            self.metrics["hits" if hit else "misses"] += 1
+            if waited:
+                self.metrics["waits"] += 1
+                self.metrics["wait_time"] += elapsed
+                self.metrics["max_wait"] = max(self.metrics["max_wait"], elapsed)
+
+    def release(self, conn, created_at: float) -> None:
+        """연결 반환 (미완료 트랜잭션 rollback, 재생성 주기 지났으면 닫음)"""
+        keep = time.monotonic() - created_at < self.recycle
+        if keep:
+            try:
+                conn.rollback()
+            except Exception:
+                keep = False
+        if not keep:
+            self._discard(conn)
+
+        with self._cond:
+            if keep:
+                self._idle.append((conn, created_at, time.monotonic()))
+            else:
+                self.metrics["recycled"] += 1
+                self._opened -= 1
+            self._cond.notify()
+
+    def close_all(self) -> None:
+        """대기 중인 연결 모두 닫기 (대여 중인 연결은 반환 시 정리)"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._opened -= len(idle)
+        for conn, _, _ in idle:
+            self._discard(conn)
+
+    def stats(self) -> dict:
+        with self._cond:
+            stats = dict(self.metrics)
+            stats.update(size=self.size, opened=self._opened, idle=len(self._idle))
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / total if total else 0.0
+        stats["avg_wait"] = stats["wait_time"] / stats["waits"] if stats["waits"] else 0.0
+        return stats
+
+    def log_stats(self) -> None:
+        s = self.stats()
+        logging.info(
+            f"DB 풀: 재사용 {s['hits']}회, 신규 {s['misses']}회 (재사용률 {s['hit_rate']:.0%}), "
+            f"대기 {s['waits']}회 평균 {s['avg_wait']:.3f}s 최대 {s['max_wait']:.3f}s, "
+            f"타임아웃 {s['timeouts']}회, 사용 중 {s['opened'] - s['idle']}/{s['size']}"
+        )
@@ -0,0 +1,162 @@
+# src/events.py
+"""
+새 기사 알림 (수집기 → API → 브라우저, Server-Sent Events)
+- 수집기와 API는 별도 프로세스 → 로컬 유닉스 데이터그램 소켓(EVENTS_SOCKET_PATH)으로 전달
+  · 수집기: 저장(commit) 성공한 신규 기사를 소켓으로 전송, API가 없으면 조용히 무시 (수집은 절대 대기하지 않음)
+  · API: 시작 시 소켓을 열고(start_bridge) 받은 이벤트를 EventHub에 게시
+- EventHub: 이벤트를 SSE 프레임으로 1회만 직렬화해 모든 구독자 큐에 전달
+  · 구독자 큐 크기 제한(SSE_CLIENT_BUFFER), 가득 차면 해당 구독 종료 → 클라이언트가 Last-Event-ID로 재연결
+  · 최근 SSE_HISTORY개 이벤트 보관 → 재연결 시 놓친 이벤트 재전송
+  · SSE_HEARTBEAT초 동안 이벤트가 없으면 주석 줄(: ping) 전송 → 프록시 유휴 연결 끊김 방지
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+from collections import deque
+from typing import AsyncIterator, Callable, List, Optional
+
+from .serialize import dumps
+
+# ===========================================================
+# 1. 설정
+# ===========================================================
+EVENTS_SOCKET_PATH = os.getenv("EVENTS_SOCKET_PATH", "data/events.sock")
+EVENTS_CHUNK_SIZE = int(os.getenv("EVENTS_CHUNK_SIZE", "50"))     # 데이터그램 1개당 기사 수
+SSE_CLIENT_BUFFER = int(os.getenv("SSE_CLIENT_BUFFER", "100"))    # 구독자별 대기 이벤트 수
+SSE_HISTORY = int(os.getenv("SSE_HISTORY", "200"))                # 재연결 시 재전송할 최근 이벤트 수
+SSE_HEARTBEAT = float(os.getenv("SSE_HEARTBEAT", "15"))           # 초
+
+ARTICLE_EVENT_FIELDS = ("title", "link", "category", "published")
+
+# ===========================================================
+# 2. 수집기 측: 이벤트 전송
+# ===========================================================
+def _json_default(value):
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+def send_event(event_type: str, data, path: Optional[str] = None) -> bool:
+    """데이터그램 1개 전송 (받는 쪽이 없거나 버퍼가 차 있으면 False)"""
+    message = json.dumps({"type": event_type, "data": data}, ensure_ascii=False, default=_json_default)
+    message = message.encode("utf-8")
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)
+            sock.sendto(message, path or EVENTS_SOCKET_PATH)
+        return True
+    except OSError as e:   # 소켓 없음 / API 미실행 / 수신 버퍼 가득 참
+        logging.debug(f"이벤트 전송 생략: {e}")
+        return False
+
+def publish_articles(articles: List[dict], path: Optional[str] = None) -> int:
+    """신규 기사 알림 (EVENTS_CHUNK_SIZE개씩 나눠 전송), 전송한 기사 수 반환"""
+    sent = 0
+    for i in range(0, len(articles), EVENTS_CHUNK_SIZE):
+        chunk = [{field: a.get(field) for field in ARTICLE_EVENT_FIELDS}
+                 for a in articles[i:i + EVENTS_CHUNK_SIZE]]
+        if send_event("articles", chunk, path):
+            sent += len(chunk)
+    return sent
+
+# ===========================================================
+# 3. API 측: 구독 허브
+# ===========================================================
+class Subscriber:
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.lagged = False
+
+class EventHub:
+    """이벤트 루프 안에서만 사용 (publish / subscribe 모두 같은 루프)"""
+
+    def __init__(self, buffer: int = SSE_CLIENT_BUFFER, history: int = SSE_HISTORY):
+        self.buffer = buffer
+        self._subscribers = set()
+        self._history = deque(maxlen=history)   # (id, frame)
+        self._last_id = 0
+        self.dropped = 0                        # 버퍼 초과로 끊은 구독 수
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event_type: str, data) -> int:
+        self._last_id += 1
+        frame = (f"id: {self._last_id}\nevent: {event_type}\ndata: ".encode("utf-8")
+                 + dumps(data) + b"\n\n")
+        self._history.append((self._last_id, frame))
+        for sub in list(self._subscribers):
+            try:
+                sub.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                sub.lagged = True               # 느린 클라이언트 → 연결 종료, 재연결 시 기록에서 재전송
+                self._subscribers.discard(sub)
+                self.dropped += 1
+        return self._last_id
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Subscriber:
+        sub = Subscriber(self.buffer)
+        if last_event_id is not None and last_event_id <= self._last_id:   # 재시작 전 id면 재전송 안 함
+            for event_id, frame in self._history:
+                if event_id > last_event_id and not sub.queue.full():
+                    sub.queue.put_nowait(frame)
+        self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscriber) -> None:
+        self._subscribers.discard(sub)
+
+    async def stream(self, last_event_id: Optional[int] = None,
+                     heartbeat: float = SSE_HEARTBEAT) -> AsyncIterator[bytes]:
+        """SSE 응답 본문 (클라이언트가 끊으면 제너레이터 종료 시 구독 해제)"""
+        sub = self.subscribe(last_event_id)
+        try:
+            yield f"retry: {int(heartbeat * 1000)}\n\n".encode("ascii")
+            while True:
+                try:
+                    frame = await asyncio.wait_for(sub.queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield b": ping\n\n"
+                    continue
+                yield frame
+                if sub.lagged and sub.queue.empty():
+                    return
+        finally:
+            self.unsubscribe(sub)
+
+# ===========================================================
+# 4. API 측: 소켓 수신
+# ===========================================================
+class _BridgeProtocol(asyncio.DatagramProtocol):
+    def __init__(self, on_event: Callable[[str, object], None]):
+        self.on_event = on_event
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        try:
+            message = json.loads(data)
+            self.on_event(message["type"], message["data"])
+        except Exception as e:
+            logging.warning(f"잘못된 이벤트 수신: {e}")
+
+async def start_bridge(on_event: Callable[[str, object], None], path: Optional[str] = None):
+    """소켓 수신 시작 → transport (종료 시 stop_bridge)"""
+    path = path or EVENTS_SOCKET_PATH
+    dirname = os.path.dirname(path)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    if os.path.exists(path):
+        os.unlink(path)   # 이전 실행이 남긴 소켓 파일
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _BridgeProtocol(on_event), local_addr=path, family=socket.AF_UNIX
+    )
+    logging.info(f"이벤트 소켓 수신 시작: {path}")
+    return transport
+
+def stop_bridge(transport, path: Optional[str] = None) -> None:
+    transport.close()
+    try:
+        os.unlink(path or EVENTS_SOCKET_PATH)
+    except OSError:
+        pass
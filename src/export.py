@@ -0,0 +1,152 @@
+# src/export.py
+"""
+기사 대량 내보내기 (articles_old + articles, NDJSON / CSV)
+- 수집 시각(fetched_at) 범위를 src/timerange.py로 조회 → 범위에 걸리는 테이블만, 수집 시각순 병합
+- 키셋 페이지(EXPORT_FETCH_SIZE건) 단위로 읽음 → 결과 전체를 메모리에 올리지 않음
+- 행을 EXPORT_CHUNK_BYTES 단위로 묶어 스트리밍, gzip은 압축하면서 바로 출력
+- API(/export)와 CLI 공용
+- API는 공용 풀과 분리된 내보내기 전용 풀(EXPORT_MAX_STREAMS개) 사용
+  → 느린 다운로드가 연결을 오래 잡아도 /articles 등 다른 요청의 연결은 줄지 않음
+- 사용법:
+    python -m src.export --since 2025-01-01 --until 2025-02-01 --format csv -o jan.csv
+    python -m src.export --since 2025-01-01 --gzip -o articles.ndjson.gz
+"""
+
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import sys
+import zlib
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+
+from .timerange import iter_range
+
+# ===========================================================
+# 1. 설정
+# ===========================================================
+EXPORT_FETCH_SIZE = int(os.getenv("EXPORT_FETCH_SIZE", "1000"))          # 테이블당 1회 조회 행 수
+EXPORT_CHUNK_BYTES = int(os.getenv("EXPORT_CHUNK_BYTES", str(64 * 1024)))  # 응답 조각 크기
+EXPORT_FIELDS = ["id", "title", "link", "published", "summary", "source", "category", "author", "fetched_at"]
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+EXPORT_MAX_STREAMS = int(os.getenv("EXPORT_MAX_STREAMS", "2"))           # API 동시 내보내기 수 (= 전용 풀 크기)
+
+_pool = None
+
+def get_export_pool():
+    """API 내보내기 전용 커넥션 풀 (첫 호출 시 생성)"""
+    global _pool
+    if _pool is None:
+        from .db import connect
+        from .db_pool import ConnectionPool
+        _pool = ConnectionPool(connect, size=EXPORT_MAX_STREAMS)
+    return _pool
+
+def close_export_pool() -> None:
+    if _pool is not None:
+        _pool.close_all()
+
+# ===========================================================
+# 2. 행 조회
+# ===========================================================
+def iter_rows(conn, since: Optional[datetime] = None, until: Optional[datetime] = None,
+              category: Optional[str] = None, fetch_size: int = EXPORT_FETCH_SIZE) -> Iterator[dict]:
+    """범위 내 기사를 수집 시각순으로 하나씩 반환 (articles + articles_old)"""
+    return iter_range(conn, category, since, until, ascending=True,
+                      columns=", ".join(EXPORT_FIELDS), page_size=fetch_size)
+
+# ===========================================================
+# 3. 직렬화 / 조각 / 압축
+# ===========================================================
+def _value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+def ndjson_lines(rows: Iterable[dict]) -> Iterator[bytes]:
+    for row in rows:
+        record = {field: _value(row.get(field)) for field in EXPORT_FIELDS}
+        yield (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+def csv_lines(rows: Iterable[dict]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        writer.writerow([_value(row.get(field)) for field in EXPORT_FIELDS])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")   # 행이 없으면 헤더만
+
+def chunked(lines: Iterable[bytes], size: int = EXPORT_CHUNK_BYTES) -> Iterator[bytes]:
+    """작은 조각들을 size 바이트 이상으로 묶어서 반환"""
+    parts, length = [], 0
+    for line in lines:
+        parts.append(line)
+        length += len(line)
+        if length >= size:
+            yield b"".join(parts)
+            parts, length = [], 0
+    if parts:
+        yield b"".join(parts)
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """조각 단위로 압축하면서 출력 (gzip 형식)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def export_stream(conn, fmt: str = "ndjson", since: Optional[datetime] = None,
+                  until: Optional[datetime] = None, category: Optional[str] = None,
+                  compress: bool = False) -> Iterator[bytes]:
+    """내보내기 바이트 스트림 (fmt: ndjson / csv)"""
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    encode = ndjson_lines if fmt == "ndjson" else csv_lines
+    stream = chunked(encode(iter_rows(conn, since, until, category)))
+    return gzip_stream(stream) if compress else stream
+
+def export_filename(fmt: str, since: Optional[datetime], until: Optional[datetime], compress: bool) -> str:
+    span = "_".join(d.strftime("%Y%m%d") for d in (since, until) if d) or "all"
+    return f"articles_{span}.{fmt}" + (".gz" if compress else "")
+
+# ===========================================================
+# 4. CLI
+# ===========================================================
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="기사 내보내기 (articles_old + articles)")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="수집 시각 시작 (이상)")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="수집 시각 끝 (미만)")
+    parser.add_argument("--category", help="RSS URL")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="ndjson")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("-o", "--output", help="출력 파일 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    from .db import get_connection
+    conn = get_connection()
+    if not conn:
+        print("[ERROR] DB 연결 실패", file=sys.stderr)
+        return 1
+
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    written = 0
+    try:
+        for chunk in export_stream(conn, args.format, args.since, args.until, args.category, args.gzip):
+            out.write(chunk)
+            written += len(chunk)
+    finally:
+        if args.output:
+            out.close()
+        conn.close()
+    logging.info(f"내보내기 완료: {written} bytes")
+    return 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    sys.exit(main())
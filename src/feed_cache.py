@@ -0,0 +1,79 @@
+# src/feed_cache.py
+"""
+RSS 피드별 상태 저장소 (조건부 GET 캐시)
+- 피드 URL별 ETag / Last-Modified 검증값 보관
+- 피드 URL별 감지된 문자 인코딩 보관 (src/rss.py에서 기록)
+- 다음 요청 시 If-None-Match / If-Modified-Since 헤더 생성
+- 새 검증값은 해당 피드 기사가 파싱/저장(commit)된 뒤에만 반영 → 실패한 피드는 다음 실행에 다시 받음
+- JSON 파일로 영구 저장 (CRON 실행 간 유지)
+"""
+
+import json
+import logging
+import os
+from typing import Dict, Optional
+
+# ===========================================================
+# 1. 저장 경로 설정
+# ===========================================================
+FEED_CACHE_PATH = os.getenv("FEED_CACHE_PATH", "data/feed_cache.json")
+
+# ===========================================================
+# 2. 로드 / 저장
+# ===========================================================
+def load_feed_cache(path: Optional[str] = None) -> Dict[str, dict]:
+    """피드 상태 파일 로드 (없거나 손상 시 빈 dict)"""
+    path = path or FEED_CACHE_PATH
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception as e:
+        logging.warning(f"피드 캐시 로드 실패, 초기화: {path} - {e}")
+        return {}
+
+def save_feed_cache(cache: Dict[str, dict], path: Optional[str] = None) -> None:
+    """피드 상태 파일 저장 (임시 파일 작성 후 교체)"""
+    path = path or FEED_CACHE_PATH
+    try:
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logging.warning(f"피드 캐시 저장 실패: {path} - {e}")
+
+# ===========================================================
+# 3. 조건부 요청 헤더 / 검증값 갱신
+# ===========================================================
+def conditional_headers(cache: Optional[Dict[str, dict]], url: str) -> Dict[str, str]:
+    """저장된 검증값으로 조건부 요청 헤더 생성"""
+    headers = {}
+    state = (cache or {}).get(url) or {}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    return headers
+
+def read_validators(resp_headers) -> Dict[str, str]:
+    """응답 헤더에서 검증값만 복사 (저장 성공 후 update_validators로 반영)"""
+    return {header: resp_headers.get(header) for header in ("ETag", "Last-Modified")
+            if resp_headers.get(header)}
+
+def update_validators(cache: Optional[Dict[str, dict]], url: str, resp_headers) -> None:
+    """200 응답의 ETag / Last-Modified 저장 (없으면 기존 값 제거)"""
+    if cache is None:
+        return
+    state = cache.setdefault(url, {})
+    for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+        value = resp_headers.get(header)
+        if value:
+            state[key] = value
+        else:
+            state.pop(key, None)
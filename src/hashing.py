@@ -0,0 +1,31 @@
+# src/hashing.py
+"""
+기사 식별용 해시 함수
+- link_hash: 링크 URL → 64비트 부호 없는 정수 (중복 확인용 고정 길이 키)
+- content_hash: 제목/요약/작성자/발행일 → 64비트 지문 (내용 수정 여부 확인용)
+- seen_key: link_hash + content_hash → 64비트 키 (수집기 로컬 인덱스용)
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+FIELD_SEPARATOR = "\x1f"   # 필드 경계 구분 (값에 거의 나오지 않는 문자)
+
+def _hash64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+def link_hash(link: str) -> int:
+    """링크 URL의 64비트 해시 (blake2b, 앞뒤 공백 제거 후 계산)"""
+    return _hash64(link.strip().encode("utf-8"))
+
+def content_hash(title: Optional[str], summary: Optional[str], author: Optional[str],
+                 published: Optional[datetime]) -> int:
+    """기사 내용 지문 (None은 빈 문자열, 발행일은 초 단위 문자열로 계산)"""
+    published_text = published.strftime("%Y-%m-%d %H:%M:%S") if published else ""
+    text = FIELD_SEPARATOR.join([title or "", summary or "", author or "", published_text])
+    return _hash64(text.encode("utf-8"))
+
+def seen_key(link_h: int, content_h: int) -> int:
+    """링크 + 내용 지문 조합 키 (내용이 바뀌면 다른 키)"""
+    return _hash64(link_h.to_bytes(8, "big") + content_h.to_bytes(8, "big"))
@@ -0,0 +1,132 @@
+# src/jobs.py
+"""
+API 백그라운드 작업 (메일 발송 등 오래 걸리는 작업)
+- submit() → 작업 ID 즉시 반환, 실제 실행은 전용 워커 스레드(JOB_WORKERS개)
+- 중복 제거: 같은 key의 작업이 대기/실행 중이면 새로 만들지 않고 기존 작업 반환
+- 대기열 상한(JOB_QUEUE_SIZE): 대기+실행 중 작업이 가득 차면 JobQueueFull
+- 완료된 작업은 최근 JOB_HISTORY개까지 상태 조회 가능 (메모리, 프로세스 재시작 시 초기화)
+"""
+
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+# ===========================================================
+# 1. 설정
+# ===========================================================
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))           # 동시 실행 작업 수
+JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "8"))     # 대기 + 실행 중 작업 상한
+JOB_HISTORY = int(os.getenv("JOB_HISTORY", "100"))         # 보관할 작업 수
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+
+class JobQueueFull(Exception):
+    pass
+
+# ===========================================================
+# 2. 작업
+# ===========================================================
+class Job:
+    def __init__(self, name: str, key: str):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.key = key
+        self.status = QUEUED
+        self.error: Optional[str] = None
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+# ===========================================================
+# 3. 작업 관리자
+# ===========================================================
+class JobManager:
+    def __init__(self, workers: int = JOB_WORKERS, queue_size: int = JOB_QUEUE_SIZE,
+                 history: int = JOB_HISTORY):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.history = history
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active: Dict[str, Job] = {}        # key → 대기/실행 중 작업
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, name: str, func: Callable[[], object], key: Optional[str] = None):
+        """
+        작업 등록 → (Job, 새로 만들었는지)
+        - 같은 key가 대기/실행 중이면 기존 작업 반환 (False)
+        """
+        key = key or name
+        with self._lock:
+            existing = self._active.get(key)
+            if existing is not None:
+                return existing, False
+            if len(self._active) >= self.queue_size:
+                raise JobQueueFull(f"대기 중인 작업이 너무 많습니다 ({self.queue_size})")
+
+            job = Job(name, key)
+            self._jobs[job.id] = job
+            self._active[key] = job
+            self._trim()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+            self._executor.submit(self._run, job, func)
+        logging.info(f"작업 등록: {name} ({job.id})")
+        return job, True
+
+    def _run(self, job: Job, func: Callable[[], object]) -> None:
+        job.status = RUNNING
+        job.started_at = datetime.now()
+        status, error = SUCCEEDED, None
+        try:
+            func()
+        except Exception as e:
+            status, error = FAILED, str(e)
+            logging.error(f"작업 실패: {job.name} ({job.id}) - {e}")
+        with self._lock:
+            job.error = error
+            job.finished_at = datetime.now()
+            job.status = status
+            if self._active.get(job.key) is job:
+                del self._active[job.key]
+            self._trim()
+        logging.info(f"작업 종료: {job.name} ({job.id}) {job.status}")
+
+    def _trim(self) -> None:
+        """오래된 완료 작업부터 기록 삭제 (대기/실행 중 작업은 유지)"""
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.history:
+                break
+            if not self._jobs[job_id].active:
+                del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        """대기 중 작업은 취소, 실행 중 작업은 끝날 때까지 대기"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
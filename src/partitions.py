@@ -0,0 +1,85 @@
+# src/partitions.py
+"""
+fetched_at 기준 RANGE 파티션 관리 (ARTICLES_LAYOUT=partitioned 전용)
+- 파티션 단위: 일(day) / 월(month)
+- 파티션 이름: p + 시작일 (예: p20250101, p202501), 마지막은 p_max (MAXVALUE)
+- p_max를 분할(REORGANIZE)해서 미래 파티션 미리 생성 → p_max는 항상 비어 있어 메타데이터 작업으로 끝남
+"""
+
+import os
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+# ===========================================================
+# 1. 설정
+# ===========================================================
+ARTICLES_PARTITION_UNIT = os.getenv("ARTICLES_PARTITION_UNIT", "day")   # day / month
+PARTITION_DAYS_AHEAD = int(os.getenv("PARTITION_DAYS_AHEAD", "7"))       # 미리 만들어 둘 기간(일)
+MAX_PARTITION = "p_max"
+
+# ===========================================================
+# 2. 파티션 경계 계산
+# ===========================================================
+def floor_bound(d: date, unit: str = ARTICLES_PARTITION_UNIT) -> date:
+    return d.replace(day=1) if unit == "month" else d
+
+def next_bound(d: date, unit: str = ARTICLES_PARTITION_UNIT) -> date:
+    if unit == "month":
+        return (d.replace(day=1) + timedelta(days=32)).replace(day=1)
+    return d + timedelta(days=1)
+
+def partition_name(start: date, unit: str = ARTICLES_PARTITION_UNIT) -> str:
+    return start.strftime("p%Y%m" if unit == "month" else "p%Y%m%d")
+
+def partition_bounds(start: date, end: date, unit: str = ARTICLES_PARTITION_UNIT) -> List[Tuple[str, date]]:
+    """start ~ end(포함)을 덮는 파티션 목록 [(이름, 상한(미포함))]"""
+    bounds = []
+    current = floor_bound(start, unit)
+    while current <= end:
+        upper = next_bound(current, unit)
+        bounds.append((partition_name(current, unit), upper))
+        current = upper
+    return bounds
+
+def partition_clause(bounds: List[Tuple[str, date]]) -> str:
+    """CREATE/ALTER TABLE용 PARTITION BY 절"""
+    parts = [f"PARTITION {name} VALUES LESS THAN ('{upper.isoformat()}')" for name, upper in bounds]
+    parts.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    return "PARTITION BY RANGE COLUMNS(fetched_at) (\n    " + ",\n    ".join(parts) + "\n)"
+
+# ===========================================================
+# 3. 파티션 조회 / 추가
+# ===========================================================
+def _parse_bound(description: Optional[str]) -> Optional[date]:
+    if not description or description.upper() == "MAXVALUE":
+        return None
+    return datetime.fromisoformat(description.strip("'").split(" ")[0]).date()
+
+def list_partitions(cursor, table: str) -> List[Tuple[str, Optional[date]]]:
+    """[(파티션 이름, 상한)] 순서대로, p_max 상한은 None, 파티션 없는 테이블은 빈 리스트"""
+    cursor.execute(
+        "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL "
+        "ORDER BY PARTITION_ORDINAL_POSITION",
+        (table,),
+    )
+    return [(name, _parse_bound(desc)) for name, desc in cursor.fetchall()]
+
+def split_max_partition(cursor, table: str, bounds: List[Tuple[str, date]]) -> None:
+    """p_max를 새 파티션들 + p_max로 분할 (p_max가 비어 있으면 메타데이터 작업)"""
+    if not bounds:
+        return
+    parts = [f"PARTITION {name} VALUES LESS THAN ('{upper.isoformat()}')" for name, upper in bounds]
+    parts.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    cursor.execute(
+        f"ALTER TABLE {table} REORGANIZE PARTITION {MAX_PARTITION} INTO ({', '.join(parts)})"
+    )
+
+def ensure_partitions(cursor, table: str, until: date, unit: str = ARTICLES_PARTITION_UNIT) -> int:
+    """until 날짜까지 파티션이 있도록 추가, 추가한 개수 반환"""
+    existing = list_partitions(cursor, table)
+    uppers = [upper for _, upper in existing if upper is not None]
+    start = max(uppers) if uppers else floor_bound(date.today(), unit)
+    new_bounds = partition_bounds(start, until, unit)
+    split_max_partition(cursor, table, new_bounds)
+    return len(new_bounds)
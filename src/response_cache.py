@@ -0,0 +1,148 @@
+# src/response_cache.py
+"""
+API 응답 캐시 + 기사 데이터 버전
+- 데이터 버전: 수집기(articles 변경 시) → 버전 파일 갱신, API → 파일 변경 시각으로 현재 버전 확인
+  · 수집기와 API는 별도 프로세스 → 파일 하나로 캐시 무효화 신호 전달
+  · 아카이브 시작 신호: 버전 파일 옆 .archive 파일 → API의 아카이브 경계 캐시(src/timerange.py) 무효화
+- ResponseCache: (버전, 쿼리 파라미터) 키 → 직렬화된 응답 본문 + ETag (TTL + LRU)
+  · 버전이 바뀌면 이전 키는 더 이상 조회되지 않고 LRU로 밀려남
+- ETag: 응답 본문 해시 (strong) → If-None-Match 일치 시 304
+- 압축: Accept-Encoding 협상 (br: Brotli 패키지(requirements.txt), 미설치 시 gzip만), 압축본도 캐시 → 요청마다 다시 압축하지 않음
+"""
+
+import hashlib
+import logging
+import os
+import time
+import zlib
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # requirements.txt에 포함, 없으면 gzip만 사용
+    brotli = None
+
+# ===========================================================
+# 1. 설정
+# ===========================================================
+ARTICLES_VERSION_PATH = os.getenv("ARTICLES_VERSION_PATH", "data/articles_version")
+API_CACHE_TTL = float(os.getenv("API_CACHE_TTL", "60"))       # 초, 버전 신호를 놓쳐도 이 시간 뒤 재조회
+API_CACHE_SIZE = int(os.getenv("API_CACHE_SIZE", "256"))      # 최대 캐시 항목 수
+API_COMPRESS_MIN = int(os.getenv("API_COMPRESS_MIN", "1024"))  # 이보다 작은 본문은 압축 안 함 (bytes)
+
+# ===========================================================
+# 2. 기사 데이터 버전
+# ===========================================================
+def bump_articles_version(path: Optional[str] = None) -> None:
+    """articles 변경 알림 (수집기 / 아카이브에서 호출)"""
+    path = path or ARTICLES_VERSION_PATH
+    try:
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(str(time.time_ns()))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logging.warning(f"기사 버전 파일 갱신 실패: {path} - {e}")
+
+def read_articles_version(path: Optional[str] = None) -> str:
+    """현재 기사 데이터 버전 (파일 없으면 "0")"""
+    path = path or ARTICLES_VERSION_PATH
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "0"
+    return f"{stat.st_mtime_ns}-{stat.st_ino}"
+
+def bump_archive_version() -> None:
+    """새 아카이브 시작 알림 (cutoff 기록 commit 직후, 행 이동 전에 호출)"""
+    bump_articles_version(ARTICLES_VERSION_PATH + ".archive")
+
+def read_archive_version() -> str:
+    return read_articles_version(ARTICLES_VERSION_PATH + ".archive")
+
+# ===========================================================
+# 3. 응답 캐시
+# ===========================================================
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(여러 값 / * 가능)와 ETag 비교"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+class ResponseCache:
+    """TTL + LRU 캐시, 값은 (ETag, 본문 bytes)"""
+
+    def __init__(self, maxsize: int = API_CACHE_SIZE, ttl: float = API_CACHE_TTL,
+                 clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._items: "OrderedDict[Hashable, Tuple[float, str, bytes]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[str, bytes]]:
+        item = self._items.get(key)
+        if item is None or self.clock() - item[0] > self.ttl:
+            if item is not None:
+                del self._items[key]
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[1], item[2]
+
+    def put(self, key: Hashable, body: bytes) -> Tuple[str, bytes]:
+        etag = make_etag(body)
+        self._items[key] = (self.clock(), etag, body)
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+        return etag, body
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+# ===========================================================
+# 4. 압축 (Accept-Encoding 협상)
+# ===========================================================
+def negotiate_encoding(accept_encoding: Optional[str], size: int) -> Optional[str]:
+    """사용할 Content-Encoding ("br" / "gzip") 또는 None (압축 안 함)"""
+    if not accept_encoding or size < API_COMPRESS_MIN:
+        return None
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+
+    def allowed(name):
+        return accepted.get(name, accepted.get("*", 0.0)) > 0
+
+    if brotli is not None and allowed("br"):
+        return "br"
+    if allowed("gzip"):
+        return "gzip"
+    return None
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)   # gzip 형식, 헤더 시각 0 → 같은 입력이면 같은 출력
+    return compressor.compress(body) + compressor.flush()
@@ -2,20 +2,42 @@
 """
 BoanNews RSS 수집 + DB 저장 + 아카이브
 - 발행일 안전 처리 포함
-- articles_old로 아카이브 자동 이동
-- 중복 링크 발생 시 업데이트 처리
+- articles_old로 아카이브 자동 이동 (청크 단위, 중단 시 재개)
+- 중복 링크 발생 시 업데이트 처리 (내용 지문 content_hash가 다를 때만 UPDATE)
 - CRON용 실행 함수 포함
+- 조건부 GET(ETag / Last-Modified)으로 변경 없는 피드 건너뜀
+- 디코딩/파싱 작업을 스레드/프로세스 풀로 분리 가능 (RSS_PARSE_EXECUTOR)
+- 피드별 인코딩을 캐시에 기억, 디코딩 실패 시에만 charset 감지
+- 파서 백엔드 선택 가능 (RSS_PARSER_BACKEND: fast / feedparser), fast 실패 시 feedparser 대체
+- 이미 저장된 기사(링크 + 내용 지문)는 로컬 인덱스(seen_index)로 확인해 DB 저장 생략
+- DB 저장은 백그라운드 writer(ArticleWriter)가 담당 → 수집과 저장이 겹쳐서 진행
+- 저장된 기사는 검색 색인(search_index)에 추가, 수집 종료 시 새 세그먼트로 기록
+- 새로 저장된 기사는 commit 직후 API로 알림 (로컬 소켓, API가 SSE로 전달, src/events.py)
 """
 
 import asyncio
 import aiohttp
 import feedparser
 from bs4 import BeautifulSoup
+from charset_normalizer import from_bytes
 import logging
-from typing import List
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional
 import warnings
-from datetime import datetime, timedelta
-from .db import get_connection, save_article
+from datetime import datetime
+from xml.parsers.expat import ExpatError
+from .db import get_connection, get_pool, save_articles
+from .feed_cache import load_feed_cache, save_feed_cache, conditional_headers, read_validators, update_validators
+from .scheduler import CrawlScheduler, create_session
+from .rss_fastparse import FastParseError, parse_rss2
+from .seen_index import SeenIndex, load_seen_index
+from .hashing import content_hash, link_hash
+from .writer import ArticleWriter
+from .archive import ARCHIVE_CHUNK_SIZE, archive_old_articles as run_archive
+from .response_cache import bump_articles_version
+from .search_index import SearchIndex
+from .events import publish_articles
 
 # ===========================================================
 # 0. 경고 무시 설정
@@ -49,6 +71,19 @@ RSS_FALLBACK = [
     "http://www.boannews.com/media/news_rss.xml?skind=7"
 ]
 
+# 파싱 실행 모드: ""(이벤트 루프 내 실행) / "thread" / "process"
+RSS_PARSE_EXECUTOR = os.getenv("RSS_PARSE_EXECUTOR", "").lower()
+RSS_PARSE_WORKERS = int(os.getenv("RSS_PARSE_WORKERS", str(os.cpu_count() or 2)))
+
+# 파서 백엔드: "fast"(expat 스트리밍, 오류 시 feedparser 대체) / "feedparser"
+RSS_PARSER_BACKEND = os.getenv("RSS_PARSER_BACKEND", "fast").lower()
+
+# 인코딩 캐시가 없을 때 먼저 시도할 인코딩 (보안뉴스 RSS 기본값)
+DEFAULT_FEED_ENCODING = "euc-kr"
+
+# 워커 → 이벤트 루프로 돌려보낼 entry 필드 (fetch_single_rss에서 사용하는 값만)
+ENTRY_FIELDS = ("title", "link", "summary", "author", "published_parsed", "updated_parsed")
+
 # ===========================================================
 # 2. 로깅 설정
 # ===========================================================
@@ -64,7 +99,8 @@ def safe_get_entry_value(entry, attr: str):
     """RSS entry 속성 안전 접근"""
     return getattr(entry, attr, None)
 
-def parse_published(entry) -> datetime:
+def entry_date(entry) -> Optional[datetime]:
+    """피드에 있는 발행일(없으면 수정일), 둘 다 없거나 파싱 실패 시 None"""
     try:
         if hasattr(entry, 'published_parsed') and entry.published_parsed:
             return datetime(*entry.published_parsed[:6])
@@ -72,7 +108,10 @@ def parse_published(entry) -> datetime:
             return datetime(*entry.updated_parsed[:6])
     except Exception as e:
         logging.warning(f"발행일 파싱 실패: {getattr(entry, 'link', '')} - {e}")
-    return datetime.now()
+    return None
+
+def parse_published(entry) -> datetime:
+    return entry_date(entry) or datetime.now()
 
 # ===========================================================
 # 4. RSS 인덱스 탐색
@@ -84,7 +123,7 @@ async def discover_all_rss(session: aiohttp.ClientSession) -> List[str]:
 
     for page in RSS_INDEX_PAGES:
         try:
-            async with session.get(page, headers=headers, timeout=10) as resp:
+            async with session.get(page, headers=headers) as resp:
                 text_bytes = await resp.read()
                 soup = BeautifulSoup(text_bytes, "html.parser")
                 for tag in soup.select("a[href], link[href], input[value]"):
@@ -106,36 +145,133 @@ async def discover_all_rss(session: aiohttp.ClientSession) -> List[str]:
 # ===========================================================
 # 5. RSS 파싱
 # ===========================================================
-async def parse_rss(session: aiohttp.ClientSession, rss_url: str) -> feedparser.FeedParserDict:
-    """RSS 요청 후 feedparser로 파싱 (EUC-KR 강제 디코딩 적용)"""
+def create_parse_executor(mode: str = RSS_PARSE_EXECUTOR, workers: int = RSS_PARSE_WORKERS) -> Optional[Executor]:
+    """파싱용 실행기 생성 (mode가 비어 있으면 None → 이벤트 루프 내 실행)"""
+    if mode == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    if mode == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss-parse")
+    if mode:
+        logging.warning(f"알 수 없는 RSS_PARSE_EXECUTOR 값: {mode}, 이벤트 루프 내 파싱 사용")
+    return None
+
+def decode_feed(content: bytes, encoding: Optional[str] = None) -> tuple:
+    """
+    피드 bytes 디코딩 → (text, 사용한 인코딩)
+    - 캐시된 인코딩(없으면 EUC-KR)으로 먼저 디코딩
+    - 대체 문자가 생기는 경우(디코딩 오류)에만 charset_normalizer로 전체 감지
+    """
+    encoding = encoding or DEFAULT_FEED_ENCODING
+    try:
+        return content.decode(encoding), encoding
+    except (UnicodeDecodeError, LookupError):
+        pass
+
+    best = from_bytes(content).best()
+    if best is not None:
+        return str(best), best.encoding
+
+    logging.warning(f"인코딩 감지 실패, {encoding} 대체 디코딩 사용")
+    try:
+        return content.decode(encoding, errors='replace'), encoding
+    except LookupError:
+        return content.decode('utf-8', errors='replace'), 'utf-8'
+
+def parse_with_feedparser(text: str) -> dict:
+    """feedparser 백엔드: 모든 형식 지원, 필요한 entry 필드만 추려서 반환"""
+    # feedparser는 문자열 입력 가능
+    feed = feedparser.parse(text)
+    return {
+        "bozo": bool(feed.bozo),
+        "bozo_exception": str(feed.get("bozo_exception", "")),
+        "entries": [{k: e.get(k) for k in ENTRY_FIELDS} for e in feed.get("entries", [])],
+    }
+
+def parse_with_fast(text: str) -> dict:
+    """fast 백엔드: RSS 2.0 전용 expat 파서, 처리 불가 시 feedparser로 대체"""
+    try:
+        entries = parse_rss2(text)
+    except (ExpatError, FastParseError) as e:
+        logging.info(f"고속 파서 처리 불가, feedparser로 대체: {e}")
+        return parse_with_feedparser(text)
+    return {"bozo": False, "bozo_exception": "", "entries": entries}
+
+PARSER_BACKENDS = {
+    "fast": parse_with_fast,
+    "feedparser": parse_with_feedparser,
+}
+
+def decode_and_parse(content: bytes, encoding: Optional[str] = None, backend: str = None) -> dict:
+    """
+    응답 bytes 디코딩 + 파싱 (워커에서 실행 가능하도록 모듈 함수로 분리)
+    - encoding: 피드 캐시에 저장된 인코딩 (없으면 EUC-KR부터 시도)
+    - backend: PARSER_BACKENDS 키 (없으면 RSS_PARSER_BACKEND)
+    - 반환값은 피클 가능한 dict (필요한 entry 필드 + 사용한 인코딩)
+    """
+    text, used_encoding = decode_feed(content, encoding)
+    parse = PARSER_BACKENDS.get(backend or RSS_PARSER_BACKEND, parse_with_feedparser)
+    parsed = parse(text)
+    parsed["encoding"] = used_encoding
+    return parsed
+
+async def parse_rss(session: aiohttp.ClientSession, rss_url: str, cache: dict = None,
+                    executor: Optional[Executor] = None) -> feedparser.FeedParserDict:
+    """
+    RSS 요청 후 feedparser로 파싱
+    - cache 전달 시 조건부 GET 수행, 304 응답이면 디코딩/파싱 없이 빈 entries 반환
+    - 200 응답의 새 검증값은 cache에 바로 넣지 않고 validators로 반환 (저장 성공 후 반영)
+    - cache에 저장된 피드 인코딩 재사용, 새로 감지되면 cache 갱신
+    - executor 전달 시 디코딩/파싱을 워커에서 실행 (이벤트 루프 블로킹 방지)
+    """
     headers = {"User-Agent": "Mozilla/5.0"}
+    headers.update(conditional_headers(cache, rss_url))
     try:
-        async with session.get(rss_url, headers=headers, timeout=10) as resp:
+        async with session.get(rss_url, headers=headers) as resp:
+            if resp.status == 304:
+                logging.info(f"RSS 변경 없음 (304): {rss_url}")
+                return feedparser.FeedParserDict(entries=[], status=304)
+
             content = await resp.read()  # bytes 그대로 읽기
+            validators = read_validators(resp.headers) if resp.status == 200 else None
 
-            # EUC-KR 강제 디코딩
-            try:
-                text = content.decode('euc-kr', errors='replace')
-            except Exception:
-                text = content.decode('utf-8', errors='ignore')
+        encoding = ((cache or {}).get(rss_url) or {}).get("encoding")
+        if executor is None:
+            parsed = decode_and_parse(content, encoding)
+        else:
+            loop = asyncio.get_running_loop()
+            parsed = await loop.run_in_executor(executor, decode_and_parse, content, encoding)
 
-            # feedparser는 문자열 입력 가능
-            feed = feedparser.parse(text)
+        if cache is not None and parsed["encoding"] != encoding:
+            logging.info(f"RSS 인코딩 저장: {rss_url} - {parsed['encoding']}")
+            cache.setdefault(rss_url, {})["encoding"] = parsed["encoding"]
 
-            if feed.bozo:
-                logging.warning(f"RSS 파싱 경고: {rss_url} - {feed.bozo_exception}")
-            if not hasattr(feed, 'entries'):
-                feed.entries = []
+        if parsed["bozo"]:
+            logging.warning(f"RSS 파싱 경고: {rss_url} - {parsed['bozo_exception']}")
 
-            return feed
+        return feedparser.FeedParserDict(
+            entries=[feedparser.FeedParserDict(e) for e in parsed["entries"]],
+            validators=validators,
+        )
     except Exception as e:
         logging.exception(f"RSS 요청/파싱 실패: {rss_url} - {e}")
         return feedparser.FeedParserDict(entries=[])
 # ===========================================================
 # 6. 단일 RSS 수집
 # ===========================================================
-async def fetch_single_rss(session: aiohttp.ClientSession, rss_url: str, conn=None) -> List[dict]:
-    feed = await parse_rss(session, rss_url)
+async def fetch_single_rss(session: aiohttp.ClientSession, rss_url: str, conn=None, cache: dict = None,
+                           executor: Optional[Executor] = None, seen: Optional[SeenIndex] = None,
+                           writer: Optional[ArticleWriter] = None,
+                           pending: Optional[dict] = None) -> List[dict]:
+    """
+    단일 RSS 수집 + 저장
+    - writer 전달 시 writer 큐에 넣고 반환 (저장은 백그라운드에서 일괄 처리)
+    - writer 없이 conn만 전달 시 피드 단위로 save_articles 일괄 저장 (commit 1회)
+    - 기사마다 content_hash(제목/요약/작성자/피드 발행일) 계산 → 저장 시 변경 여부 판단
+    - seen 전달 시 링크 + 내용이 같은 기사는 건너뛰고, 저장 성공한 기사만 seen에 추가
+    - 새 검증값(ETag / Last-Modified): writer 없으면 저장 성공 시 cache에 바로 반영,
+      writer 사용 시 pending[rss_url]에 보관 → 호출 측이 배치 commit 확인 후 반영
+    """
+    feed = await parse_rss(session, rss_url, cache, executor)
     entries_list = []
 
     for entry in getattr(feed, 'entries', []):
@@ -143,29 +279,69 @@ async def fetch_single_rss(session: aiohttp.ClientSession, rss_url: str, conn=No
         if not link:
             continue
 
-        published = parse_published(entry)
+        feed_date = entry_date(entry)
+        title = safe_get_entry_value(entry, 'title')
+        summary = safe_get_entry_value(entry, 'summary')
+        author = safe_get_entry_value(entry, 'author')
 
         article = {
-            'title': safe_get_entry_value(entry, 'title'),
+            'title': title,
             'link': link,
-            'published': published,
-            'summary': safe_get_entry_value(entry, 'summary'),
+            'published': feed_date or datetime.now(),
+            'summary': summary,
             'source': 'boannews',
             'category': rss_url,
-            'author': safe_get_entry_value(entry, 'author')
+            'author': author,
+            # 발행일이 없는 피드는 수집 시각 대신 None으로 계산 (매번 변경으로 잡히지 않도록)
+            'content_hash': content_hash(title, summary, author, feed_date)
         }
-
-        if conn:
-            save_article(conn, article)
+        if seen is not None and article in seen:
+            continue
 
         entries_list.append(article)
 
+    validators = feed.get("validators")
+    if writer is not None:
+        await writer.put_many(entries_list)
+        if validators and pending is not None:
+            pending[rss_url] = validators
+        return entries_list
+
+    failed = False
+    if conn and entries_list:
+        inserted = []
+        result = save_articles(conn, entries_list, inserted=inserted)
+        if inserted:
+            publish_articles(inserted)
+        logging.info(
+            f"RSS 저장: {rss_url} - 신규 {result['inserted']}건, 수정 {result['updated']}건, "
+            f"변경 없음 {result['ignored']}건"
+        )
+        failed = bool(result["failed"])
+        if seen is not None and not failed:
+            seen.add_many(entries_list)
+    if validators and not failed:
+        update_validators(cache, rss_url, validators)
+
     return entries_list
 
 # ===========================================================
 # 7. 전체 RSS 수집
 # ===========================================================
-async def fetch_all_entries(conn=None) -> List[dict]:
+async def fetch_all_entries(conn=None, use_cache: bool = True) -> List[dict]:
+    """
+    전체 RSS 수집 + DB 저장
+    - use_cache=True: 피드별 검증값 파일을 읽어 조건부 GET, 수집 후 갱신 저장
+      · 새 검증값은 그 피드 기사가 모두 commit된 경우에만 반영 (저장 실패 배치가 있던 피드는 기존 값 유지)
+    - CrawlScheduler로 전체/호스트별 동시 요청 수 제한 (타임아웃은 세션 설정 사용)
+    - RSS_PARSE_EXECUTOR 설정 시 파싱은 워커 풀에서 실행, 피드별로 완료되는 대로 저장
+    - use_cache=True: 저장된 기사 인덱스로 신규/수정 기사만 저장 (반환값도 신규/수정 기사만)
+    - 피드 간 중복 제거는 link_hash(64비트) 집합으로 처리
+    - 저장은 ArticleWriter가 크기/시간 단위로 묶어서 처리, 종료 전 모두 flush
+    - 신규/수정 기사가 있으면 기사 버전 갱신 → API 응답 캐시 무효화
+    - 저장 성공한 기사는 검색 색인에 추가 (세그먼트 기록은 종료 시 1회)
+    - 새로 INSERT된 기사는 배치 commit 직후 API에 알림 (/articles/stream 구독자에게 전달)
+    """
     close_conn = False
     if conn is None:
         conn = get_connection()
@@ -176,19 +352,65 @@ async def fetch_all_entries(conn=None) -> List[dict]:
 
     all_entries = []
     seen_links = set()
-    async with aiohttp.ClientSession() as session:
-        rss_urls = await discover_all_rss(session)
-        tasks = [fetch_single_rss(session, url, conn) for url in rss_urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    cache = load_feed_cache() if use_cache else None
+    seen = load_seen_index(conn) if use_cache else None
+    scheduler = CrawlScheduler()
+    executor = create_parse_executor()
+    search = SearchIndex()
+    pending_validators = {}   # 피드 URL → 새 검증값 (저장 확인 전)
+    failed_feeds = set()
+
+    def on_saved(batch):
+        if seen is not None:
+            seen.add_many(batch)
+        search.add_many(batch)
+
+    def on_failed(batch):
+        failed_feeds.update(article["category"] for article in batch)
+
+    try:
+        async with ArticleWriter(conn, on_saved=on_saved, on_inserted=publish_articles,
+                                 on_failed=on_failed) as writer, \
+                create_session() as session:
+            rss_urls = await discover_all_rss(session)
+            results = await scheduler.gather(
+                rss_urls, lambda url: fetch_single_rss(session, url, conn, cache, executor, seen, writer,
+                                                       pending_validators)
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    if writer.totals["inserted"] or writer.totals["updated"]:
+        bump_articles_version()
+    try:
+        search.flush()
+    except Exception as e:
+        logging.warning(f"검색 색인 기록 실패: {e}")
+
+    stats = scheduler.summary()
+    logging.info(
+        f"RSS 수집 스케줄 요약: 피드 {stats['feeds']}개, "
+        f"최대 대기 {stats['max_wait']:.3f}s, 최대 수집 {stats['max_fetch']:.3f}s"
+    )
+
+    if cache is not None:
+        for url, validators in pending_validators.items():
+            if url not in failed_feeds:
+                update_validators(cache, url, validators)
+        save_feed_cache(cache)
+    if seen is not None and seen.dirty:
+        seen.save()
 
     for entries in results:
         if isinstance(entries, Exception):
             logging.error(f"RSS 처리 중 예외 발생: {entries}")
             continue
         for article in entries:
-            if article['link'] in seen_links:
+            h = link_hash(article['link'])
+            if h in seen_links:
                 continue
-            seen_links.add(article['link'])
+            seen_links.add(h)
             all_entries.append(article)
 
     if close_conn and conn:
@@ -200,53 +422,9 @@ async def fetch_all_entries(conn=None) -> List[dict]:
 # ===========================================================
 # 8. articles 아카이브
 # ===========================================================
-def archive_old_articles(days=1):
-    conn = get_connection()
-    if not conn:
-        logging.error("DB 연결 실패. 아카이브 중단.")
-        return
-
-    cursor = conn.cursor()
-    cutoff_date = datetime.now() - timedelta(days=days)
-    cutoff_str = cutoff_date.strftime("%Y-%m-%d %H:%M:%S")
-
-    try:
-        cursor.execute("""
-            SELECT id, title, link, published, summary, source, category, author, fetched_at
-            FROM articles
-            WHERE fetched_at <= %s
-        """, (cutoff_str,))
-        rows_to_archive = cursor.fetchall()
-
-        if not rows_to_archive:
-            logging.info("아카이브 대상 없음")
-        else:
-            for row in rows_to_archive:
-                cursor.execute("""
-                    INSERT INTO articles_old (id, title, link, published, summary, source, category, author, fetched_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON DUPLICATE KEY UPDATE
-                        title = VALUES(title),
-                        summary = VALUES(summary),
-                        published = VALUES(published),
-                        category = VALUES(category),
-                        author = VALUES(author)
-                """, row)
-
-            archived_ids = [row[0] for row in rows_to_archive]
-            if archived_ids:
-                format_strings = ','.join(['%s'] * len(archived_ids))
-                cursor.execute(f"DELETE FROM articles WHERE id IN ({format_strings})", archived_ids)
-
-            logging.info(f"{len(rows_to_archive)}건 아카이브 완료 (articles → articles_old)")
-
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        logging.error(f"아카이브 실패: {e}")
-    finally:
-        cursor.close()
-        conn.close()
+def archive_old_articles(days=1, chunk_size: int = ARCHIVE_CHUNK_SIZE) -> int:
+    """articles → articles_old 이동 (src/archive.py 엔진 사용), 이동한 기사 수 반환"""
+    return run_archive(days=days, chunk_size=chunk_size)
 
 # ===========================================================
 # 9. CRON용 실행 함수
@@ -254,6 +432,7 @@ def archive_old_articles(days=1):
 def run_cron_job():
     archive_old_articles(days=1)
     asyncio.run(fetch_all_entries())
+    get_pool().log_stats()
 
 # ===========================================================
 # 10. 개발용 실행 예시
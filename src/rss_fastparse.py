@@ -0,0 +1,131 @@
+# src/rss_fastparse.py
+"""
+RSS 2.0 고속 파서 (expat 스트리밍)
+- 트리를 만들지 않고 <item>의 필요한 필드만 추출
+- 반환 entry 형식은 feedparser 경로와 동일 (title, link, summary, author, published_parsed, updated_parsed)
+- HTML 정리도 feedparser와 같은 규칙 적용 (description은 항상, title은 HTML로 보일 때 <script> 등 제거)
+  → 백엔드를 바꾸거나 feedparser로 대체돼도 같은 기사는 같은 값 / 같은 content_hash
+- RSS 2.0이 아니거나 XML 오류 시 예외 발생 → 호출 측에서 feedparser로 대체
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterator, List, Optional
+from xml.parsers import expat
+
+import feedparser
+from feedparser.mixin import _FeedParserMixin
+from feedparser.sanitizer import _sanitize_html
+
+# ===========================================================
+# 1. 추출 대상 태그 → entry 필드
+# ===========================================================
+ITEM_TAGS = {
+    "title": "title",
+    "link": "link",
+    "description": "summary",
+    "author": "author",
+    "dc:creator": "author",
+    "pubDate": "published",
+    "dc:date": "updated",
+}
+
+CHUNK_SIZE = 64 * 1024
+
+class FastParseError(ValueError):
+    """고속 파서가 처리할 수 없는 피드 (feedparser로 대체 필요)"""
+
+# ===========================================================
+# 2. 필드 정리 (feedparser 결과와 일치)
+# ===========================================================
+def sanitize_html(value: Optional[str]) -> Optional[str]:
+    """feedparser와 같은 HTML 정리 (스크립트 / 이벤트 속성 / 허용되지 않은 태그 제거)"""
+    if not value or not feedparser.SANITIZE_HTML:
+        return value
+    return _sanitize_html(value, "utf-8", "text/html")
+
+def clean_title(value: Optional[str]) -> Optional[str]:
+    """RSS title은 일반 텍스트, HTML로 보이는 경우에만 정리 (feedparser의 추정 규칙 그대로)"""
+    if value and _FeedParserMixin.looks_like_html(value):
+        return sanitize_html(value)
+    return value
+
+# ===========================================================
+# 3. 날짜 변환
+# ===========================================================
+def parse_feed_date(value: Optional[str]):
+    """RFC 822(pubDate) / ISO 8601(dc:date) 날짜 → UTC time.struct_time (feedparser *_parsed와 동일 형식)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.utctimetuple()
+
+# ===========================================================
+# 4. 스트리밍 파서
+# ===========================================================
+def iter_rss2_entries(text: str, chunk_size: int = CHUNK_SIZE) -> Iterator[dict]:
+    """RSS 2.0 문자열을 청크 단위로 파싱하며 <item>마다 entry dict 반환"""
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+
+    state = {"root": None, "item": None, "field": None, "buf": []}
+    ready: List[dict] = []
+
+    def start(name, attrs):
+        if state["root"] is None:
+            state["root"] = name
+            if name != "rss":
+                raise FastParseError(f"RSS 2.0 아님: <{name}>")
+        if name == "item":
+            state["item"] = {}
+        elif state["item"] is not None and name in ITEM_TAGS:
+            state["field"] = ITEM_TAGS[name]
+            state["buf"] = []
+
+    def end(name):
+        item = state["item"]
+        if item is None:
+            return
+        if name == "item":
+            published = item.get("published")
+            updated = item.get("updated")
+            ready.append({
+                "title": clean_title(item.get("title")),
+                "link": item.get("link"),
+                "summary": sanitize_html(item.get("summary")),
+                "author": item.get("author"),
+                "published_parsed": parse_feed_date(published),
+                "updated_parsed": parse_feed_date(updated),
+            })
+            state["item"] = None
+        elif state["field"] is not None and ITEM_TAGS.get(name) == state["field"]:
+            item.setdefault(state["field"], "".join(state["buf"]).strip())
+            state["field"] = None
+
+    def chars(data):
+        if state["field"] is not None:
+            state["buf"].append(data)
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = chars
+
+    for pos in range(0, len(text), chunk_size):
+        parser.Parse(text[pos:pos + chunk_size], False)
+        yield from ready
+        ready.clear()
+    parser.Parse("", True)
+    yield from ready
+
+def parse_rss2(text: str) -> List[dict]:
+    """RSS 2.0 문자열 → entry 리스트 (오류 시 expat.ExpatError / FastParseError)"""
+    return list(iter_rss2_entries(text))
@@ -0,0 +1,109 @@
+# src/scheduler.py
+"""
+RSS 수집 스케줄러
+- 전체 동시 요청 수 / 호스트별 동시 요청 수 제한
+- keep-alive, DNS 캐시를 적용한 공용 커넥터
+- 연결 / 읽기 타임아웃 분리 + 피드 1개 전체 수집 한도(CRAWL_TOTAL_TIMEOUT)
+- 호스트 슬롯을 먼저 얻은 뒤 전체 슬롯 확보 → 바쁜 호스트 대기 작업이 전체 슬롯을 잡고 있지 않음
+- 피드별 대기 시간(queue wait)과 수집 시간(fetch) 기록
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, List
+from urllib.parse import urlsplit
+
+import aiohttp
+
+# ===========================================================
+# 1. 설정 (환경변수로 조정 가능)
+# ===========================================================
+CRAWL_MAX_CONCURRENCY = int(os.getenv("CRAWL_MAX_CONCURRENCY", "32"))   # 전체 동시 요청 수
+CRAWL_PER_HOST_LIMIT = int(os.getenv("CRAWL_PER_HOST_LIMIT", "4"))      # 호스트별 동시 요청 수
+CRAWL_CONNECT_TIMEOUT = float(os.getenv("CRAWL_CONNECT_TIMEOUT", "5"))  # 연결 타임아웃(초)
+CRAWL_READ_TIMEOUT = float(os.getenv("CRAWL_READ_TIMEOUT", "15"))       # 읽기 타임아웃(초)
+CRAWL_TOTAL_TIMEOUT = float(os.getenv("CRAWL_TOTAL_TIMEOUT", "60"))     # 요청 1건 전체 한도(초, 느리게 흘려보내는 서버 대비)
+CRAWL_KEEPALIVE = float(os.getenv("CRAWL_KEEPALIVE", "30"))             # keep-alive 유지(초)
+CRAWL_DNS_TTL = int(os.getenv("CRAWL_DNS_TTL", "300"))                  # DNS 캐시 TTL(초)
+
+# ===========================================================
+# 2. 공용 세션 생성
+# ===========================================================
+def create_session(
+    max_concurrency: int = CRAWL_MAX_CONCURRENCY,
+    per_host_limit: int = CRAWL_PER_HOST_LIMIT,
+) -> aiohttp.ClientSession:
+    """커넥터/타임아웃이 조정된 ClientSession 생성 (이벤트 루프 안에서 호출)"""
+    connector = aiohttp.TCPConnector(
+        limit=max_concurrency,
+        limit_per_host=per_host_limit,
+        ttl_dns_cache=CRAWL_DNS_TTL,
+        keepalive_timeout=CRAWL_KEEPALIVE,
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=CRAWL_TOTAL_TIMEOUT,
+        sock_connect=CRAWL_CONNECT_TIMEOUT,
+        sock_read=CRAWL_READ_TIMEOUT,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+# ===========================================================
+# 3. 스케줄러
+# ===========================================================
+class CrawlScheduler:
+    """전체/호스트별 세마포어로 피드 수집 작업을 제한하고 시간 측정"""
+
+    def __init__(self, max_concurrency: int = CRAWL_MAX_CONCURRENCY, per_host_limit: int = CRAWL_PER_HOST_LIMIT):
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        self.stats: List[dict] = []
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._hosts[host]
+
+    async def run(self, url: str, job: Callable[[], Awaitable]):
+        """슬롯 확보 후 job 실행, 대기/수집 시간 기록"""
+        queued_at = time.perf_counter()
+        # 호스트 → 전체 순서: 같은 호스트 대기 작업이 다른 호스트 피드의 전체 슬롯을 막지 않음
+        async with self._host_semaphore(url), self._global:
+            started_at = time.perf_counter()
+            ok = False
+            try:
+                result = await job()
+                ok = True
+                return result
+            finally:
+                finished_at = time.perf_counter()
+                stat = {
+                    "url": url,
+                    "wait": started_at - queued_at,
+                    "fetch": finished_at - started_at,
+                    "ok": ok,
+                }
+                self.stats.append(stat)
+                logging.info(
+                    f"RSS 수집 시간: {url} - 대기 {stat['wait']:.3f}s, 수집 {stat['fetch']:.3f}s"
+                )
+
+    async def gather(self, urls: List[str], job_factory: Callable[[str], Awaitable]) -> list:
+        """URL 목록을 스케줄러로 실행 (예외는 결과로 반환)"""
+        tasks = [self.run(url, lambda url=url: job_factory(url)) for url in urls]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def summary(self) -> dict:
+        """수집 통계 요약"""
+        if not self.stats:
+            return {"feeds": 0, "max_wait": 0.0, "max_fetch": 0.0, "total_fetch": 0.0}
+        return {
+            "feeds": len(self.stats),
+            "max_wait": max(s["wait"] for s in self.stats),
+            "max_fetch": max(s["fetch"] for s in self.stats),
+            "total_fetch": sum(s["fetch"] for s in self.stats),
+        }
@@ -0,0 +1,391 @@
+# src/schema.py
+"""
+DB 스키마 관리 (생성 / 업그레이드 / 인덱스 검증)
+- articles, articles_old 테이블 생성 및 누락 컬럼/인덱스 추가
+- 인덱스는 실제 조회 쿼리 기준: fetched_at, (category, fetched_at), link_hash 고유 키
+- link_hash: 링크 64비트 해시 (BIGINT UNSIGNED) → 긴 VARCHAR 고유 키 대신 고정 길이 키 사용
+  · 기존 테이블: NULL 허용 컬럼 추가 → 채우기 → NOT NULL 전환 → 그 뒤에만 이전 link 고유 키 제거
+    (NULL은 고유 키 검사에서 빠지므로 NULL 허용 상태로 이전 키를 지우면 중복 방지가 사라짐)
+- content_hash: 기사 내용 지문 → 수집 시 값이 다를 때만 UPDATE (기존 행은 첫 수집 때 채워짐)
+- article_stats: 카테고리/시간별 기사 수 (src/stats.py), 새로 만들어지면 기존 기사로 채움
+- verify: 주요 쿼리 EXPLAIN 실행 후 전체 테이블 스캔(type=ALL) 여부 확인
+- ARTICLES_LAYOUT=partitioned: fetched_at RANGE 파티션 테이블로 생성/변환 (src/partitions.py)
+  · 파티션 테이블의 고유 키는 fetched_at을 포함해야 하므로 link_hash는 일반 인덱스로 생성
+  · DB가 링크 중복을 막지 않음 → articles는 save_articles(기존 link_hash 조회 + 배치 내 중복 제거),
+    articles_old는 아카이브 시 병합(src/archive.py)으로 유지. 동시에 여러 수집기가 저장하면 중복 가능
+    → migrate --dedupe로 정리
+- 사용법:
+    python -m src.schema migrate            # 테이블/컬럼/인덱스 생성 (link_hash 채우기 포함)
+    python -m src.schema migrate --dedupe   # 중복 링크 정리 (최신 id만 유지, 고유 키 추가 전 / 파티션 레이아웃)
+    python -m src.schema backfill-link-hash # 기존 행 link_hash만 채우기
+    python -m src.schema verify             # 쿼리 실행 계획 점검
+"""
+
+import argparse
+import logging
+import sys
+from datetime import date, datetime, timedelta
+
+from .db import ARTICLES_LAYOUT, get_connection
+from .hashing import link_hash
+from .archive import CREATE_CHECKPOINT_SQL, SELECT_RANGE_SQL
+from .stats import CREATE_STATS_SQL, SELECT_STATS_SQL, rebuild as rebuild_stats
+from .article_query import build_list_query, encode_cursor
+from .timerange import build_digest_query
+from .partitions import PARTITION_DAYS_AHEAD, list_partitions, partition_bounds, partition_clause
+
+# ===========================================================
+# 1. 테이블 정의
+# ===========================================================
+ARTICLE_COLUMNS = """
+    title VARCHAR(512) NULL,
+    link VARCHAR(700) NOT NULL,
+    link_hash BIGINT UNSIGNED NOT NULL,
+    content_hash BIGINT UNSIGNED NULL,
+    published DATETIME NULL,
+    summary TEXT NULL,
+    source VARCHAR(64) NULL,
+    category VARCHAR(255) NULL,
+    author VARCHAR(255) NULL,
+    fetched_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+"""
+
+ARTICLE_TABLES = ("articles", "articles_old")
+
+def table_definitions(layout: str = ARTICLES_LAYOUT) -> dict:
+    """레이아웃별 CREATE TABLE 문"""
+    if layout == "partitioned":
+        # 파티션 교체(EXCHANGE PARTITION)를 위해 두 테이블 구조를 동일하게 유지
+        today = date.today()
+        clause = partition_clause(partition_bounds(today, today + timedelta(days=PARTITION_DAYS_AHEAD)))
+        tables = {
+            table: f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+                    {ARTICLE_COLUMNS},
+                    PRIMARY KEY (id, fetched_at)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+                {clause}
+            """
+            for table in ARTICLE_TABLES
+        }
+    else:
+        tables = {
+            "articles": f"""
+                CREATE TABLE IF NOT EXISTS articles (
+                    id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+                    {ARTICLE_COLUMNS}
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """,
+            # 아카이브 테이블은 articles의 id를 그대로 보존 (AUTO_INCREMENT 없음)
+            "articles_old": f"""
+                CREATE TABLE IF NOT EXISTS articles_old (
+                    id BIGINT UNSIGNED NOT NULL PRIMARY KEY,
+                    {ARTICLE_COLUMNS}
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """,
+        }
+    tables["archive_checkpoint"] = CREATE_CHECKPOINT_SQL
+    tables["article_stats"] = CREATE_STATS_SQL
+    return tables
+
+# 기존 테이블에 없으면 추가할 컬럼: (테이블, 컬럼, 정의)
+# link_hash는 기존 행을 채우기 전이므로 NULL 허용으로 추가 (채운 뒤 LINK_HASH_NOT_NULL로 전환)
+COLUMNS = [
+    (table, column, definition)
+    for table in ("articles", "articles_old")
+    for column, definition in (
+        ("link_hash", "BIGINT UNSIGNED NULL AFTER link"),
+        ("content_hash", "BIGINT UNSIGNED NULL AFTER link_hash"),
+    )
+]
+
+# 대체 인덱스가 생기면 제거할 인덱스: (테이블, 제거할 인덱스, 대체 인덱스)
+OBSOLETE_INDEXES = [
+    (table, f"{prefix}_{table}_link", f"{prefix}_{table}_link_hash")
+    for table in ("articles", "articles_old")
+    for prefix in ("uq", "idx")
+]
+
+LINK_HASH_NOT_NULL = "MODIFY link_hash BIGINT UNSIGNED NOT NULL"
+
+BACKFILL_CHUNK_SIZE = 5000
+
+def index_definitions(layout: str = ARTICLES_LAYOUT) -> list:
+    """인덱스 목록 [(테이블, 인덱스명, 컬럼 목록, 고유 여부)]"""
+    partitioned = layout == "partitioned"
+    indexes = []
+    for table in ARTICLE_TABLES:
+        if partitioned:
+            indexes.append((table, f"idx_{table}_link_hash", "link_hash", False))        # 중복 점검 (고유 키 불가, 모듈 설명 참고)
+        else:
+            indexes.append((table, f"uq_{table}_link_hash", "link_hash", True))          # 중복 링크 방지 / 중복 점검
+        indexes.append((table, f"idx_{table}_fetched_at", "fetched_at", False))          # /articles 정렬, 아카이브 기준 시각
+        indexes.append((table, f"idx_{table}_category_fetched_at", "category, fetched_at", False))  # 일간 요약 카테고리별 조회
+    return indexes
+
+# ===========================================================
+# 2. 마이그레이션
+# ===========================================================
+def _existing_columns(cursor, table: str) -> set:
+    cursor.execute(
+        "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+        (table,),
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+def _existing_indexes(cursor, table: str) -> set:
+    cursor.execute(
+        "SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+        (table,),
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+def _unique_indexes(cursor, table: str) -> set:
+    cursor.execute(
+        "SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND NON_UNIQUE = 0 AND INDEX_NAME <> 'PRIMARY'",
+        (table,),
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+def _earliest_fetched_date(cursor) -> date:
+    """두 테이블 중 가장 오래된 fetched_at 날짜 (파티션 경계를 두 테이블에 동일하게 맞추기 위함)"""
+    dates = []
+    for table in ARTICLE_TABLES:
+        cursor.execute(f"SELECT MIN(fetched_at) FROM {table}")
+        first = cursor.fetchone()[0]
+        if first:
+            dates.append(first.date())
+    return min(dates) if dates else date.today()
+
+def _convert_to_partitioned(cursor, table: str, start: date) -> None:
+    """기존 일반 테이블 → fetched_at RANGE 파티션 테이블 (1회성 테이블 재구성)"""
+    bounds = partition_bounds(start, date.today() + timedelta(days=PARTITION_DAYS_AHEAD))
+    if len(bounds) > 1000:
+        logging.warning(f"{table} 파티션 {len(bounds)}개 생성 예정, ARTICLES_PARTITION_UNIT=month 권장")
+
+    drops = "".join(f", DROP INDEX {name}" for name in sorted(_unique_indexes(cursor, table)))
+    logging.info(f"파티션 테이블로 변환: {table} (파티션 {len(bounds)}개)")
+    cursor.execute(f"""
+        ALTER TABLE {table}
+            MODIFY id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT,
+            MODIFY fetched_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            DROP PRIMARY KEY,
+            ADD PRIMARY KEY (id, fetched_at){drops}
+    """)
+    cursor.execute(f"ALTER TABLE {table} {partition_clause(bounds)}")
+
+def _dedupe_links(cursor, table: str) -> int:
+    """같은 link가 여러 건이면 가장 큰 id만 남기고 삭제"""
+    cursor.execute(f"""
+        DELETE a FROM {table} a
+        JOIN {table} b ON a.link_hash = b.link_hash AND a.id < b.id
+    """)
+    return max(cursor.rowcount, 0)
+
+def backfill_link_hash(conn, chunk_size: int = BACKFILL_CHUNK_SIZE) -> int:
+    """link_hash가 비어 있는 행을 id 순서로 청크 단위 채움 (청크마다 commit), 채운 행 수 반환"""
+    cursor = conn.cursor()
+    filled = 0
+    try:
+        for table in ARTICLE_TABLES:
+            last_id = 0
+            while True:
+                cursor.execute(
+                    f"SELECT id, link FROM {table} WHERE id > %s AND link_hash IS NULL ORDER BY id LIMIT %s",
+                    (last_id, chunk_size),
+                )
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                cursor.executemany(
+                    f"UPDATE {table} SET link_hash = %s WHERE id = %s",
+                    [(link_hash(link), row_id) for row_id, link in rows],
+                )
+                conn.commit()
+                filled += len(rows)
+                last_id = rows[-1][0]
+            logging.info(f"link_hash 채우기 완료: {table}")
+    finally:
+        cursor.close()
+    return filled
+
+def _has_null_link_hash(cursor, table: str) -> bool:
+    cursor.execute(f"SELECT 1 FROM {table} WHERE link_hash IS NULL LIMIT 1")
+    return cursor.fetchone() is not None
+
+def _link_hash_nullable(cursor, table: str) -> bool:
+    cursor.execute(
+        "SELECT IS_NULLABLE FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = 'link_hash'",
+        (table,),
+    )
+    row = cursor.fetchone()
+    return row is not None and row[0] == "YES"
+
+def migrate(conn, dedupe: bool = False, layout: str = ARTICLES_LAYOUT) -> bool:
+    """테이블 생성 + 누락 컬럼/인덱스 추가 (여러 번 실행해도 안전), 모두 성공 시 True"""
+    cursor = conn.cursor()
+    ok = True
+    try:
+        for table, ddl in table_definitions(layout).items():
+            cursor.execute(ddl)
+
+        if layout == "partitioned":
+            pending = [t for t in ARTICLE_TABLES if not list_partitions(cursor, t)]
+            if pending:
+                start = _earliest_fetched_date(cursor)
+                for table in pending:
+                    _convert_to_partitioned(cursor, table, start)
+
+        for table, column, definition in COLUMNS:
+            if column not in _existing_columns(cursor, table):
+                logging.info(f"컬럼 추가: {table}.{column}")
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+        conn.commit()
+
+        filled = backfill_link_hash(conn)
+        if filled:
+            logging.info(f"link_hash {filled}건 채움")
+
+        # 모두 채워졌으면 NOT NULL 전환 (채우는 사이 link_hash 없이 저장한 행이 있으면 다음 실행에서 재시도)
+        for table in ARTICLE_TABLES:
+            if not _link_hash_nullable(cursor, table):
+                continue
+            if _has_null_link_hash(cursor, table):
+                ok = False
+                logging.error(f"{table}.link_hash NOT NULL 전환 보류: 비어 있는 행 남음 (migrate 재실행)")
+                continue
+            logging.info(f"컬럼 변경: {table}.link_hash NOT NULL")
+            try:
+                cursor.execute(f"ALTER TABLE {table} {LINK_HASH_NOT_NULL}")
+            except Exception as e:
+                ok = False
+                logging.error(f"{table}.link_hash NOT NULL 전환 실패: {e}")
+
+        if dedupe and layout == "partitioned":   # 고유 키가 없으므로 매번 정리
+            for table in ARTICLE_TABLES:
+                removed = _dedupe_links(cursor, table)
+                if removed:
+                    logging.warning(f"{table} 중복 링크 {removed}건 삭제")
+            conn.commit()
+
+        for table, name, columns, unique in index_definitions(layout):
+            if name in _existing_indexes(cursor, table):
+                continue
+            if unique and dedupe:
+                removed = _dedupe_links(cursor, table)
+                if removed:
+                    logging.warning(f"{table} 중복 링크 {removed}건 삭제")
+            logging.info(f"인덱스 추가: {table}.{name} ({columns})")
+            try:
+                kind = "UNIQUE INDEX" if unique else "INDEX"
+                cursor.execute(f"ALTER TABLE {table} ADD {kind} {name} ({columns})")
+            except Exception as e:
+                ok = False
+                logging.error(f"인덱스 추가 실패: {table}.{name} - {e} (중복 데이터면 --dedupe 사용)")
+
+        # 새 키가 준비되고 link_hash가 NOT NULL이 된 뒤에만 이전 link 인덱스 제거
+        for table, old, new in OBSOLETE_INDEXES:
+            existing = _existing_indexes(cursor, table)
+            if old in existing and new in existing and not _link_hash_nullable(cursor, table):
+                logging.info(f"인덱스 제거: {table}.{old} (대체: {new})")
+                cursor.execute(f"ALTER TABLE {table} DROP INDEX {old}")
+
+        conn.commit()
+
+        cursor.execute("SELECT 1 FROM article_stats LIMIT 1")
+        if cursor.fetchone() is None:
+            logging.info("기사 통계 채우기: article_stats")
+            rebuild_stats(conn)
+    finally:
+        cursor.close()
+    return ok
+
+# ===========================================================
+# 3. 쿼리 실행 계획 검증
+# ===========================================================
+def known_queries() -> list:
+    """점검 대상 쿼리: (이름, SQL, 파라미터)"""
+    now = datetime.now()
+    day_ago = now - timedelta(days=1)
+    category = "http://www.boannews.com/media/news_rss.xml?kind=1"
+    page_cursor = encode_cursor(day_ago, 1000)
+    return [
+        ("api /articles", *build_list_query(100)),
+        ("api /articles 커서 페이지", *build_list_query(100, cursor=page_cursor)),
+        ("api /articles 카테고리+기간", *build_list_query(100, category, day_ago, now, page_cursor)),
+        ("api /articles 아카이브 구간", *build_list_query(100, category, None, day_ago, page_cursor, "articles_old")),
+        ("api /search 기사 조회",
+         "SELECT id, title, link, category, fetched_at FROM articles WHERE link_hash IN (%s, %s)", (1, 2)),
+        ("일간 요약 (전체 + 카테고리별)", *build_digest_query(["articles", "articles_old"], day_ago, now, 5, 3)),
+        ("아카이브 대상 범위", SELECT_RANGE_SQL, (day_ago,)),
+        ("api /stats", SELECT_STATS_SQL, (day_ago, now)),
+        ("CRON 점검 articles 건수",
+         "SELECT COUNT(*) FROM articles WHERE fetched_at <= %s", (day_ago,)),
+        ("CRON 점검 articles_old 건수",
+         "SELECT COUNT(*) FROM articles_old WHERE fetched_at <= %s", (day_ago,)),
+        ("CRON 점검 중복 링크",
+         "SELECT MIN(link), COUNT(*) FROM articles_old WHERE link_hash IS NOT NULL "
+         "GROUP BY link_hash HAVING COUNT(*) > 1", ()),
+    ]
+
+def verify(conn) -> list:
+    """각 쿼리 EXPLAIN → 전체 테이블 스캔 목록 반환 [(이름, 테이블)]"""
+    full_scans = []
+    cursor = conn.cursor(dictionary=True)
+    try:
+        for name, sql, params in known_queries():
+            cursor.execute("EXPLAIN " + sql, params)
+            for row in cursor.fetchall():
+                access = row.get("type")
+                key = row.get("key")
+                print(
+                    f"[{name}] table={row.get('table')} partitions={row.get('partitions')} "
+                    f"type={access} key={key} rows={row.get('rows')}"
+                )
+                # <derived2> 등 CTE/서브쿼리 중간 결과는 실제 테이블이 아님 → 제외
+                if access == "ALL" and not str(row.get("table")).startswith("<"):
+                    full_scans.append((name, row.get("table")))
+    finally:
+        cursor.close()
+
+    if full_scans:
+        for name, table in full_scans:
+            print(f"⚠ 전체 테이블 스캔: {name} ({table})")
+    else:
+        print("▶ 전체 테이블 스캔 없음")
+    return full_scans
+
+# ===========================================================
+# 4. CLI
+# ===========================================================
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="DB 스키마 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_migrate = sub.add_parser("migrate", help="테이블/컬럼/인덱스 생성 및 업그레이드")
+    p_migrate.add_argument("--dedupe", action="store_true", help="중복 링크 정리 (고유 키 추가 전 / 파티션 레이아웃)")
+    sub.add_parser("backfill-link-hash", help="기존 행 link_hash 채우기")
+    sub.add_parser("verify", help="주요 쿼리 EXPLAIN 점검")
+    args = parser.parse_args(argv)
+
+    conn = get_connection()
+    if not conn:
+        print("[ERROR] DB 연결 실패")
+        return 1
+    try:
+        if args.command == "migrate":
+            return 0 if migrate(conn, dedupe=args.dedupe) else 1
+        if args.command == "backfill-link-hash":
+            print(f"link_hash {backfill_link_hash(conn)}건 채움")
+            return 0
+        return 1 if verify(conn) else 0
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    sys.exit(main())
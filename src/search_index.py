@@ -0,0 +1,396 @@
+# src/search_index.py
+"""
+기사 검색용 역색인 (문자 bigram, 형태소 분석기 없이 한국어 검색)
+- 토큰: 제목 + 요약을 단어 단위로 나눈 뒤 2글자씩 잘라 사용 (1글자 단어는 그대로)
+- 문서 키: link_hash (articles / articles_old 이동과 무관)
+- 저장: 세그먼트(불변) 단위 디렉터리
+  · terms.json: 토큰 → [postings 시작 위치, 문서 수]
+  · postings.bin: uint32 문서 번호 배열 / docs.bin: uint64 link_hash / times.bin: float64 발행 시각
+  · 조회 시 bin 파일을 mmap으로 열어 필요한 구간만 읽음
+  · 세그먼트 안 문서 번호는 최신 문서가 0번 → postings 앞쪽이 최신 기사
+- 증분 추가: 수집기가 저장한 기사를 모아 수집 종료 시 새 세그먼트로 기록
+  · 같은 link_hash가 새 세그먼트에 있으면 이전 세그먼트 문서는 무시 (수정된 기사 반영)
+  · 세그먼트가 SEARCH_MAX_SEGMENTS개를 넘으면 하나로 병합
+  · 병합 / 재구성은 새 매니페스트로 교체한 뒤에 이전 세그먼트 삭제
+  · 읽는 쪽(API)은 매니페스트를 읽은 직후 세그먼트가 삭제되면 매니페스트를 다시 읽어 재시도
+  · 여러 스레드가 같은 SearchIndex를 쓰므로 다시 로드는 잠금 안에서 1회만
+- 순위: 일치한 토큰 수 → 최신순
+  · 모든 토큰이 일치하는 문서가 limit건 이상이면 세그먼트별 최신 문서부터 교집합만 확인 (조기 종료)
+  · 부족하면 세그먼트별 토큰 일치 수를 집계해 일부 일치 문서까지 포함
+- 사용법:
+    python -m src.search_index rebuild      # articles + articles_old 전체로 재구성
+    python -m src.search_index search 랜섬웨어
+"""
+
+import argparse
+import bisect
+import heapq
+import json
+import logging
+import math
+import mmap
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+import unicodedata
+from array import array
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from .hashing import link_hash
+
+# ===========================================================
+# 1. 설정
+# ===========================================================
+SEARCH_INDEX_DIR = os.getenv("SEARCH_INDEX_DIR", "data/search")
+SEARCH_MAX_SEGMENTS = int(os.getenv("SEARCH_MAX_SEGMENTS", "8"))          # 초과 시 병합
+SEARCH_MIN_MATCH = float(os.getenv("SEARCH_MIN_MATCH", "0.6"))            # 질의 토큰 중 최소 일치 비율
+REBUILD_SEGMENT_DOCS = 50000
+LOAD_RETRIES = 3                                                          # 세그먼트 삭제 경합 시 재시도 횟수
+MANIFEST = "manifest.json"
+
+TAG_RE = re.compile(r"<[^>]*>")
+WORD_RE = re.compile(r"\w+")
+
+# ===========================================================
+# 2. 토큰화
+# ===========================================================
+def tokenize(text: Optional[str]) -> Set[str]:
+    """HTML 태그 제거 + 정규화 후 단어별 문자 bigram 집합"""
+    if not text:
+        return set()
+    text = unicodedata.normalize("NFKC", TAG_RE.sub(" ", text)).lower()
+    terms = set()
+    for word in WORD_RE.findall(text):
+        if len(word) == 1:
+            terms.add(word)
+        else:
+            terms.update(word[i:i + 2] for i in range(len(word) - 1))
+    return terms
+
+def article_terms(article: dict) -> Set[str]:
+    return tokenize(article.get("title")) | tokenize(article.get("summary"))
+
+def article_time(article: dict) -> float:
+    published = article.get("published") or article.get("fetched_at")
+    return published.timestamp() if isinstance(published, datetime) else 0.0
+
+class SearchHit(NamedTuple):
+    link_hash: int
+    matches: int
+    timestamp: float
+
+# ===========================================================
+# 3. 세그먼트 (불변, mmap)
+# ===========================================================
+def _mmap_array(path: str, typecode: str):
+    """파일을 mmap으로 열어 typecode 배열처럼 읽기 (빈 파일은 빈 배열)"""
+    if os.path.getsize(path) == 0:
+        return array(typecode), None
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mm).cast(typecode), mm
+
+class Segment:
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "terms.json"), "r", encoding="utf-8") as f:
+            self.terms: Dict[str, List[int]] = json.load(f)
+        self.postings, self._pm = _mmap_array(os.path.join(path, "postings.bin"), "I")
+        self.hashes, self._hm = _mmap_array(os.path.join(path, "docs.bin"), "Q")
+        self.times, self._tm = _mmap_array(os.path.join(path, "times.bin"), "d")
+        self.live = bytearray(b"\x01") * len(self.hashes)   # 새 세그먼트에 같은 문서가 있으면 0
+
+    def lookup(self, term: str):
+        entry = self.terms.get(term)
+        if entry is None:
+            return ()
+        offset, count = entry
+        return self.postings[offset:offset + count]
+
+    @staticmethod
+    def write(path: str, docs: List[tuple], term_docs: Dict[str, List[int]]) -> None:
+        """docs: [(link_hash, timestamp)], term_docs: 토큰 → 문서 번호 목록"""
+        os.makedirs(path)
+        postings = array("I")
+        terms = {}
+        for term in sorted(term_docs):
+            ordinals = term_docs[term]
+            terms[term] = [len(postings), len(ordinals)]
+            postings.extend(ordinals)
+        with open(os.path.join(path, "postings.bin"), "wb") as f:
+            postings.tofile(f)
+        with open(os.path.join(path, "docs.bin"), "wb") as f:
+            array("Q", [h for h, _ in docs]).tofile(f)
+        with open(os.path.join(path, "times.bin"), "wb") as f:
+            array("d", [t for _, t in docs]).tofile(f)
+        with open(os.path.join(path, "terms.json"), "w", encoding="utf-8") as f:
+            json.dump(terms, f, ensure_ascii=False, separators=(",", ":"))
+
+# ===========================================================
+# 4. 색인
+# ===========================================================
+class SearchIndex:
+    def __init__(self, path: str = SEARCH_INDEX_DIR):
+        self.path = path
+        self.pending: Dict[int, tuple] = {}     # link_hash → (timestamp, 토큰 집합)
+        self.segments: List[Segment] = []
+        self._loaded_version = None
+        self._lock = threading.Lock()
+
+    # ---------------- 매니페스트 ----------------
+    def _manifest_path(self) -> str:
+        return os.path.join(self.path, MANIFEST)
+
+    def _read_manifest(self) -> List[str]:
+        try:
+            with open(self._manifest_path(), "r", encoding="utf-8") as f:
+                return json.load(f)["segments"]
+        except FileNotFoundError:
+            return []
+
+    def _write_manifest(self, names: List[str]) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        tmp_path = self._manifest_path() + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"segments": names}, f)
+        os.replace(tmp_path, self._manifest_path())
+
+    def _manifest_version(self):
+        try:
+            stat = os.stat(self._manifest_path())
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_ino)
+
+    # ---------------- 로드 ----------------
+    def _open_segments(self, names: List[str], skip_missing: bool) -> List[Segment]:
+        segments = []
+        for name in names:
+            try:
+                segments.append(Segment(os.path.join(self.path, name)))
+            except FileNotFoundError:
+                if not skip_missing:
+                    raise
+                logging.warning(f"검색 색인 세그먼트 없음, 건너뜀: {name}")
+        return segments
+
+    def load(self) -> None:
+        """
+        매니페스트의 세그먼트를 열고, 새 세그먼트에 가려진 문서 표시
+        - 읽는 도중 다른 프로세스가 병합으로 세그먼트를 지우면 매니페스트부터 다시 읽음
+          (마지막 시도에서는 없는 세그먼트만 건너뜀)
+        """
+        for attempt in range(LOAD_RETRIES):
+            version = self._manifest_version()
+            try:
+                segments = self._open_segments(self._read_manifest(), skip_missing=attempt == LOAD_RETRIES - 1)
+                break
+            except FileNotFoundError as e:
+                logging.info(f"검색 색인 교체 중, 다시 읽음: {e}")
+        latest = {}
+        for segment in segments:
+            for ordinal, h in enumerate(segment.hashes):
+                previous = latest.get(h)
+                if previous is not None:
+                    previous[0].live[previous[1]] = 0
+                latest[h] = (segment, ordinal)
+        self.segments = segments
+        self._loaded_version = version
+
+    def reload_if_changed(self) -> None:
+        """다른 프로세스(수집기)가 세그먼트를 추가했으면 다시 로드 (스레드 간 1회만)"""
+        if self._manifest_version() == self._loaded_version:
+            return
+        with self._lock:
+            if self._manifest_version() != self._loaded_version:
+                self.load()
+
+    def __len__(self) -> int:
+        return sum(sum(segment.live) for segment in self.segments)
+
+    # ---------------- 추가 ----------------
+    def add(self, article: dict) -> None:
+        self.pending[link_hash(article["link"])] = (article_time(article), article_terms(article))
+
+    def add_many(self, articles: Iterable[dict]) -> None:
+        for article in articles:
+            self.add(article)
+
+    def _write_pending(self) -> str:
+        """모아 둔 문서를 새 세그먼트 디렉터리로 기록 (매니페스트는 그대로), 세그먼트 이름 반환"""
+        docs, term_docs = [], defaultdict(list)
+        items = sorted(self.pending.items(), key=lambda item: item[1][0], reverse=True)   # 최신 문서가 0번
+        for ordinal, (h, (timestamp, terms)) in enumerate(items):
+            docs.append((h, timestamp))
+            for term in terms:
+                term_docs[term].append(ordinal)
+        name = f"seg_{time.time_ns()}"
+        Segment.write(os.path.join(self.path, name), docs, term_docs)
+        self.pending = {}
+        return name
+
+    def flush(self, max_segments: int = SEARCH_MAX_SEGMENTS) -> int:
+        """모아 둔 문서를 새 세그먼트로 기록, 세그먼트가 많으면 병합, 기록한 문서 수 반환"""
+        count = len(self.pending)
+        if not count:
+            return 0
+        name = self._write_pending()
+        names = self._read_manifest() + [name]
+        self._write_manifest(names)
+        logging.info(f"검색 색인 세그먼트 추가: {name} ({count}건)")
+
+        if len(names) > max_segments:
+            self.compact()
+        return count
+
+    def compact(self) -> None:
+        """모든 세그먼트를 하나로 병합 (가려진 문서 제거)"""
+        self.load()
+        old_names = self._read_manifest()
+        live_docs = []
+        for index, segment in enumerate(self.segments):
+            for ordinal, alive in enumerate(segment.live):
+                if alive:
+                    live_docs.append((segment.times[ordinal], segment.hashes[ordinal], index, ordinal))
+        live_docs.sort(key=lambda doc: doc[0], reverse=True)   # 최신 문서가 0번
+
+        docs, remaps = [], [{} for _ in self.segments]
+        for new_ordinal, (timestamp, h, index, ordinal) in enumerate(live_docs):
+            remaps[index][ordinal] = new_ordinal
+            docs.append((h, timestamp))
+
+        term_docs = defaultdict(list)
+        for segment, remap in zip(self.segments, remaps):
+            for term in segment.terms:
+                term_docs[term].extend(remap[o] for o in segment.lookup(term) if o in remap)
+        term_docs = {term: sorted(ordinals) for term, ordinals in term_docs.items() if ordinals}
+
+        name = f"seg_{time.time_ns()}"
+        Segment.write(os.path.join(self.path, name), docs, term_docs)
+        self._write_manifest([name])
+        self.segments = []
+        self._loaded_version = None
+        # 열린 mmap은 파일 삭제 후에도 유효 (다른 프로세스가 읽는 중이어도 안전)
+        for old in old_names:
+            shutil.rmtree(os.path.join(self.path, old), ignore_errors=True)
+        logging.info(f"검색 색인 병합: 세그먼트 {len(old_names)}개 → 1개 ({len(docs)}건)")
+
+    # ---------------- 검색 ----------------
+    def search(self, query: str, limit: int = 20, min_match: float = SEARCH_MIN_MATCH) -> List[SearchHit]:
+        """질의 토큰 일치 수 → 최신순 상위 limit건"""
+        self.reload_if_changed()
+        segments = self.segments   # 검색 중 다른 스레드가 다시 로드해도 같은 세그먼트 목록 사용
+        terms = tokenize(query)
+        if not terms:
+            return []
+        need = max(1, math.ceil(len(terms) * min_match))
+
+        # 1) 모든 토큰 일치 문서 (세그먼트별 최신 limit건까지만)
+        full = []
+        for segment in segments:
+            full.extend(self._full_matches(segment, terms, limit))
+        if len(full) >= limit or need == len(terms):
+            return heapq.nlargest(limit, full, key=lambda hit: hit.timestamp)
+
+        # 2) 일부 토큰 일치 문서 포함 (세그먼트별 일치 수 집계, 문서 번호가 작을수록 최신)
+        hits = []
+        for segment in segments:
+            counts = Counter()
+            for term in terms:
+                counts.update(segment.lookup(term))
+            live = segment.live
+            top = heapq.nlargest(limit, [(c, -o) for o, c in counts.items() if c >= need and live[o]])
+            hits.extend(SearchHit(segment.hashes[-o], c, segment.times[-o]) for c, o in top)
+        return heapq.nlargest(limit, hits, key=lambda hit: (hit.matches, hit.timestamp))
+
+    @staticmethod
+    def _full_matches(segment: Segment, terms: Set[str], limit: int) -> List[SearchHit]:
+        """가장 짧은 postings를 앞(최신)부터 돌며 나머지 postings에 모두 있는 문서 limit건"""
+        postings = sorted((segment.lookup(term) for term in terms), key=len)
+        shortest, others = postings[0], postings[1:]
+        hits = []
+        for ordinal in shortest:
+            if segment.live[ordinal] and all(_contains(p, ordinal) for p in others):
+                hits.append(SearchHit(segment.hashes[ordinal], len(terms), segment.times[ordinal]))
+                if len(hits) >= limit:
+                    break
+        return hits
+
+def _contains(postings, value: int) -> bool:
+    """정렬된 postings에 value가 있는지 (이진 탐색)"""
+    i = bisect.bisect_left(postings, value)
+    return i < len(postings) and postings[i] == value
+
+# ===========================================================
+# 5. 전체 재구성
+# ===========================================================
+def rebuild(conn, path: str = SEARCH_INDEX_DIR, segment_docs: int = REBUILD_SEGMENT_DOCS) -> int:
+    """articles + articles_old 전체로 색인 재구성 (기존 세그먼트 교체), 색인 문서 수 반환"""
+    index = SearchIndex(path)
+    os.makedirs(path, exist_ok=True)
+    old_names = index._read_manifest()
+    new_names = []
+    total = 0
+    cursor = conn.cursor(dictionary=True)
+    try:
+        for table in ("articles_old", "articles"):   # 같은 링크면 articles(나중 세그먼트)가 우선
+            cursor.execute(f"SELECT link, title, summary, published, fetched_at FROM {table}")
+            while True:
+                rows = cursor.fetchmany(5000)
+                if not rows:
+                    break
+                index.add_many(rows)
+                total += len(rows)
+                if len(index.pending) >= segment_docs:
+                    new_names.append(index._write_pending())
+        if index.pending:
+            new_names.append(index._write_pending())
+    finally:
+        cursor.close()
+
+    # 새 세그먼트가 모두 준비된 뒤 매니페스트 교체 (재구성 중에도 기존 색인으로 검색 가능)
+    index._write_manifest(new_names)
+    for old in old_names:
+        shutil.rmtree(os.path.join(path, old), ignore_errors=True)
+    if len(new_names) > 1:
+        index.compact()
+    return total
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="기사 검색 색인")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("rebuild", help="DB 전체로 색인 재구성")
+    p_search = sub.add_parser("search", help="색인 검색")
+    p_search.add_argument("query")
+    p_search.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.command == "search":
+        index = SearchIndex()
+        start = time.perf_counter()
+        hits = index.search(args.query, args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+        for hit in hits:
+            print(f"{hit.link_hash:016x} 일치 {hit.matches} {datetime.fromtimestamp(hit.timestamp)}")
+        print(f"{len(hits)}건, {elapsed:.1f}ms (색인 문서 {len(index)}건)")
+        return 0
+
+    from .db import get_connection
+    conn = get_connection()
+    if not conn:
+        print("[ERROR] DB 연결 실패")
+        return 1
+    try:
+        print(f"검색 색인 재구성: {rebuild(conn)}건")
+        return 0
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    sys.exit(main())
@@ -0,0 +1,129 @@
+# src/seen_index.py
+"""
+이미 저장된 기사 인덱스 (로컬 영구 저장)
+- (링크, 내용 지문) 64비트 키 집합을 파일로 보관 → 내용까지 같은 entry는 DB 왕복 없이 건너뜀
+- 제목/요약 등이 수정된 기사는 키가 달라져 저장 단계로 전달 (save_articles가 UPDATE)
+- 파일이 없거나 오래되면 articles / articles_old의 link_hash, content_hash로 재구성
+  · content_hash가 비어 있는 행은 제외 → 첫 수집 때 저장 단계에서 채워짐
+"""
+
+import logging
+import os
+import time
+from array import array
+from typing import Iterable, Optional
+
+from .hashing import link_hash, seen_key
+
+# ===========================================================
+# 1. 설정
+# ===========================================================
+SEEN_INDEX_PATH = os.getenv("SEEN_INDEX_PATH", "data/seen_links.bin")
+SEEN_INDEX_REBUILD_HOURS = float(os.getenv("SEEN_INDEX_REBUILD_HOURS", "24"))  # 재구성 주기
+REBUILD_FETCH_SIZE = 5000
+
+# ===========================================================
+# 2. 인덱스
+# ===========================================================
+class SeenIndex:
+    """기사 키 집합 (파일: uint64 배열), 기사 dict는 link, content_hash 필요"""
+
+    def __init__(self, hashes: Iterable[int] = (), path: str = SEEN_INDEX_PATH, built_at: float = None):
+        self.path = path
+        self.hashes = set(hashes)
+        self.built_at = built_at if built_at is not None else time.time()
+        self.dirty = False
+
+    @staticmethod
+    def key(article: dict) -> int:
+        return seen_key(link_hash(article['link']), article['content_hash'])
+
+    def __contains__(self, article: dict) -> bool:
+        return self.key(article) in self.hashes
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def add(self, article: dict) -> None:
+        h = self.key(article)
+        if h not in self.hashes:
+            self.hashes.add(h)
+            self.dirty = True
+
+    def add_many(self, articles: Iterable[dict]) -> None:
+        for article in articles:
+            self.add(article)
+
+    def is_stale(self, max_age_hours: float = SEEN_INDEX_REBUILD_HOURS) -> bool:
+        return time.time() - self.built_at > max_age_hours * 3600
+
+    def save(self) -> None:
+        """인덱스 파일 저장 (헤더: 재구성 시각, 본문: 정렬된 uint64 배열)"""
+        try:
+            dirname = os.path.dirname(self.path)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                array("d", [self.built_at]).tofile(f)
+                array("Q", sorted(self.hashes)).tofile(f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            logging.warning(f"링크 인덱스 저장 실패: {self.path} - {e}")
+
+    @classmethod
+    def load(cls, path: str = SEEN_INDEX_PATH) -> Optional["SeenIndex"]:
+        """인덱스 파일 로드 (없거나 손상 시 None)"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                header = array("d")
+                header.fromfile(f, 1)
+                hashes = array("Q")
+                hashes.frombytes(f.read())
+            return cls(hashes, path=path, built_at=header[0])
+        except Exception as e:
+            logging.warning(f"링크 인덱스 로드 실패: {path} - {e}")
+            return None
+
+    @classmethod
+    def rebuild(cls, conn, path: str = SEEN_INDEX_PATH) -> "SeenIndex":
+        """articles / articles_old의 (link_hash, content_hash)로 인덱스 재구성"""
+        index = cls(path=path)
+        cursor = conn.cursor()
+        try:
+            for table in ("articles", "articles_old"):
+                # link_hash가 채워진 행은 저장된 값 사용, 없으면 link로 계산
+                cursor.execute(
+                    f"SELECT link_hash, content_hash, IF(link_hash IS NULL, link, NULL) FROM {table} "
+                    "WHERE content_hash IS NOT NULL"
+                )
+                while True:
+                    rows = cursor.fetchmany(REBUILD_FETCH_SIZE)
+                    if not rows:
+                        break
+                    index.hashes.update(
+                        seen_key(h if h is not None else link_hash(link), content_h)
+                        for h, content_h, link in rows if h is not None or link
+                    )
+        finally:
+            cursor.close()
+        index.dirty = True
+        logging.info(f"링크 인덱스 재구성 완료: {len(index)}건")
+        return index
+
+# ===========================================================
+# 3. 로드 (필요 시 재구성)
+# ===========================================================
+def load_seen_index(conn, path: str = SEEN_INDEX_PATH) -> Optional[SeenIndex]:
+    """인덱스 로드, 없거나 재구성 주기가 지났으면 DB에서 재구성 (실패 시 None → 인덱스 없이 수집)"""
+    index = SeenIndex.load(path)
+    if index is not None and not index.is_stale():
+        return index
+    try:
+        return SeenIndex.rebuild(conn, path)
+    except Exception as e:
+        logging.warning(f"링크 인덱스 재구성 실패, 인덱스 없이 수집: {e}")
+        return index
@@ -0,0 +1,56 @@
+# src/serialize.py
+"""
+API 응답 직렬화 (DB 행 → JSON bytes)
+- orjson 사용 (requirements.txt), 미설치 시 표준 json (출력 형식 동일)
+  · 표준 json 경로는 Pydantic 직렬화와 비슷한 속도 → 빠른 경로의 이점은 orjson 기준
+    (benchmarks/bench_serialize_articles.py의 json 열)
+- /articles: DB 조회 결과(타입이 정해진 행)를 Pydantic 모델 검증 없이 바로 직렬화
+  · 필드 / 순서 / 날짜 형식은 api.ArticlesResponse와 동일 → OpenAPI 스키마는 그대로
+  · NULL title / category는 스키마(str)에 맞게 ""로 출력
+"""
+
+import json
+from typing import Iterable, Optional
+
+try:
+    import orjson
+except ImportError:  # requirements.txt에 포함, 없으면 표준 json
+    orjson = None
+
+PUB_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+def _default(value):
+    if hasattr(value, "strftime"):
+        return value.strftime(PUB_DATE_FORMAT)
+    raise TypeError(f"JSON 직렬화 불가: {type(value).__name__}")
+
+def json_dumps(obj) -> bytes:
+    """표준 json 경로 (orjson 미설치 시 사용)"""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+if orjson is not None:
+    # naive datetime → "YYYY-MM-DDTHH:MM:SSZ" (strftime(PUB_DATE_FORMAT)와 같은 문자열)
+    _DATETIME_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_OMIT_MICROSECONDS
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=_DATETIME_OPTIONS)
+else:
+    dumps = json_dumps
+
+def articles_body(rows: Iterable[dict], next_cursor: Optional[str], category_names: dict) -> bytes:
+    """
+    /articles 응답 본문
+    - rows: id, title, link, category, fetched_at 컬럼의 DB 행
+    - category_names: RSS URL → DB 키 (api.CATEGORY_MAPPING)
+    """
+    articles = [
+        {
+            "id": row["id"],
+            "title": row["title"] or "",
+            "link": row["link"],
+            "category": category_names.get(row["category"], row["category"]) or "",
+            "pub_date": row["fetched_at"],
+        }
+        for row in rows
+    ]
+    return dumps({"articles": articles, "next_cursor": next_cursor})
@@ -0,0 +1,171 @@
+# src/stats.py
+"""
+카테고리 / 시간(1시간 단위) 기사 수 통계 (article_stats 테이블)
+- 수집(save_articles): 새로 INSERT된 기사 수만큼 live_count 증가 (같은 트랜잭션)
+- 아카이브(src/archive.py): 옮긴 기사 수만큼 live_count 감소, archived_count 증가 (청크와 같은 트랜잭션)
+  · articles_old에 이미 있던 링크(중복)는 archived_count에 더하지 않음
+- 조회: 기간 내 시간 버킷 행만 합산 → 기사 테이블 COUNT(*) / GROUP BY 스캔 불필요
+- 통계가 어긋나면(수동 DELETE, 스키마 정리 등) rebuild로 기사 테이블에서 다시 계산
+- 사용법:
+    python -m src.stats rebuild
+    python -m src.stats show --since 2025-01-01 --until 2025-01-02
+"""
+
+import argparse
+import logging
+import sys
+from datetime import datetime
+from typing import List, Optional
+
+# ===========================================================
+# 1. 테이블 / SQL
+# ===========================================================
+# category NULL은 ''로 저장 (기본 키 컬럼은 NULL 불가)
+CREATE_STATS_SQL = """
+    CREATE TABLE IF NOT EXISTS article_stats (
+        category VARCHAR(255) NOT NULL,
+        hour DATETIME NOT NULL,
+        live_count INT NOT NULL DEFAULT 0,
+        archived_count INT NOT NULL DEFAULT 0,
+        PRIMARY KEY (hour, category)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+"""
+
+def hour_bucket(column: str) -> str:
+    """DATETIME 컬럼 → 정시 버킷 SQL 식 (DATE_FORMAT의 %는 파라미터 치환과 충돌하므로 사용 안 함)"""
+    return f"TIMESTAMP(DATE({column}), MAKETIME(HOUR({column}), 0, 0))"
+
+UPSERT_SQL = """
+    ON DUPLICATE KEY UPDATE
+        live_count = live_count + VALUES(live_count),
+        archived_count = archived_count + VALUES(archived_count)
+"""
+
+# 새로 저장된 기사 (link_hash 고유 키 조회)
+COUNT_INSERTED_SQL = f"""
+    INSERT INTO article_stats (category, hour, live_count, archived_count)
+    SELECT COALESCE(category, ''), {hour_bucket('fetched_at')}, COUNT(*), 0
+    FROM articles WHERE link_hash IN ({{}})
+    GROUP BY 1, 2
+""" + UPSERT_SQL
+
+# articles(또는 교체용 테이블) → articles_old 이동분, 복사 전에 실행해야 중복 여부 판단 가능
+COUNT_MOVED_SQL = f"""
+    INSERT INTO article_stats (category, hour, live_count, archived_count)
+    SELECT COALESCE(a.category, ''), {hour_bucket('a.fetched_at')}, -COUNT(*),
+           SUM(NOT EXISTS (SELECT 1 FROM articles_old o WHERE o.link_hash = a.link_hash))
+    FROM {{source}} a
+    {{where}}
+    GROUP BY 1, 2
+""" + UPSERT_SQL
+
+REBUILD_SQL = f"""
+    INSERT INTO article_stats (category, hour, live_count, archived_count)
+    SELECT COALESCE(category, ''), {hour_bucket('fetched_at')}, {{live}}, {{archived}}
+    FROM {{table}}
+    GROUP BY 1, 2
+""" + UPSERT_SQL
+
+SELECT_STATS_SQL = """
+    SELECT category, SUM(live_count), SUM(archived_count)
+    FROM article_stats
+    WHERE hour >= %s AND hour < %s
+    GROUP BY category
+"""
+
+SELECT_HOURLY_SQL = """
+    SELECT hour, SUM(live_count), SUM(archived_count)
+    FROM article_stats
+    WHERE hour >= %s AND hour < %s
+    GROUP BY hour
+    ORDER BY hour
+"""
+
+MIN_TIME = datetime(1970, 1, 1)
+MAX_TIME = datetime(9999, 12, 31)
+
+# ===========================================================
+# 2. 갱신 (수집 / 아카이브 트랜잭션 안에서 호출, commit은 호출 측)
+# ===========================================================
+# 통계 갱신 실패(테이블 미생성 등)는 해당 문장만 취소됨 → 기사 저장/아카이브는 계속 진행, rebuild로 복구
+def record_inserted(cursor, link_hashes: List[int]) -> None:
+    if not link_hashes:
+        return
+    try:
+        cursor.execute(COUNT_INSERTED_SQL.format(", ".join(["%s"] * len(link_hashes))), link_hashes)
+    except Exception as e:
+        logging.warning(f"기사 통계 갱신 실패 (python -m src.stats rebuild 필요): {e}")
+
+def record_moved(cursor, source: str = "articles", where: str = "", params=()) -> None:
+    try:
+        cursor.execute(COUNT_MOVED_SQL.format(source=source, where=where), params)
+    except Exception as e:
+        logging.warning(f"기사 통계 갱신 실패 (python -m src.stats rebuild 필요): {e}")
+
+def rebuild(conn) -> None:
+    """기사 테이블 전체를 집계해 통계 재작성 (1회성, 테이블 스캔)"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(CREATE_STATS_SQL)
+        cursor.execute("DELETE FROM article_stats")
+        cursor.execute(REBUILD_SQL.format(table="articles", live="COUNT(*)", archived="0"))
+        cursor.execute(REBUILD_SQL.format(table="articles_old", live="0", archived="COUNT(*)"))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    logging.info("기사 통계 재작성 완료")
+
+# ===========================================================
+# 3. 조회
+# ===========================================================
+def category_counts(cursor, since: Optional[datetime] = None, until: Optional[datetime] = None) -> dict:
+    """{category: {"live": n, "archived": n}} (시간 단위: since/until은 정시로 맞추는 것을 권장)"""
+    cursor.execute(SELECT_STATS_SQL, (since or MIN_TIME, until or MAX_TIME))
+    return {
+        category or None: {"live": int(live or 0), "archived": int(archived or 0)}
+        for category, live, archived in cursor.fetchall()
+    }
+
+def hourly_counts(cursor, since: Optional[datetime] = None, until: Optional[datetime] = None) -> list:
+    """[(hour, live, archived)] 시간순"""
+    cursor.execute(SELECT_HOURLY_SQL, (since or MIN_TIME, until or MAX_TIME))
+    return [(hour, int(live or 0), int(archived or 0)) for hour, live, archived in cursor.fetchall()]
+
+# ===========================================================
+# 4. CLI
+# ===========================================================
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="기사 통계 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("rebuild", help="기사 테이블에서 통계 다시 계산")
+    p_show = sub.add_parser("show", help="카테고리별 기사 수")
+    p_show.add_argument("--since", type=datetime.fromisoformat)
+    p_show.add_argument("--until", type=datetime.fromisoformat)
+    args = parser.parse_args(argv)
+
+    from .db import get_connection
+    conn = get_connection()
+    if not conn:
+        print("[ERROR] DB 연결 실패")
+        return 1
+    try:
+        if args.command == "rebuild":
+            rebuild(conn)
+            return 0
+        cursor = conn.cursor()
+        try:
+            for category, counts in sorted(category_counts(cursor, args.since, args.until).items(),
+                                           key=lambda item: item[0] or ""):
+                print(f"{category or '(없음)'}: articles {counts['live']} / articles_old {counts['archived']}")
+        finally:
+            cursor.close()
+        return 0
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    sys.exit(main())
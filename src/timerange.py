@@ -0,0 +1,233 @@
+# src/timerange.py
+"""
+수집 시각 범위 조회 계층 (articles + articles_old 통합)
+- 호출 측은 기사가 아카이브됐는지 몰라도 됨 → 범위만 주면 필요한 테이블만 조회
+- 테이블 선택: archive_checkpoint의 archived_upto / 진행 중 cutoff 기준
+  · 경계는 프로세스 내 캐시 (BOUNDARY_CACHE_TTL초, 아카이브 시작 신호 시 즉시 재조회) → 페이지당 조회 1회
+    캐시가 오래돼도 archived_upto는 실제보다 작거나 같음 → articles를 더 조회할 뿐 누락 없음
+    old_upper는 새 아카이브 시작 때만 커짐 → 시작 신호(src/response_cache.py)로 무효화
+  · articles: archived_upto 이하 행 없음 → until이 archived_upto 이하면 조회 안 함
+  · articles_old: archived_upto(진행 중이면 cutoff) 초과 행 없음 → since가 그보다 크면 조회 안 함
+  · 체크포인트가 없으면(아카이브 엔진 도입 전 데이터 등) 두 테이블 모두 조회
+- 각 테이블은 (fetched_at, id) 키셋 + LIMIT 쿼리 (fetched_at 인덱스 범위 스캔)
+- 결과는 heapq.merge로 정렬 병합, 페이지 단위로 읽으므로 메모리는 테이블당 1페이지
+- 같은 (fetched_at, id)가 두 테이블에서 모두 읽히면(아카이브 진행 중) 1건만 반환
+- 시간대가 붙은 since / until(…Z, +09:00)은 DB와 같은 로컬 naive 시각으로 바꿔 비교·조회
+- 구간 요약(fetch_digest): 전체 상위 N건 + 카테고리별 상위 M건을 ROW_NUMBER 윈도 쿼리 1회로 조회
+  · 경계 조회 없이 두 테이블 모두 포함 (행이 없는 테이블은 fetched_at 인덱스 탐색 1번으로 끝남)
+"""
+
+import heapq
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .archive import CHECKPOINT_NAME
+from .article_query import LIST_COLUMNS, build_range_query
+from .response_cache import read_archive_version
+
+DIGEST_COLUMNS = "id, title, link, category, fetched_at"
+
+# ===========================================================
+# 1. 설정 / 아카이브 경계
+# ===========================================================
+RANGE_PAGE_SIZE = int(os.getenv("RANGE_PAGE_SIZE", "1000"))   # 스트리밍 시 테이블당 1회 조회 행 수
+BOUNDARY_CACHE_TTL = float(os.getenv("BOUNDARY_CACHE_TTL", "5"))   # 초, 아카이브 경계 캐시 (0이면 매번 조회)
+
+SELECT_BOUNDARY_SQL = """
+    SELECT status, cutoff, archived_upto FROM archive_checkpoint WHERE name = %s
+"""
+
+def to_db_time(value: Optional[datetime]) -> Optional[datetime]:
+    """aware datetime → 로컬 naive (fetched_at은 시간대 없이 로컬 시각으로 저장)"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+class Boundary(NamedTuple):
+    archived_upto: Optional[datetime]   # 이 시각 이하 행은 articles에 없음
+    old_upper: Optional[datetime]       # 이 시각 초과 행은 articles_old에 없음
+
+def read_boundary(conn) -> Optional[Boundary]:
+    """아카이브 경계 (체크포인트 없음 / 조회 실패 시 None → 두 테이블 모두 조회)"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(SELECT_BOUNDARY_SQL, (CHECKPOINT_NAME,))
+        row = cursor.fetchone()
+    except Exception:
+        return None
+    finally:
+        cursor.close()
+    if not row:
+        return None
+    status, cutoff, archived_upto = row
+    old_upper = archived_upto
+    if status == "running" and (old_upper is None or cutoff > old_upper):
+        old_upper = cutoff
+    return Boundary(archived_upto, old_upper)
+
+_boundary_lock = threading.Lock()
+_boundary_cache: Optional[tuple] = None   # (아카이브 시작 신호 버전, 조회 시각, Boundary)
+
+def cached_boundary(conn) -> Optional[Boundary]:
+    """read_boundary 결과를 BOUNDARY_CACHE_TTL초 동안 재사용 (새 아카이브가 시작되면 다시 조회)"""
+    global _boundary_cache
+    version = read_archive_version()
+    with _boundary_lock:
+        cached = _boundary_cache
+    if cached is not None and cached[0] == version and time.monotonic() - cached[1] < BOUNDARY_CACHE_TTL:
+        return cached[2]
+    boundary = read_boundary(conn)
+    with _boundary_lock:
+        _boundary_cache = (version, time.monotonic(), boundary)
+    return boundary
+
+def clear_boundary_cache() -> None:
+    global _boundary_cache
+    with _boundary_lock:
+        _boundary_cache = None
+
+def plan_tables(boundary: Optional[Boundary], since: Optional[datetime] = None,
+                until: Optional[datetime] = None, ascending: bool = False) -> List[str]:
+    """범위에 걸리는 테이블 (정렬 방향 기준 앞쪽 테이블 먼저)"""
+    if boundary is None:
+        tables = ["articles", "articles_old"]
+    else:
+        tables = []
+        if boundary.archived_upto is None or until is None or until > boundary.archived_upto:
+            tables.append("articles")
+        if boundary.old_upper is not None and (since is None or since <= boundary.old_upper):
+            tables.append("articles_old")
+    return tables[::-1] if ascending else tables
+
+# ===========================================================
+# 2. 조회
+# ===========================================================
+def _key(row: dict) -> Tuple[datetime, int]:
+    return row["fetched_at"], row["id"]
+
+def _query(conn, table: str, columns: str, limit: int, category, since, until, after, ascending) -> list:
+    sql, params = build_range_query(table, columns, limit, category, since, until, after, ascending)
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+def _unique(rows) -> Iterator[dict]:
+    """정렬된 행에서 연속된 같은 키 제거"""
+    last = None
+    for row in rows:
+        key = _key(row)
+        if key != last:
+            last = key
+            yield row
+
+def _can_skip(table: str, rows: list, boundary: Optional[Boundary], ascending: bool) -> bool:
+    """앞 테이블에서 이미 limit건을 채웠고 다음 테이블 행이 그보다 앞설 수 없으면 True"""
+    if boundary is None or not rows:
+        return False
+    edge = rows[-1]["fetched_at"]
+    if ascending:   # 다음 테이블 articles: archived_upto 초과 행만 존재
+        return table == "articles" and boundary.archived_upto is not None and edge <= boundary.archived_upto
+    return table == "articles_old" and boundary.old_upper is not None and edge > boundary.old_upper
+
+def fetch_page(conn, limit: int, category: Optional[str] = None, since: Optional[datetime] = None,
+               until: Optional[datetime] = None, after: Optional[Tuple[datetime, int]] = None,
+               ascending: bool = False, columns: str = LIST_COLUMNS,
+               boundary: Optional[Boundary] = None) -> list:
+    """
+    범위 내 앞쪽 limit건 (정렬 방향 기준)
+    - 앞 테이블만으로 limit건이 확정되면 뒤 테이블은 조회하지 않음
+    - columns에는 fetched_at, id가 포함되어야 함
+    - boundary 미전달 시 캐시된 경계 사용 (cached_boundary)
+    """
+    since, until = to_db_time(since), to_db_time(until)
+    boundary = boundary if boundary is not None else cached_boundary(conn)
+    rows: list = []
+    for table in plan_tables(boundary, since, until, ascending):
+        if len(rows) >= limit and _can_skip(table, rows, boundary, ascending):
+            break
+        rows += _query(conn, table, columns, limit, category, since, until, after, ascending)
+        rows.sort(key=_key, reverse=not ascending)
+        rows = list(_unique(rows))[:limit]
+    return rows
+
+def _iter_table(conn, table: str, columns: str, page_size: int, category, since, until, ascending):
+    after = None
+    while True:
+        rows = _query(conn, table, columns, page_size, category, since, until, after, ascending)
+        yield from rows
+        if len(rows) < page_size:
+            return
+        after = _key(rows[-1])
+
+def iter_range(conn, category: Optional[str] = None, since: Optional[datetime] = None,
+               until: Optional[datetime] = None, ascending: bool = True, columns: str = LIST_COLUMNS,
+               page_size: int = RANGE_PAGE_SIZE) -> Iterator[dict]:
+    """
+    범위 내 전체 행을 정렬 순서대로 스트리밍
+    - 테이블별 키셋 페이지(page_size건)를 번갈아 읽으며 병합 → 한 연결로 처리, 메모리 일정
+    """
+    since, until = to_db_time(since), to_db_time(until)
+    tables = plan_tables(cached_boundary(conn), since, until, ascending)
+    streams = [_iter_table(conn, t, columns, page_size, category, since, until, ascending) for t in tables]
+    return _unique(heapq.merge(*streams, key=_key, reverse=not ascending))
+
+# ===========================================================
+# 3. 구간 요약 (전체 / 카테고리별 상위 N건, 1회 조회)
+# ===========================================================
+DIGEST_SQL = """
+    WITH ranged AS (
+        {ranged}
+    ), ranked AS (
+        SELECT {columns},
+               ROW_NUMBER() OVER (ORDER BY fetched_at, id) AS overall_rank,
+               ROW_NUMBER() OVER (PARTITION BY category ORDER BY fetched_at, id) AS category_rank
+        FROM ranged
+    )
+    SELECT {columns}, overall_rank, category_rank FROM ranked
+    WHERE overall_rank <= %s OR category_rank <= %s
+    ORDER BY fetched_at, id
+"""
+
+def build_digest_query(tables: List[str], since: datetime, until: datetime, overall: int,
+                       per_category: int, columns: str = DIGEST_COLUMNS) -> Tuple[str, list]:
+    """
+    구간 요약 SQL + 파라미터
+    - 테이블이 둘이면 UNION(중복 제거): 아카이브 진행 중 두 테이블에 같은 행이 있어도 순위 1번만 계산
+    """
+    select = f"SELECT {columns} FROM {{table}} WHERE fetched_at >= %s AND fetched_at < %s"
+    ranged = "\n        UNION\n        ".join(select.format(table=t) for t in tables)
+    params = [since, until] * len(tables) + [overall, per_category]
+    return DIGEST_SQL.format(ranged=ranged, columns=columns), params
+
+def fetch_digest(conn, since: datetime, until: datetime, overall: int, per_category: int,
+                 columns: str = DIGEST_COLUMNS) -> Tuple[list, Dict[Optional[str], list]]:
+    """
+    [since, until) 구간에서 수집 시각순 앞쪽 overall건 + 카테고리별 앞쪽 per_category건
+    - 반환: (전체 행, {카테고리: 행}) — 카테고리가 늘어도 DB 왕복 1회
+    - 아카이브 경계를 따로 조회하지 않고 두 테이블 모두 UNION (구간 밖 테이블은 인덱스 탐색만 하고 0건)
+    """
+    since, until = to_db_time(since), to_db_time(until)
+    tables = ["articles_old", "articles"]
+    sql, params = build_digest_query(tables, since, until, overall, per_category, columns)
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+
+    top: list = []
+    by_category: Dict[Optional[str], list] = {}
+    for row in rows:
+        overall_rank, category_rank = row.pop("overall_rank"), row.pop("category_rank")
+        if overall_rank <= overall:
+            top.append(row)
+        if category_rank <= per_category:
+            by_category.setdefault(row["category"], []).append(row)
+    return top, by_category
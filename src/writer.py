@@ -0,0 +1,138 @@
+# src/writer.py
+"""
+비동기 크롤러용 DB 저장 단계
+- 수집 코루틴은 큐에 기사만 넣고 바로 다음 작업 진행
+- 백그라운드 writer가 크기/시간 기준으로 묶어서 save_articles 실행 (전용 스레드)
+- 큐 크기 제한으로 DB가 느릴 때 수집 측 대기(back-pressure)
+- close() 시 남은 기사 모두 저장 후 종료
+- on_saved: 저장 성공한 배치 전체 / on_inserted: 그중 새로 INSERT된 기사만 (commit 후 호출)
+- on_failed: 저장 실패(rollback)한 배치 전체
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, Optional
+
+from .db import DB_BATCH_SIZE, save_articles
+
+# ===========================================================
+# 1. 설정
+# ===========================================================
+WRITER_FLUSH_INTERVAL = float(os.getenv("WRITER_FLUSH_INTERVAL", "0.5"))  # 배치 최대 대기 시간(초)
+WRITER_QUEUE_SIZE = int(os.getenv("WRITER_QUEUE_SIZE", "2000"))           # 큐 최대 길이
+
+_STOP = object()
+
+# ===========================================================
+# 2. Writer
+# ===========================================================
+class ArticleWriter:
+    """asyncio 큐 + 단일 DB 스레드 기반 일괄 저장기"""
+
+    def __init__(
+        self,
+        conn,
+        batch_size: int = DB_BATCH_SIZE,
+        flush_interval: float = WRITER_FLUSH_INTERVAL,
+        max_queue: int = WRITER_QUEUE_SIZE,
+        on_saved: Optional[Callable[[List[dict]], None]] = None,
+        on_inserted: Optional[Callable[[List[dict]], None]] = None,
+        on_failed: Optional[Callable[[List[dict]], None]] = None,
+    ):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_saved = on_saved
+        self.on_inserted = on_inserted
+        self.on_failed = on_failed
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.totals = {"inserted": 0, "updated": 0, "ignored": 0, "failed": 0, "batches": 0}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "ArticleWriter":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def put(self, article: dict) -> None:
+        """기사 1건 큐에 추가 (큐가 가득 차면 대기)"""
+        await self.queue.put(article)
+
+    async def put_many(self, articles: List[dict]) -> None:
+        for article in articles:
+            await self.queue.put(article)
+
+    async def close(self) -> None:
+        """남은 기사 저장 후 writer 종료"""
+        if self._task is not None:
+            await self.queue.put(_STOP)
+            await self._task
+            self._task = None
+        self._executor.shutdown(wait=True)
+        logging.info(
+            f"DB writer 종료: 신규 {self.totals['inserted']}건, 수정 {self.totals['updated']}건, "
+            f"변경 없음 {self.totals['ignored']}건, 실패 {self.totals['failed']}건, 배치 {self.totals['batches']}회"
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch: List[dict] = []
+        deadline = 0.0
+
+        while True:
+            timeout = max(deadline - loop.time(), 0) if batch else None
+            try:
+                item = await asyncio.wait_for(self.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                item = None  # 시간 기준 flush
+
+            if item is _STOP:
+                break
+            if item is not None:
+                if not batch:
+                    deadline = loop.time() + self.flush_interval
+                batch.append(item)
+
+            if batch and (item is None or len(batch) >= self.batch_size):
+                await self._flush(batch)
+                batch = []
+
+        if batch:
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[dict]) -> None:
+        loop = asyncio.get_running_loop()
+        inserted: List[dict] = []
+        try:
+            result = await loop.run_in_executor(
+                self._executor, partial(save_articles, self.conn, batch, inserted=inserted)
+            )
+        except Exception as e:
+            logging.error(f"DB writer 저장 실패: {e}")
+            result = {"inserted": 0, "updated": 0, "ignored": 0, "failed": len(batch)}
+
+        for key in ("inserted", "updated", "ignored", "failed"):
+            self.totals[key] += result[key]
+        self.totals["batches"] += 1
+
+        if result["failed"]:
+            callbacks = ((self.on_failed, batch),)
+        else:
+            callbacks = ((self.on_saved, batch), (self.on_inserted, inserted))
+        for callback, articles in callbacks:
+            if callback is None or not articles:
+                continue
+            try:
+                callback(articles)
+            except Exception as e:
+                logging.warning(f"DB writer 저장 후처리 실패: {e}")
@@ -8,22 +8,19 @@
 """
 
 import os
-import pymysql
+
+from src.db import get_connection
+from src.hashing import link_hash
 
 # =========================
-# 1. DB 접속 정보
+# 1. DB 접속: src.db 공용 풀 사용 (.env의 DB_*)
 # =========================
-DB = {
-    "host": "localhost",
-    "user": "ktech",
-    "password": "ktech!@#$",
-    "database": "boannews",
-    "charset": "utf8mb4"
-}
 
-def get_connection():
-    """DB 연결 반환"""
-    return pymysql.connect(**DB)
+def require_connection():
+    """공용 풀 연결 대여, 실패(None) 시 AttributeError 대신 명확한 실패 메시지"""
+    conn = get_connection()
+    assert conn is not None, "DB 연결 실패 (.env의 DB_* / DB 서버 상태 확인)"
+    return conn
 
 def get_db_counts():
     """
@@ -32,7 +29,7 @@ def get_db_counts():
     - articles 원본 남은 건수
     - articles_old 중복 링크 확인
     """
-    conn = get_connection()
+    conn = require_connection()
     cur = conn.cursor()
     
     cur.execute("SELECT COUNT(*) FROM articles_old WHERE fetched_at <= NOW() - INTERVAL 1 DAY;")
@@ -74,13 +71,15 @@ def insert_sample_articles(n=3):
     DB articles 테이블에 샘플 기사 n개 삽입 (FAST 테스트용)
     - run_cron_job() 실행 시 로그에 '총 수집 기사 수'가 나타나도록 보장
     """
-    conn = get_connection()
+    conn = require_connection()
     cur = conn.cursor()
     for i in range(n):
+        link = f"http://test.link/{i+1}"
+        # link_hash 고유 키로 중복 방지 → 반복 실행해도 같은 샘플은 1건만 유지
         cur.execute("""
-            INSERT INTO articles (title, summary, link, fetched_at)
-            VALUES (%s, %s, %s, NOW())
-        """, (f"샘플 기사 {i+1}", f"샘플 요약 {i+1}", f"http://test.link/{i+1}"))
+            INSERT IGNORE INTO articles (title, summary, link, link_hash, fetched_at)
+            VALUES (%s, %s, %s, %s, NOW())
+        """, (f"샘플 기사 {i+1}", f"샘플 요약 {i+1}", link, link_hash(link)))
     conn.commit()
     cur.close()
     conn.close()
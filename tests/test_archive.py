@@ -6,10 +6,12 @@ articles → articles_old 아카이브 테스트 (운영 DB 안전)
 """
 
 import pytest
+from src import response_cache
 from src.rss import archive_old_articles
 from tests.helpers import get_connection, get_db_counts
 
-def test_archive_and_duplicates():
+def test_archive_and_duplicates(tmp_path, monkeypatch):
+    monkeypatch.setattr(response_cache, "ARTICLES_VERSION_PATH", str(tmp_path / "articles_version"))
     conn = get_connection()
     assert conn is not None, "DB 연결 실패"
 
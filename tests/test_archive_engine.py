@@ -0,0 +1,130 @@
+# tests/test_archive_engine.py
+"""
+청크 단위 아카이브 엔진 테스트 (DB 불필요, 가짜 커넥션 사용)
+- id 범위 청크 + 청크마다 commit
+- 중단 후 재실행 시 체크포인트에서 이어서 진행
+- commit된 이동이 있을 때만 기사 버전 갱신
+"""
+
+import os
+import pytest
+from datetime import datetime, timedelta
+from src import archive, response_cache
+
+@pytest.fixture(autouse=True)
+def version_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "articles_version")
+    monkeypatch.setattr(response_cache, "ARTICLES_VERSION_PATH", path)
+    return path
+
+class FakeArchiveDB:
+    """articles / articles_old / archive_checkpoint를 dict로 흉내"""
+
+    def __init__(self, rows):
+        self.articles = dict(rows)      # id → fetched_at
+        self.old = {}
+        self.checkpoint = None          # [status, cutoff, last_id, max_id]
+        self.commits = 0
+        self.fail_on_chunk = None
+        self.chunks = 0
+        self.pending = None
+
+    def cursor(self, *args, **kwargs):
+        return FakeArchiveCursor(self)
+
+    def commit(self):
+        self.commits += 1
+        if self.pending:
+            self.pending()
+            self.pending = None
+
+    def rollback(self):
+        self.pending = None
+
+    def close(self):
+        pass
+
+class FakeArchiveCursor:
+    def __init__(self, db):
+        self.db = db
+        self.result = None
+        self.rowcount = 0
+
+    def execute(self, sql, params=()):
+        db = self.db
+        if sql == archive.SELECT_CHECKPOINT_SQL:
+            self.result = tuple(db.checkpoint) if db.checkpoint else None
+        elif sql == archive.SELECT_RANGE_SQL:
+            ids = [i for i, t in db.articles.items() if t <= params[0]]
+            self.result = (min(ids), max(ids)) if ids else (None, None)
+        elif sql == archive.START_CHECKPOINT_SQL:
+            db.checkpoint = ["running", params[1], params[2], params[3]]
+        elif sql == archive.COPY_CHUNK_SQL:
+            db.chunks += 1
+            if db.chunks == db.fail_on_chunk:
+                raise RuntimeError("DB 연결 끊김")
+            self.lo, self.hi, self.cutoff = params
+        elif sql == archive.DELETE_CHUNK_SQL:
+            lo, hi, cutoff = params
+            ids = [i for i, t in db.articles.items() if lo <= i <= hi and t <= cutoff]
+            self.rowcount = len(ids)
+
+            def apply(ids=ids):
+                for i in ids:
+                    db.old[i] = db.articles.pop(i)
+            db.pending = apply
+        elif sql == archive.ADVANCE_CHECKPOINT_SQL:
+            prev = db.pending
+
+            def apply(prev=prev, last_id=params[0]):
+                prev()
+                db.checkpoint[2] = last_id
+            db.pending = apply
+        elif sql == archive.FINISH_CHECKPOINT_SQL:
+            db.checkpoint[0] = "done"
+
+    def fetchone(self):
+        return self.result
+
+    def close(self):
+        pass
+
+def make_db():
+    now = datetime.now()
+    old = now - timedelta(days=3)
+    rows = {i: old for i in range(1, 11)}
+    rows.update({i: now for i in range(11, 14)})
+    return FakeArchiveDB(rows)
+
+def test_chunked_archive():
+    db = make_db()
+    moved = archive.archive_old_articles(days=1, chunk_size=3, conn=db)
+    assert moved == 10
+    assert sorted(db.old) == list(range(1, 11))
+    assert sorted(db.articles) == [11, 12, 13]
+    assert db.chunks == 4
+    assert db.checkpoint[0] == "done"
+
+def test_resume_after_failure(version_path):
+    db = make_db()
+    db.fail_on_chunk = 1
+    assert archive.archive_old_articles(days=1, chunk_size=3, conn=db) == 0
+    assert not os.path.exists(version_path)   # commit된 청크 없음 → 버전 유지
+
+    db.chunks = 0
+    db.fail_on_chunk = 2
+    assert archive.archive_old_articles(days=1, chunk_size=3, conn=db) == 3
+    assert os.path.exists(version_path)
+    assert sorted(db.old) == [1, 2, 3]
+    assert db.checkpoint[0] == "running" and db.checkpoint[2] == 3
+
+    db.fail_on_chunk = None
+    moved = archive.archive_old_articles(days=1, chunk_size=3, conn=db)
+    assert moved == 7
+    assert sorted(db.old) == list(range(1, 11))
+    assert db.checkpoint[0] == "done"
+
+def test_nothing_to_archive():
+    db = FakeArchiveDB({1: datetime.now()})
+    assert archive.archive_old_articles(days=1, conn=db) == 0
+    assert db.checkpoint is None
@@ -0,0 +1,118 @@
+# tests/test_article_query.py
+"""
+/articles 키셋 페이지네이션 테스트 (DB 불필요)
+- 커서 인코딩/디코딩
+- 필터 / 커서 조건 SQL 생성
+- 페이지를 이어 붙이면 전체 목록과 동일
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+
+import src.api as api
+from src import async_db, timerange
+from src.timerange import Boundary
+from src.article_query import InvalidCursor, build_list_query, decode_cursor, encode_cursor
+
+def test_cursor_roundtrip():
+    at = datetime(2025, 1, 2, 3, 4, 5)
+    assert decode_cursor(encode_cursor(at, 42)) == (at, 42)
+    with pytest.raises(InvalidCursor):
+        decode_cursor("not-a-cursor")
+
+def test_build_query_with_filters():
+    since = datetime(2025, 1, 1)
+    sql, params = build_list_query(10, "http://c", since, None, encode_cursor(since, 7))
+    assert "category = %s" in sql and "fetched_at >= %s" in sql
+    assert sql.count("fetched_at < %s") == 1   # until 없음 → 커서 조건만
+    assert "(fetched_at < %s OR (fetched_at = %s AND id < %s))" in sql
+    assert sql.endswith("ORDER BY fetched_at DESC, id DESC LIMIT %s")
+    assert params == ["http://c", since, since, since, 7, 11]
+
+class FakeCursor:
+    """build_list_query 조건을 메모리 목록에 그대로 적용"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.result = []
+
+    def execute(self, sql, params):
+        if "archive_checkpoint" in sql:   # 아카이브 기록 없음 → articles_old도 조회 (같은 행 → 중복 제거)
+            self.result = []
+            return
+        params = list(params)
+        limit = params.pop()
+        rows = self.rows
+        if "category = %s" in sql:
+            category = params.pop(0)
+            rows = [r for r in rows if r["category"] == category]
+        if "id < %s" in sql:
+            at, _, last_id = params[-3:]
+            rows = [r for r in rows if (r["fetched_at"], r["id"]) < (at, last_id)]
+        rows = sorted(rows, key=lambda r: (r["fetched_at"], r["id"]), reverse=True)
+        self.result = [dict(r) for r in rows[:limit]]
+
+    def fetchone(self):
+        return self.result[0] if self.result else None
+
+    def fetchall(self):
+        return self.result
+
+    def close(self):
+        pass
+
+class FakeConn:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self.rows)
+
+    def close(self):
+        pass
+
+def make_rows():
+    base = datetime(2025, 1, 1)
+    urls = list(api.CATEGORY_MAPPING)
+    # 같은 fetched_at이 여러 건 → id로 순서 결정
+    return [{
+        "id": i, "title": f"기사 {i}", "link": f"http://a/{i}",
+        "category": urls[i % 2], "fetched_at": base + timedelta(minutes=i // 3),
+    } for i in range(1, 11)]
+
+def test_pages_cover_all_rows(monkeypatch):
+    rows = make_rows()
+    monkeypatch.setattr(async_db, "get_connection", lambda: FakeConn(rows))
+    api.articles_cache.clear()
+    client = TestClient(api.app)
+
+    ids, cursor = [], None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/articles", params=params).json()
+        ids += [a["id"] for a in body["articles"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert ids == list(range(10, 0, -1))
+
+    key = api.CATEGORY_MAPPING[list(api.CATEGORY_MAPPING)[1]]
+    body = client.get("/articles", params={"category": key}).json()
+    assert [a["id"] for a in body["articles"]] == [9, 7, 5, 3, 1]
+    assert client.get("/articles", params={"category": "unknown"}).status_code == 400
+    assert client.get("/articles", params={"cursor": "broken"}).status_code == 400
+
+def test_since_with_timezone(monkeypatch):
+    rows = make_rows()
+    monkeypatch.setattr(async_db, "get_connection", lambda: FakeConn(rows))
+    # 아카이브 경계(naive)가 있어도 Z / +09:00 범위가 500 없이 처리
+    monkeypatch.setattr(timerange, "read_boundary", lambda conn: Boundary(datetime(2024, 12, 1), datetime(2024, 12, 1)))
+    monkeypatch.setattr(timerange, "_boundary_cache", None)   # 이전 테스트 경계 무시, 끝나면 복원
+    api.articles_cache.clear()
+    client = TestClient(api.app)
+    for since in ("2025-01-01T00:00:00Z", "2025-01-01T00:00:00+09:00", "2025-01-01T00:00:00"):
+        response = client.get("/articles", params={"since": since})
+        assert response.status_code == 200, since
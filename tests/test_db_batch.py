@@ -0,0 +1,109 @@
+# tests/test_db_batch.py
+"""
+save_articles 일괄 저장 테스트 (DB 불필요, 가짜 커넥션 사용)
+- batch_size 단위 executemany
+- commit 1회, 신규/수정/변경 없음 건수 반환
+- content_hash가 같으면 쓰기 생략, 다르면 UPDATE
+- 같은 배치 안 중복 링크는 1건만 INSERT
+- 실패 시 rollback
+"""
+
+import pytest
+from datetime import datetime
+from src.db import INSERT_ARTICLE_SQL, UPDATE_ARTICLE_SQL, article_fingerprint, save_articles
+from src.hashing import link_hash
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 0
+        self.rows = []
+
+    def execute(self, sql, params=()):
+        if self.conn.fail:
+            raise RuntimeError("DB 오류")
+        self.rows = [(h, self.conn.rows[h]) for h in params if h in self.conn.rows]
+
+    def fetchall(self):
+        return self.rows
+
+    def executemany(self, sql, rows):
+        if sql == INSERT_ARTICLE_SQL:
+            self.conn.batches.append(len(rows))
+            new = [r for r in rows if r[2] not in self.conn.rows]
+            self.conn.rows.update((r[2], r[3]) for r in new)
+            self.rowcount = len(new)
+        elif sql == UPDATE_ARTICLE_SQL:
+            self.conn.updates.append(len(rows))
+            self.conn.rows.update((r[5], r[4]) for r in rows)
+            self.rowcount = len(rows)
+
+    def close(self):
+        pass
+
+class FakeConn:
+    def __init__(self, fail=False):
+        self.fail = fail
+        first = make_articles(1)[0]
+        self.rows = {link_hash(first["link"]): article_fingerprint(first)}   # link_hash → content_hash
+        self.batches = []
+        self.updates = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+def make_articles(n):
+    return [{
+        "title": f"기사 {i}", "link": f"http://a/{i}", "published": datetime(2025, 1, 1),
+        "summary": None, "source": "boannews", "category": "c", "author": None,
+    } for i in range(n)]
+
+def test_batches_and_counts():
+    conn = FakeConn()
+    result = save_articles(conn, make_articles(5), batch_size=2)
+    assert result == {"inserted": 4, "updated": 0, "ignored": 1, "failed": 0}
+    assert conn.batches == [1, 2, 1]
+    assert conn.updates == []
+    assert conn.commits == 1
+
+def test_only_changed_articles_updated():
+    conn = FakeConn()
+    save_articles(conn, make_articles(3))
+
+    articles = make_articles(3)
+    articles[2]["summary"] = "수정된 요약"
+    result = save_articles(conn, articles)
+    assert result == {"inserted": 0, "updated": 1, "ignored": 2, "failed": 0}
+    assert conn.updates == [1]
+    assert conn.rows[link_hash("http://a/2")] == article_fingerprint(articles[2])
+
+    # 같은 내용으로 다시 저장 → 쓰기 없음
+    assert save_articles(conn, articles)["ignored"] == 3
+    assert conn.updates == [1]
+
+def test_duplicate_links_in_batch_inserted_once():
+    conn = FakeConn()
+    articles = make_articles(3)
+    copy = dict(articles[1], category="d")   # 다른 피드에 같은 기사
+    inserted = []
+    result = save_articles(conn, articles + [copy], inserted=inserted)
+    assert conn.batches == [2]
+    assert result == {"inserted": 2, "updated": 0, "ignored": 2, "failed": 0}
+    assert [a["category"] for a in inserted] == ["c", "c"]
+
+def test_failure_rolls_back():
+    conn = FakeConn(fail=True)
+    result = save_articles(conn, make_articles(3))
+    assert result["failed"] == 3
+    assert conn.rollbacks == 1 and conn.commits == 0
+
+def test_empty():
+    assert save_articles(FakeConn(), []) == {"inserted": 0, "updated": 0, "ignored": 0, "failed": 0}
@@ -0,0 +1,80 @@
+# tests/test_db_pool.py
+"""
+공용 커넥션 풀 테스트 (DB 불필요, 가짜 연결 사용)
+- 반환된 연결 재사용 (hit / miss 지표)
+- 모두 사용 중이면 대기 후 타임아웃
+- 끊긴 연결 / 재생성 주기 지난 연결 교체
+"""
+
+import threading
+import time
+import pytest
+from src.db_pool import ConnectionPool, PoolTimeout
+
+class FakeConn:
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+        self.rollbacks = 0
+
+    def ping(self, reconnect=False):
+        if not self.alive:
+            raise RuntimeError("연결 끊김")
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+class Factory:
+    def __init__(self):
+        self.created = []
+
+    def __call__(self):
+        conn = FakeConn()
+        self.created.append(conn)
+        return conn
+
+def test_reuse_and_metrics():
+    factory = Factory()
+    pool = ConnectionPool(factory, size=2)
+    conn = pool.acquire()
+    conn.close()
+    conn.close()   # 두 번 호출해도 한 번만 반환
+    with pool.acquire() as again:
+        assert again._conn is factory.created[0]
+
+    stats = pool.stats()
+    assert len(factory.created) == 1
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["idle"] == 1 and stats["opened"] == 1
+    assert factory.created[0].rollbacks == 2
+
+def test_wait_then_timeout():
+    pool = ConnectionPool(Factory(), size=1, timeout=0.05)
+    held = pool.acquire()
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+
+    # 다른 스레드가 반환하면 대기 중이던 대여가 성공
+    threading.Timer(0.05, held.close).start()
+    pool.acquire(timeout=1).close()
+    stats = pool.stats()
+    assert stats["timeouts"] == 1 and stats["waits"] == 1
+    assert stats["max_wait"] > 0
+
+def test_broken_and_recycled_connections_replaced():
+    factory = Factory()
+    pool = ConnectionPool(factory, size=1, ping_after=0)
+    conn = pool.acquire()
+    conn.close()
+    factory.created[0].alive = False
+    pool.acquire().close()
+    assert len(factory.created) == 2 and factory.created[0].closed
+    assert pool.stats()["broken"] == 1
+
+    pool.recycle = 0
+    pool.acquire().close()
+    assert factory.created[1].closed
+    assert pool.stats()["recycled"] == 1 and pool.stats()["opened"] == 0
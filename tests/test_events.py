@@ -0,0 +1,98 @@
+# tests/test_events.py
+"""
+새 기사 SSE 알림 테스트 (DB 불필요)
+- 구독자 전체 전달, 구독자별 버퍼 제한, Last-Event-ID 재전송, heartbeat
+- 수집기 → 로컬 소켓 → API 허브 전달
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+import src.api as api
+from src.events import EventHub, publish_articles, send_event, start_bridge, stop_bridge
+
+async def take(stream, n):
+    return [await stream.__anext__() for _ in range(n)]
+
+@pytest.mark.asyncio
+async def test_fan_out_and_replay():
+    hub = EventHub()
+    first, second = hub.stream(heartbeat=5), hub.stream(heartbeat=5)
+    await take(first, 1)       # retry 줄 (구독 시작)
+    await take(second, 1)
+    assert len(hub) == 2
+
+    hub.publish("articles", [{"title": "새 기사"}])
+    frame = (await take(first, 1))[0]
+    assert frame == 'id: 1\nevent: articles\ndata: [{"title":"새 기사"}]\n\n'.encode("utf-8")
+    assert (await take(second, 1))[0] == frame
+
+    hub.publish("articles", [{"title": "두 번째"}])
+    replay = hub.stream(last_event_id=1, heartbeat=5)
+    frames = await take(replay, 2)
+    assert frames[1].startswith(b"id: 2\n")
+
+    await first.aclose()
+    assert len(hub) == 2   # second, replay
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_dropped():
+    hub = EventHub(buffer=2)
+    stream = hub.stream(heartbeat=5)
+    await take(stream, 1)
+    for i in range(3):
+        hub.publish("articles", [i])
+    assert len(hub) == 0 and hub.dropped == 1
+
+    frames = await take(stream, 2)          # 버퍼에 남은 이벤트까지만 전달 후 종료
+    assert [f.split(b"\n")[0] for f in frames] == [b"id: 1", b"id: 2"]
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+
+@pytest.mark.asyncio
+async def test_heartbeat():
+    hub = EventHub()
+    stream = hub.stream(heartbeat=0.01)
+    assert (await take(stream, 2)) == [b"retry: 10\n\n", b": ping\n\n"]
+    await stream.aclose()
+    assert len(hub) == 0
+
+@pytest.mark.asyncio
+async def test_bridge_delivers_crawler_events(tmp_path):
+    path = str(tmp_path / "events.sock")
+    assert not send_event("articles", [], path)   # API 미실행 → 무시
+
+    received = []
+    got = asyncio.Event()
+
+    def on_event(event_type, data):
+        received.append((event_type, data))
+        got.set()
+
+    transport = await start_bridge(on_event, path)
+    try:
+        articles = [{"title": f"기사 {i}", "link": f"http://a/{i}", "category": "c",
+                     "published": datetime(2025, 1, 1), "summary": "본문"} for i in range(3)]
+        assert publish_articles(articles, path) == 3
+        await asyncio.wait_for(got.wait(), 1)
+    finally:
+        stop_bridge(transport, path)
+
+    event_type, data = received[0]
+    assert event_type == "articles" and len(data) == 3
+    assert data[0] == {"title": "기사 0", "link": "http://a/0", "category": "c", "published": "2025-01-01T00:00:00"}
+
+@pytest.mark.asyncio
+async def test_api_maps_category(monkeypatch):
+    hub = EventHub()
+    monkeypatch.setattr(api, "event_hub", hub)
+    stream = hub.stream(heartbeat=5)
+    await take(stream, 1)
+
+    api.on_crawler_event("articles", [{"title": "t", "category": "http://www.boannews.com/media/news_rss.xml?kind=1"}])
+    frame = (await take(stream, 1))[0]
+    assert json.loads(frame.split(b"data: ")[1])[0]["category"] == "incidents"
+    await stream.aclose()
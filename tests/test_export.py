@@ -0,0 +1,124 @@
+# tests/test_export.py
+"""
+기사 내보내기 테스트 (DB 불필요)
+- articles_old + articles 수집 시각순 병합, 키셋 페이지 단위 조회
+- NDJSON / CSV 형식, gzip 압축
+- /export 엔드포인트 스트리밍 + 전용 풀 연결 반환, 동시 내보내기 한도 초과 시 503
+"""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+import src.api as api
+from src import export
+from src.db_pool import ConnectionPool
+
+ROWS = {
+    "articles_old": [{"id": i, "title": f"옛 기사 {i}", "link": f"http://a/{i}", "published": None,
+                      "summary": "요약, \"따옴표\"", "source": "보안뉴스", "category": "c",
+                      "author": None, "fetched_at": datetime(2024, 1, 1, 0, i)} for i in range(1, 6)],
+    "articles": [{"id": 10, "title": "새 기사", "link": "http://a/10", "published": datetime(2025, 1, 1),
+                  "summary": "", "source": "보안뉴스", "category": "c", "author": "기자",
+                  "fetched_at": datetime(2025, 1, 1, 9)}],
+}
+
+class FakeCursor:
+    """아카이브 체크포인트 없음 → 두 테이블 모두 조회, 키셋 조건 / LIMIT 적용 (오름차순)"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def execute(self, sql, params=()):
+        if "archive_checkpoint" in sql:
+            self.rows = []
+            return
+        self.conn.queries.append((sql, list(params)))
+        table = sql.split(" FROM ")[1].split()[0]
+        rows = ROWS[table]
+        if "id > %s" in sql:
+            at, _, last_id = params[-4:-1]
+            rows = [r for r in rows if (r["fetched_at"], r["id"]) > (at, last_id)]
+        self.conn.fetch_sizes.append(params[-1])
+        self.rows = rows[:params[-1]]
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+class FakeConn:
+    def __init__(self):
+        self.queries = []
+        self.fetch_sizes = []
+        self.closed = False
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+def test_ndjson_both_tables_in_batches():
+    conn = FakeConn()
+    rows = list(export.iter_rows(conn, since=datetime(2024, 1, 1), fetch_size=2))
+    assert [row["id"] for row in rows] == [1, 2, 3, 4, 5, 10]
+    tables = [sql.split(" FROM ")[1].split()[0] for sql, _ in conn.queries]
+    assert tables[0] == "articles_old" and conn.queries[0][1] == [datetime(2024, 1, 1), 2]
+    assert tables.count("articles_old") == 3 and tables.count("articles") == 1   # 2 + 2 + 1건, 1건
+    assert all("fetched_at >= %s" in sql for sql, _ in conn.queries)
+    assert set(conn.fetch_sizes) == {2}
+
+    body = b"".join(export.export_stream(FakeConn(), "ndjson"))
+    records = [json.loads(line) for line in body.decode("utf-8").splitlines()]
+    assert len(records) == 6
+    assert records[-1]["published"] == "2025-01-01T00:00:00" and records[-1]["author"] == "기자"
+
+def test_csv_and_gzip():
+    body = b"".join(export.export_stream(FakeConn(), "csv", compress=True))
+    reader = list(csv.reader(io.StringIO(gzip.decompress(body).decode("utf-8"))))
+    assert reader[0] == export.EXPORT_FIELDS
+    assert len(reader) == 7 and reader[1][4] == "요약, \"따옴표\""
+
+def test_chunked_bounds_pieces():
+    pieces = list(export.chunked((b"x" * 10 for _ in range(100)), size=64))
+    assert all(len(piece) < 64 + 10 for piece in pieces)
+    assert sum(map(len, pieces)) == 1000
+
+def test_export_endpoint(monkeypatch):
+    pool = ConnectionPool(FakeConn, size=1)
+    monkeypatch.setattr(api, "get_export_pool", lambda: pool)
+    client = TestClient(api.app)
+
+    resp = client.get("/export", params={"format": "ndjson", "gzip": "true", "since": "2024-01-01"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/gzip"
+    assert "articles_20240101.ndjson.gz" in resp.headers["content-disposition"]
+    assert len(gzip.decompress(resp.content).splitlines()) == 6
+    assert pool.stats()["idle"] == 1   # 스트림 종료 후 전용 풀에 반환
+
+    assert client.get("/export", params={"category": "nope"}).status_code == 400
+    assert client.get("/export", params={"format": "xml"}).status_code == 422
+
+def test_export_limit_returns_503(monkeypatch):
+    pool = ConnectionPool(FakeConn, size=1)
+    monkeypatch.setattr(api, "get_export_pool", lambda: pool)
+    busy = pool.acquire()   # 다른 내보내기가 사용 중
+    client = TestClient(api.app)
+
+    resp = client.get("/export")
+    assert resp.status_code == 503 and resp.headers["retry-after"] == "30"
+    busy.close()
+    assert client.get("/export").status_code == 200
@@ -0,0 +1,36 @@
+# tests/test_feed_cache.py
+"""
+조건부 GET 캐시 테스트 (DB 불필요)
+- 검증값 저장/로드
+- If-None-Match / If-Modified-Since 헤더 생성
+"""
+
+import pytest
+from src.feed_cache import load_feed_cache, save_feed_cache, conditional_headers, update_validators
+
+URL = "http://www.boannews.com/media/news_rss.xml?kind=1"
+
+def test_conditional_headers_roundtrip(tmp_path):
+    path = str(tmp_path / "feed_cache.json")
+    cache = load_feed_cache(path)
+    assert cache == {}
+    assert conditional_headers(cache, URL) == {}
+
+    update_validators(cache, URL, {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    save_feed_cache(cache, path)
+
+    loaded = load_feed_cache(path)
+    assert conditional_headers(loaded, URL) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+
+def test_update_validators_drops_missing_header():
+    cache = {URL: {"etag": '"old"', "last_modified": "x"}}
+    update_validators(cache, URL, {"ETag": '"new"'})
+    assert cache[URL] == {"etag": '"new"'}
+
+def test_corrupt_cache_file(tmp_path):
+    path = tmp_path / "feed_cache.json"
+    path.write_text("{broken", encoding="utf-8")
+    assert load_feed_cache(str(path)) == {}
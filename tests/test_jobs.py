@@ -0,0 +1,76 @@
+# tests/test_jobs.py
+"""
+백그라운드 작업 테스트 (DB / sendmail 불필요)
+- 같은 key 작업 중복 제거, 대기열 상한
+- 실패 상태 기록
+- /send-summary 즉시 응답 + 상태 조회
+"""
+
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api as api
+from src.jobs import FAILED, SUCCEEDED, JobManager, JobQueueFull
+
+def wait_done(manager, *jobs):
+    deadline = time.monotonic() + 5
+    while any(job.active for job in jobs) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return manager.get(jobs[0].id)
+
+def test_dedup_and_queue_limit():
+    release = threading.Event()
+    calls = []
+    manager = JobManager(workers=1, queue_size=2)
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+
+    first, created = manager.submit("mail", slow, key="day-1")
+    again, created_again = manager.submit("mail", slow, key="day-1")
+    assert created and not created_again and again is first
+
+    second, _ = manager.submit("mail", slow, key="day-2")
+    with pytest.raises(JobQueueFull):
+        manager.submit("mail", slow, key="day-3")
+
+    release.set()
+    assert wait_done(manager, first, second).status == SUCCEEDED
+    assert len(calls) == 2
+
+def test_failed_job_records_error():
+    manager = JobManager()
+
+    def boom():
+        raise RuntimeError("sendmail 종료 코드 1")
+
+    job, _ = manager.submit("mail", boom)
+    job = wait_done(manager, job)
+    assert job.status == FAILED and "종료 코드" in job.error
+    assert job.to_dict()["finished_at"] is not None
+
+def test_send_summary_endpoint(monkeypatch):
+    release = threading.Event()
+    sent = []
+    monkeypatch.setattr(api, "jobs", JobManager())
+    monkeypatch.setattr(api.sds, "send_daily_summary", lambda: (release.wait(5), sent.append(1)))
+    client = TestClient(api.app)
+
+    resp = client.get("/send-summary")
+    assert resp.status_code == 202
+    job_id = resp.json()["job_id"]
+
+    # 발송 중 재호출 → 같은 작업
+    dup = client.get("/send-summary").json()
+    assert dup["job_id"] == job_id and dup["deduplicated"]
+    assert client.get(f"/send-summary/{job_id}").json()["status"] in ("queued", "running")
+
+    release.set()
+    wait_done(api.jobs, api.jobs.get(job_id))
+    assert client.get(f"/send-summary/{job_id}").json()["status"] == "succeeded"
+    assert sent == [1]
+    assert client.get("/send-summary/unknown").status_code == 404
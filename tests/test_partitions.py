@@ -0,0 +1,87 @@
+# tests/test_partitions.py
+"""
+파티션 경계 계산 / 추가 테스트 (DB 불필요)
+- 파티션 교체 아카이브: 옮긴 행 수 반환, articles_old에 이미 있는 링크 병합
+"""
+
+import pytest
+from datetime import date
+from src import response_cache
+from src.archive import DELETE_SWAP_DUPLICATES_SQL, MERGE_SWAP_DUPLICATES_SQL, _move_partition
+from src.partitions import partition_bounds, partition_clause, ensure_partitions
+
+def test_day_and_month_bounds():
+    assert partition_bounds(date(2025, 1, 30), date(2025, 2, 1), "day") == [
+        ("p20250130", date(2025, 1, 31)),
+        ("p20250131", date(2025, 2, 1)),
+        ("p20250201", date(2025, 2, 2)),
+    ]
+    assert partition_bounds(date(2024, 12, 15), date(2025, 1, 3), "month") == [
+        ("p202412", date(2025, 1, 1)),
+        ("p202501", date(2025, 2, 1)),
+    ]
+
+def test_clause_ends_with_maxvalue():
+    clause = partition_clause(partition_bounds(date(2025, 1, 1), date(2025, 1, 1), "day"))
+    assert "PARTITION p20250101 VALUES LESS THAN ('2025-01-02')" in clause
+    assert clause.rstrip().endswith("PARTITION p_max VALUES LESS THAN (MAXVALUE)\n)")
+
+class FakeCursor:
+    def __init__(self, partitions):
+        self.partitions = partitions
+        self.executed = []
+
+    def execute(self, sql, params=()):
+        self.executed.append(sql)
+
+    def fetchall(self):
+        return self.partitions
+
+def test_ensure_partitions_splits_max_only_for_missing():
+    cursor = FakeCursor([("p20250101", "'2025-01-02'"), ("p_max", "MAXVALUE")])
+    added = ensure_partitions(cursor, "articles", date(2025, 1, 3), "day")
+    assert added == 2
+    alter = cursor.executed[-1]
+    assert alter.startswith("ALTER TABLE articles REORGANIZE PARTITION p_max INTO")
+    assert "p20250102" in alter and "p20250103" in alter and "p20250101" not in alter
+
+class SwapCursor:
+    """교체용 테이블 5건 중 2건은 articles_old에 이미 있는 링크"""
+
+    def __init__(self):
+        self.executed = []
+        self.result = []
+        self.rowcount = 0
+
+    def execute(self, sql, params=()):
+        self.executed.append(sql)
+        self.rowcount = 0
+        if "COUNT(*) FROM articles_swap" in sql:
+            self.result = [(5,)]
+        elif "information_schema.PARTITIONS" in sql:
+            self.result = [("p20250101", "'2025-01-02'"), ("p_max", "MAXVALUE")]
+        elif sql == DELETE_SWAP_DUPLICATES_SQL:
+            self.rowcount = 2
+        else:
+            self.result = []
+
+    def fetchone(self):
+        return self.result[0] if self.result else None
+
+    def fetchall(self):
+        return self.result
+
+class Conn:
+    def commit(self):
+        pass
+
+def test_move_partition_counts_rows_and_merges_duplicates(tmp_path, monkeypatch):
+    monkeypatch.setattr(response_cache, "ARTICLES_VERSION_PATH", str(tmp_path / "articles_version"))
+    cursor = SwapCursor()
+    assert _move_partition(cursor, Conn(), "p20250101", date(2025, 1, 2), pending=False) == 5
+
+    executed = cursor.executed
+    first_exchange = executed.index("ALTER TABLE articles EXCHANGE PARTITION p20250101 WITH TABLE articles_swap")
+    merge = executed.index(MERGE_SWAP_DUPLICATES_SQL)
+    old_exchange = executed.index("ALTER TABLE articles_old EXCHANGE PARTITION p20250101 WITH TABLE articles_swap")
+    assert first_exchange < merge < executed.index(DELETE_SWAP_DUPLICATES_SQL) < old_exchange
@@ -0,0 +1,72 @@
+# tests/test_response_cache.py
+"""
+/articles 응답 캐시 테스트 (DB 불필요)
+- TTL 만료 / LRU 제거
+- ETag 재검증 시 304
+- 기사 버전 갱신 시 다시 조회
+"""
+
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+
+import src.api as api
+from src import async_db, response_cache
+from src.response_cache import ResponseCache, bump_articles_version, etag_matches
+
+def test_ttl_and_lru():
+    now = [0.0]
+    cache = ResponseCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    assert cache.get("a")[1] == b"1"
+    cache.put("c", b"3")              # 가장 오래 안 쓴 b 제거
+    assert cache.get("b") is None and len(cache) == 2
+
+    now[0] = 11
+    assert cache.get("a") is None     # TTL 만료
+    assert cache.hits == 1 and cache.misses == 2
+
+def test_etag_matches():
+    assert etag_matches('"x", "y"', '"y"')
+    assert etag_matches("*", '"y"')
+    assert not etag_matches(None, '"y"')
+
+class CountingConn:
+    queries = 0
+
+    def cursor(self, *args, **kwargs):
+        return self
+
+    def execute(self, sql, params):
+        if " FROM articles " in sql:   # 아카이브 경계 / articles_old 조회는 제외
+            CountingConn.queries += 1
+
+    def fetchall(self):
+        return [{"id": 1, "title": "기사", "link": "http://a/1", "category": "c",
+                 "fetched_at": datetime(2025, 1, 1)}]
+
+    def close(self):
+        pass
+
+def test_cached_until_version_bump(monkeypatch, tmp_path):
+    monkeypatch.setattr(response_cache, "ARTICLES_VERSION_PATH", str(tmp_path / "version"))
+    monkeypatch.setattr(async_db, "get_connection", CountingConn)
+    api.articles_cache.clear()
+    CountingConn.queries = 0
+    client = TestClient(api.app)
+
+    first = client.get("/articles")
+    etag = first.headers["etag"]
+    assert first.json()["articles"][0]["id"] == 1
+
+    # 같은 요청 → 캐시 사용, ETag 일치 → 304
+    assert client.get("/articles").headers["etag"] == etag
+    not_modified = client.get("/articles", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304 and not_modified.content == b""
+    assert CountingConn.queries == 1
+
+    # 수집기가 버전 갱신 → 다시 조회 (내용이 같으면 ETag도 같음)
+    bump_articles_version()
+    assert client.get("/articles", headers={"If-None-Match": etag}).status_code == 304
+    assert CountingConn.queries == 2
@@ -0,0 +1,154 @@
+# tests/test_rss.py
+"""
+RSS 파싱 단위 테스트 (네트워크/DB 불필요)
+- 기록된 보안뉴스 피드(tests/fixtures) 사용
+- 이벤트 루프 내 파싱과 워커 풀 파싱 결과 일치 확인
+- fast / feedparser 백엔드의 HTML 정리 결과 일치 (활성 콘텐츠 제거)
+- 새 ETag / Last-Modified는 저장 성공 후에만 캐시에 반영
+"""
+
+import asyncio
+import os
+import pytest
+from src.hashing import content_hash
+from src.rss import create_parse_executor, decode_and_parse, decode_feed, fetch_single_rss
+from tests.test_db_batch import FakeConn
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+def load_fixture(name="boannews_kind1.xml") -> bytes:
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+        return f.read()
+
+def test_decode_and_parse_fields():
+    parsed = decode_and_parse(load_fixture())
+    assert len(parsed["entries"]) == 20
+
+    first = parsed["entries"][0]
+    assert first["title"].startswith("랜섬웨어")
+    assert first["link"].startswith("http://www.boannews.com/media/view.asp?idx=")
+    assert first["published_parsed"] is not None
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_executor_matches_inline(mode):
+    content = load_fixture()
+    executor = create_parse_executor(mode, workers=2)
+    try:
+        loop = asyncio.new_event_loop()
+        try:
+            parsed = loop.run_until_complete(
+                loop.run_in_executor(executor, decode_and_parse, content)
+            )
+        finally:
+            loop.close()
+    finally:
+        executor.shutdown()
+    assert parsed == decode_and_parse(content)
+
+def test_inline_mode_has_no_executor():
+    assert create_parse_executor("") is None
+
+def test_decode_feed_uses_cached_encoding():
+    content = load_fixture()
+    text, encoding = decode_feed(content, "euc-kr")
+    assert encoding == "euc-kr"
+    assert "랜섬웨어" in text
+
+def test_decode_feed_detects_on_error():
+    content = "<rss><channel><title>보안뉴스 테스트 피드</title></channel></rss>".encode("utf-8")
+    # 캐시된 인코딩(euc-kr)으로는 디코딩 오류 → 전체 감지로 대체
+    text, encoding = decode_feed(content, "euc-kr")
+    assert "보안뉴스" in text
+    assert encoding.replace("-", "_") == "utf_8"
+
+def test_fast_backend_matches_feedparser():
+    content = load_fixture()
+    fast = decode_and_parse(content, backend="fast")
+    slow = decode_and_parse(content, backend="feedparser")
+    assert len(fast["entries"]) == len(slow["entries"])
+    for a, b in zip(fast["entries"], slow["entries"]):
+        for key in ("title", "link", "summary", "author", "published_parsed"):
+            assert a[key] == b[key], key
+
+def test_fast_backend_sanitizes_like_feedparser():
+    # 활성 콘텐츠(script / 이벤트 속성 / iframe)가 든 항목: 두 백엔드 결과와 content_hash가 같아야 함
+    content = (
+        '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel><title>t</title>'
+        '<item><title><![CDATA[<b onmouseover="x()">굵은</b> 제목]]></title><link>http://example.com/1</link>'
+        '<description><![CDATA[<p>hello <script>alert(1)</script><b>bold</b>'
+        ' <a href="/x" onclick="steal()">링크</a></p><iframe src="http://evil"></iframe>]]></description></item>'
+        '<item><title>A &amp; B</title><link>http://example.com/2</link>'
+        '<description>plain &amp; &lt;i&gt;text&lt;/i&gt;</description></item>'
+        '</channel></rss>'
+    ).encode("utf-8")
+    fast = decode_and_parse(content, "utf-8", backend="fast")["entries"]
+    slow = decode_and_parse(content, "utf-8", backend="feedparser")["entries"]
+    assert fast[0]["summary"] == '<p>hello <b>bold</b> <a href="/x">링크</a></p>'
+    assert fast[0]["title"] == "<b>굵은</b> 제목"
+    for a, b in zip(fast, slow):
+        assert (a["title"], a["summary"]) == (b["title"], b["summary"])
+        assert content_hash(a["title"], a["summary"], a["author"], None) == \
+            content_hash(b["title"], b["summary"], b["author"], None)
+
+def test_fast_backend_falls_back_on_error():
+    atom = (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom"><entry><title>테스트</title>'
+        '<link href="http://example.com/1"/></entry></feed>'
+    ).encode("utf-8")
+    parsed = decode_and_parse(atom, "utf-8", backend="fast")
+    assert parsed["entries"][0]["link"] == "http://example.com/1"
+
+    broken = b"<rss><channel><item><title>x</title><link>http://example.com/2</link></item>"
+    parsed = decode_and_parse(broken, "utf-8", backend="fast")
+    assert parsed["entries"][0]["link"] == "http://example.com/2"
+
+class FakeResponse:
+    def __init__(self, content, fail=False):
+        self.status = 200
+        self.headers = {"ETag": '"v2"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        self.content = content
+        self.fail = fail
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        if self.fail:
+            raise ConnectionResetError("본문 수신 중 끊김")
+        return self.content
+
+class FakeSession:
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def get(self, url, headers=None):
+        return FakeResponse(load_fixture(), self.fail)
+
+URL = "http://www.boannews.com/media/news_rss.xml?kind=1"
+
+@pytest.mark.asyncio
+async def test_validators_kept_until_saved():
+    cache = {URL: {"etag": '"v1"'}}
+    await fetch_single_rss(FakeSession(fail=True), URL, FakeConn(), cache)
+    assert cache[URL]["etag"] == '"v1"'   # 본문 수신/파싱 실패
+
+    entries = await fetch_single_rss(FakeSession(), URL, FakeConn(fail=True), cache)
+    assert len(entries) == 20 and cache[URL]["etag"] == '"v1"'   # 저장 rollback
+
+    await fetch_single_rss(FakeSession(), URL, FakeConn(), cache)
+    assert cache[URL]["etag"] == '"v2"'
+
+class QueueOnly:
+    async def put_many(self, articles):
+        pass
+
+@pytest.mark.asyncio
+async def test_writer_path_defers_validators():
+    cache, pending = {}, {}
+    await fetch_single_rss(FakeSession(), URL, FakeConn(), cache, writer=QueueOnly(), pending=pending)
+    assert "etag" not in cache.get(URL, {})
+    assert pending[URL]["ETag"] == '"v2"'
@@ -0,0 +1,59 @@
+# tests/test_scheduler.py
+"""
+CrawlScheduler 테스트 (네트워크 불필요)
+- 호스트별 동시 실행 제한
+- 바쁜 호스트 대기 작업이 다른 호스트의 전체 슬롯을 막지 않음
+- 대기/수집 시간 기록
+"""
+
+import asyncio
+import pytest
+from src.scheduler import CrawlScheduler
+
+@pytest.mark.asyncio
+async def test_per_host_limit_and_stats():
+    scheduler = CrawlScheduler(max_concurrency=10, per_host_limit=2)
+    running = {"a.com": 0, "b.com": 0}
+    peak = {"a.com": 0, "b.com": 0}
+
+    async def job(url):
+        host = url.split("/")[2]
+        running[host] += 1
+        peak[host] = max(peak[host], running[host])
+        await asyncio.sleep(0.01)
+        running[host] -= 1
+        return url
+
+    urls = [f"http://a.com/{i}" for i in range(6)] + [f"http://b.com/{i}" for i in range(3)]
+    results = await scheduler.gather(urls, job)
+
+    assert results == urls
+    assert peak["a.com"] == 2
+    assert peak["b.com"] == 2
+    assert len(scheduler.stats) == len(urls)
+    assert scheduler.summary()["max_wait"] > 0
+
+@pytest.mark.asyncio
+async def test_busy_host_does_not_block_other_hosts():
+    scheduler = CrawlScheduler(max_concurrency=2, per_host_limit=1)
+    events = []
+
+    async def job(url):
+        events.append(("start", url))
+        await asyncio.sleep(0.02)
+        events.append(("end", url))
+
+    await scheduler.gather(["http://a.com/1", "http://a.com/2", "http://b.com/1"], job)
+    # a.com/2는 호스트 슬롯을 기다리는 동안 전체 슬롯을 잡지 않음 → b.com/1이 a.com/1과 동시에 실행
+    assert events.index(("start", "http://b.com/1")) < events.index(("end", "http://a.com/1"))
+
+@pytest.mark.asyncio
+async def test_exception_is_returned():
+    scheduler = CrawlScheduler()
+
+    async def job(url):
+        raise ValueError(url)
+
+    results = await scheduler.gather(["http://a.com/x"], job)
+    assert isinstance(results[0], ValueError)
+    assert scheduler.stats[0]["ok"] is False
@@ -0,0 +1,87 @@
+# tests/test_schema.py
+"""
+스키마 관리 테스트 (DB 불필요, 가짜 커넥션 사용)
+- 누락 인덱스만 추가
+- link_hash는 NOT NULL 전환 후에만 이전 link 고유 키 제거
+- EXPLAIN 결과에서 전체 테이블 스캔 검출
+"""
+
+import pytest
+from src import schema
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+        self.rowcount = 0
+
+    def execute(self, sql, params=()):
+        self.conn.executed.append(sql)
+        if "information_schema.STATISTICS" in sql:
+            self.rows = [(name,) for name in self.conn.indexes.get(params[0], [])]
+        elif "IS_NULLABLE" in sql:
+            self.rows = [("YES",)] if params[0] in self.conn.nullable else [("NO",)]
+        elif "link_hash IS NULL LIMIT 1" in sql:   # 채우기 중 새로 생긴 빈 행 (채우기 조회는 빈 결과)
+            self.rows = [(1,)] if sql.split(" FROM ")[1].split()[0] in self.conn.null_rows else []
+        elif "information_schema.COLUMNS" in sql or "link_hash IS NULL" in sql:
+            self.rows = []
+        elif "MODIFY link_hash" in sql:
+            self.conn.nullable.discard(sql.split()[2])
+        elif sql.startswith("EXPLAIN"):
+            access = "ALL" if "GROUP BY link_hash" in sql else "range"
+            self.rows = [{"table": "articles", "type": access, "key": None, "rows": 1}]
+            if "ROW_NUMBER()" in sql:   # CTE 중간 결과는 전체 스캔으로 표시됨
+                self.rows.insert(0, {"table": "<derived2>", "type": "ALL", "key": None, "rows": 10})
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def close(self):
+        pass
+
+class FakeConn:
+    def __init__(self, indexes=None, nullable=(), null_rows=()):
+        self.indexes = indexes or {}
+        self.nullable = set(nullable)     # link_hash가 NULL 허용인 테이블
+        self.null_rows = set(null_rows)   # link_hash가 빈 행이 남은 테이블
+        self.executed = []
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+def test_migrate_adds_only_missing_indexes():
+    conn = FakeConn({"articles": ["PRIMARY", "idx_articles_fetched_at"]})
+    assert schema.migrate(conn)
+
+    alters = [sql for sql in conn.executed if sql.startswith("ALTER TABLE")]
+    assert not any("idx_articles_fetched_at (" in sql for sql in alters)
+    assert any("idx_articles_category_fetched_at (category, fetched_at)" in sql for sql in alters)
+    assert any("UNIQUE INDEX uq_articles_old_link_hash (link_hash)" in sql for sql in alters)
+    assert any("ADD COLUMN link_hash" in sql for sql in alters)
+
+def test_verify_flags_full_scan(capsys):
+    full_scans = schema.verify(FakeConn())
+    assert full_scans == [("CRON 점검 중복 링크", "articles")]
+
+def test_migrate_drops_replaced_link_index():
+    conn = FakeConn({"articles": ["PRIMARY", "uq_articles_link", "uq_articles_link_hash"]})
+    schema.migrate(conn)
+    assert "ALTER TABLE articles DROP INDEX uq_articles_link" in conn.executed
+
+def test_link_hash_not_null_before_dropping_link_index():
+    indexes = {"articles": ["PRIMARY", "uq_articles_link", "uq_articles_link_hash"]}
+    # 빈 link_hash가 남아 있으면 NOT NULL 전환 / 이전 키 제거 모두 보류
+    conn = FakeConn(indexes, nullable=["articles"], null_rows=["articles"])
+    assert not schema.migrate(conn)
+    assert not any("MODIFY link_hash" in sql or "DROP INDEX" in sql for sql in conn.executed)
+
+    conn = FakeConn(indexes, nullable=["articles"])
+    assert schema.migrate(conn)
+    modify = conn.executed.index("ALTER TABLE articles MODIFY link_hash BIGINT UNSIGNED NOT NULL")
+    assert conn.executed.index("ALTER TABLE articles DROP INDEX uq_articles_link") > modify
@@ -0,0 +1,111 @@
+# tests/test_search_index.py
+"""
+검색 색인 테스트 (DB 불필요)
+- 한국어 bigram 토큰화
+- 세그먼트 기록 후 검색 (일치 수 → 최신순)
+- 수정된 기사는 새 세그먼트 내용으로 검색, 병합 후에도 동일
+- 읽는 도중 병합으로 세그먼트가 지워져도 다시 읽어 로드
+"""
+
+import pytest
+from datetime import datetime
+from src.hashing import link_hash
+from src.search_index import SearchIndex, tokenize
+
+def article(i, title, summary="", day=1):
+    return {"link": f"http://a/{i}", "title": title, "summary": summary, "published": datetime(2025, 1, day)}
+
+def test_tokenize_korean_bigrams():
+    assert tokenize("<b>랜섬웨어</b> 공격") == {"랜섬", "섬웨", "웨어", "공격"}
+    assert tokenize("AI 보안") == {"ai", "보안"}
+    assert tokenize(None) == set()
+
+def test_search_ranks_by_matches_then_recency(tmp_path):
+    index = SearchIndex(str(tmp_path))
+    index.add_many([
+        article(1, "랜섬웨어 공격 급증", day=1),
+        article(2, "신종 랜섬웨어 등장", day=3),
+        article(3, "개인정보 유출 사고", summary="랜섬 조직 소행", day=5),
+    ])
+    assert index.flush() == 3
+
+    reader = SearchIndex(str(tmp_path))
+    hits = reader.search("랜섬웨어")
+    assert [h.link_hash for h in hits] == [link_hash("http://a/2"), link_hash("http://a/1")]
+    assert reader.search("개인정보")[0].link_hash == link_hash("http://a/3")
+    assert reader.search("없는검색어") == []
+
+    # 일부 토큰만 일치하는 문서는 전부 일치하는 문서 뒤에 최신순
+    partial = reader.search("랜섬 조직", min_match=0.5)
+    assert [h.link_hash for h in partial] == [link_hash(f"http://a/{i}") for i in (3, 2, 1)]
+
+def test_updated_article_shadows_old_segment(tmp_path):
+    index = SearchIndex(str(tmp_path))
+    index.add(article(1, "보안 패치 배포"))
+    index.flush()
+    index.add(article(1, "긴급 업데이트 배포"))
+    index.add(article(2, "보안 점검"))
+    index.flush(max_segments=2)
+
+    reader = SearchIndex(str(tmp_path))
+    assert [h.link_hash for h in reader.search("보안")] == [link_hash("http://a/2")]
+    assert len(reader.search("업데이트")) == 1
+
+    index.add(article(3, "보안 공지"))
+    index.flush(max_segments=2)          # 세그먼트 3개 → 병합
+    assert len(index._read_manifest()) == 1
+    assert len(reader.search("보안")) == 2 and len(reader) == 3
+
+class FakeConn:
+    """link_hash IN 조회 → 저장된 기사 반환"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def cursor(self, *args, **kwargs):
+        return self
+
+    def execute(self, sql, params):
+        self.result = [dict(r) for r in self.rows if r["link_hash"] in params]
+
+    def fetchall(self):
+        return self.result
+
+    def close(self):
+        pass
+
+def test_load_retries_when_compacted_underneath(tmp_path):
+    writer = SearchIndex(str(tmp_path))
+    for i in range(3):
+        writer.add(article(i, f"랜섬웨어 {i}"))
+        writer.flush()
+    stale = writer._read_manifest()
+    writer.compact()   # 이전 세그먼트 디렉터리 삭제
+
+    reader = SearchIndex(str(tmp_path))
+    manifests = [stale]
+    real = reader._read_manifest
+    reader._read_manifest = lambda: manifests.pop() if manifests else real()
+    assert len(reader.search("랜섬웨어")) == 3   # 오래된 매니페스트 → 세그먼트 없음 → 다시 읽음
+
+    # 계속 없으면 해당 세그먼트만 건너뜀
+    broken = SearchIndex(str(tmp_path))
+    broken._read_manifest = lambda: stale[:1] + real()
+    broken.load()
+    assert len(broken) == 3
+
+def test_search_endpoint(monkeypatch, tmp_path):
+    from fastapi.testclient import TestClient
+    import src.api as api
+    from src import async_db
+
+    index = SearchIndex(str(tmp_path))
+    index.add_many([article(1, "랜섬웨어 공격", day=1), article(2, "랜섬웨어 경보", day=2)])
+    index.flush()
+    rows = [{"id": i, "title": f"기사 {i}", "link": f"http://a/{i}", "category": "c",
+             "fetched_at": datetime(2025, 1, i), "link_hash": link_hash(f"http://a/{i}")} for i in (1, 2)]
+    monkeypatch.setattr(api, "search_index", SearchIndex(str(tmp_path)))
+    monkeypatch.setattr(async_db, "get_connection", lambda: FakeConn(rows))
+
+    body = TestClient(api.app).get("/search", params={"q": "랜섬웨어"}).json()
+    assert [a["id"] for a in body["articles"]] == [2, 1]
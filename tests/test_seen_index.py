@@ -0,0 +1,79 @@
+# tests/test_seen_index.py
+"""
+저장된 기사 인덱스 테스트 (DB 불필요, 가짜 커넥션 사용)
+- 파일 저장/로드
+- 내용이 바뀐 기사는 인덱스에 없음으로 판단
+- DB 재구성 및 재구성 주기
+"""
+
+import time
+import pytest
+from src.hashing import link_hash
+from src.seen_index import SeenIndex, load_seen_index
+
+def article(link, content=1):
+    return {"link": link, "content_hash": content}
+
+class FakeCursor:
+    def __init__(self, tables):
+        self.tables = tables
+        self.rows = []
+
+    def execute(self, sql, params=None):
+        table = sql.split("FROM")[1].split()[0]
+        # articles는 link_hash 저장됨, articles_old는 백필 전(NULL)으로 가정
+        links = self.tables.get(table, [])
+        if table == "articles":
+            self.rows = [(link_hash(link), 1, None) for link in links]
+        else:
+            self.rows = [(None, 1, link) for link in links]
+
+    def fetchmany(self, size):
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+    def close(self):
+        pass
+
+class FakeConn:
+    def __init__(self, tables):
+        self.tables = tables
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self.tables)
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "seen.bin")
+    index = SeenIndex(path=path)
+    index.add(article("http://www.boannews.com/media/view.asp?idx=1"))
+    assert index.dirty
+    index.save()
+
+    loaded = SeenIndex.load(path)
+    assert article("http://www.boannews.com/media/view.asp?idx=1") in loaded
+    assert article("http://www.boannews.com/media/view.asp?idx=2") not in loaded
+    assert loaded.built_at == pytest.approx(index.built_at)
+
+def test_changed_content_not_seen():
+    index = SeenIndex(path="unused")
+    index.add(article("http://a/1", content=1))
+    assert article("http://a/1", content=1) in index
+    assert article("http://a/1", content=2) not in index
+
+def test_rebuild_when_missing_or_stale(tmp_path):
+    path = str(tmp_path / "seen.bin")
+    conn = FakeConn({"articles": ["http://a/1"], "articles_old": ["http://a/0"]})
+
+    index = load_seen_index(conn, path)
+    assert len(index) == 2 and article("http://a/0") in index
+    index.save()
+
+    # 재구성 주기 이내 → 파일 그대로 사용
+    conn.tables["articles"].append("http://a/2")
+    assert article("http://a/2") not in load_seen_index(conn, path)
+
+    # 재구성 주기 경과 → DB에서 다시 구성
+    stale = SeenIndex.load(path)
+    stale.built_at = time.time() - 10 * 24 * 3600
+    stale.save()
+    assert article("http://a/2") in load_seen_index(conn, path)
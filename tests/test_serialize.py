@@ -0,0 +1,85 @@
+# tests/test_serialize.py
+"""
+/articles 직렬화 / 압축 테스트 (DB 불필요)
+- 빠른 경로 출력이 Pydantic 모델 직렬화와 바이트 단위로 동일 (orjson / 표준 json 모두)
+- Accept-Encoding 협상, 압축본 ETag 분리
+"""
+
+import importlib
+import sys
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api as api
+from src import async_db, response_cache, serialize
+from src.response_cache import negotiate_encoding
+
+def make_rows(n):
+    return [{"id": i, "title": f"보안 \"기사\" {i}\n", "link": f"http://a/{i}",
+             "category": "http://www.boannews.com/media/news_rss.xml?kind=1" if i % 2 else "unknown",
+             "fetched_at": datetime(2025, 1, 1, 9, 30, 15, 123456)} for i in range(n)]
+
+def pydantic_body(rows, next_cursor):
+    rows = [api.format_article_row(dict(row)) for row in rows]
+    payload = api.ArticlesResponse.model_validate({"articles": rows, "next_cursor": next_cursor})
+    return payload.model_dump_json().encode("utf-8")
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setitem(sys.modules, "orjson", None)   # import 실패 → 표준 json 경로
+    module = importlib.reload(serialize)
+    yield module
+    monkeypatch.undo()
+    importlib.reload(serialize)
+
+def test_fast_body_matches_model(encoder):
+    if encoder.orjson is None:
+        assert sys.modules["orjson"] is None
+    for cursor in (None, "abc"):
+        rows = make_rows(5)
+        assert encoder.articles_body(rows, cursor, api.CATEGORY_MAPPING) == pydantic_body(rows, cursor)
+
+def test_negotiate_encoding(monkeypatch):
+    monkeypatch.setattr(response_cache, "brotli", None)
+    assert negotiate_encoding("gzip, deflate, br", 10) is None           # 작은 본문
+    assert negotiate_encoding("gzip, deflate, br", 5000) == "gzip"
+    assert negotiate_encoding("gzip;q=0, identity", 5000) is None
+    assert negotiate_encoding("*", 5000) == "gzip"
+
+    monkeypatch.setattr(response_cache, "brotli", object())
+    assert negotiate_encoding("gzip, br", 5000) == "br"
+    assert negotiate_encoding("gzip, br;q=0", 5000) == "gzip"
+
+class RowsConn:
+    def cursor(self, *args, **kwargs):
+        return self
+
+    def execute(self, sql, params):
+        pass
+
+    def fetchall(self):
+        return make_rows(50)
+
+    def close(self):
+        pass
+
+def test_articles_gzip_variant(monkeypatch, tmp_path):
+    monkeypatch.setattr(response_cache, "ARTICLES_VERSION_PATH", str(tmp_path / "version"))
+    monkeypatch.setattr(response_cache, "brotli", None)
+    monkeypatch.setattr(async_db, "get_connection", RowsConn)
+    api.articles_cache.clear()
+    client = TestClient(api.app)
+
+    plain = client.get("/articles", headers={"Accept-Encoding": "identity"})
+    zipped = client.get("/articles", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in plain.headers
+    assert zipped.headers["content-encoding"] == "gzip" and "Accept-Encoding" in zipped.headers["vary"]
+    assert zipped.json() == plain.json()           # httpx가 자동 해제
+    assert zipped.headers["etag"] != plain.headers["etag"]
+
+    again = client.get("/articles", headers={"Accept-Encoding": "gzip", "If-None-Match": zipped.headers["etag"]})
+    assert again.status_code == 304
+    assert len(api.articles_cache) == 2
@@ -0,0 +1,114 @@
+# tests/test_stats.py
+"""
+카테고리/시간별 기사 통계 테스트 (DB 불필요)
+- 저장 / 아카이브 트랜잭션 안에서 통계 갱신 SQL 실행
+- 통계 갱신 실패가 저장을 막지 않음
+- /stats 응답 (DB 키 매핑, 합계, 시간별)
+"""
+
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+import src.api as api
+from src import archive, async_db, response_cache, stats
+from src.db import INSERT_ARTICLE_SQL, save_articles
+
+class RecordingCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 0
+        self.rows = []
+
+    def execute(self, sql, params=()):
+        self.conn.executed.append((sql, list(params)))
+        if "article_stats" in sql and self.conn.fail_stats:
+            raise RuntimeError("Table 'article_stats' doesn't exist")
+        if sql == archive.SELECT_CHECKPOINT_SQL:
+            self.rows = []
+        elif sql == archive.SELECT_RANGE_SQL:
+            self.rows = [(1, 5)]
+        elif sql.strip().startswith("SELECT category") or sql.strip().startswith("SELECT hour"):
+            self.rows = self.conn.stats_rows if "GROUP BY category" in sql else self.conn.hour_rows
+        else:
+            self.rows = []
+
+    def executemany(self, sql, rows):
+        self.conn.executed.append((sql, rows))
+        self.rowcount = len(rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+class RecordingConn:
+    def __init__(self, fail_stats=False):
+        self.fail_stats = fail_stats
+        self.executed = []
+        self.commits = 0
+        self.stats_rows = []
+        self.hour_rows = []
+
+    def cursor(self, *args, **kwargs):
+        return RecordingCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+    def sql(self):
+        return [sql for sql, _ in self.executed]
+
+ARTICLES = [{"title": f"기사 {i}", "link": f"http://a/{i}", "published": datetime(2025, 1, 1),
+             "summary": None, "source": "boannews", "category": "c", "author": None} for i in range(3)]
+
+def test_save_records_inserted_in_same_transaction():
+    conn = RecordingConn()
+    assert save_articles(conn, ARTICLES)["inserted"] == 3
+    executed = conn.sql()
+    stats_sql = [sql for sql in executed if "INSERT INTO article_stats" in sql]
+    assert len(stats_sql) == 1
+    assert executed.index(stats_sql[0]) > executed.index(INSERT_ARTICLE_SQL)
+    assert len(conn.executed[executed.index(stats_sql[0])][1]) == 3   # 신규 link_hash 3개
+    assert conn.commits == 1
+
+def test_stats_failure_does_not_block_save():
+    conn = RecordingConn(fail_stats=True)
+    assert save_articles(conn, ARTICLES) == {"inserted": 3, "updated": 0, "ignored": 0, "failed": 0}
+
+def test_archive_moves_counts_before_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(response_cache, "ARTICLES_VERSION_PATH", str(tmp_path / "articles_version"))
+    conn = RecordingConn()
+    archive.archive_old_articles(days=1, chunk_size=2, conn=conn, layout="plain")
+    executed = conn.sql()
+    moved = [i for i, sql in enumerate(executed) if "FROM articles a" in sql]
+    copies = [i for i, sql in enumerate(executed) if sql == archive.COPY_CHUNK_SQL]
+    assert len(moved) == len(copies) == 3
+    assert all(m == c - 1 for m, c in zip(moved, copies))
+    assert conn.executed[moved[0]][1][:2] == [1, 2]
+
+def test_stats_endpoint(monkeypatch):
+    conn = RecordingConn()
+    conn.stats_rows = [("http://www.boannews.com/media/news_rss.xml?kind=1", 3, 7), ("", 1, None)]
+    conn.hour_rows = [(datetime(2025, 1, 1, 9), 4, 7)]
+    monkeypatch.setattr(async_db, "get_connection", lambda: conn)
+    client = TestClient(api.app)
+
+    body = client.get("/stats", params={"since": "2025-01-01T00:00:00", "hourly": "true"}).json()
+    assert body["live"] == 4 and body["archived"] == 7
+    assert body["categories"][0] == {"category": "incidents", "live": 3, "archived": 7}
+    assert body["categories"][1]["category"] is None
+    assert body["hourly"] == [{"hour": "2025-01-01T09:00:00", "live": 4, "archived": 7}]
+    assert conn.executed[0][1][0] == datetime(2025, 1, 1)
+
+    assert client.get("/stats").json()["hourly"] is None
@@ -0,0 +1,192 @@
+# tests/test_timerange.py
+"""
+articles + articles_old 통합 범위 조회 테스트 (DB 불필요)
+- 아카이브 경계로 조회 테이블 선택
+- 앞 테이블만으로 페이지가 차면 뒤 테이블 조회 생략
+- 스트리밍 병합 순서 / 중복 제거
+- 구간 요약: 전체 / 카테고리별 상위 N건 1회 조회
+- 아카이브 경계 캐시: 페이지마다 다시 조회하지 않고, 아카이브 시작 신호 시 재조회
+"""
+
+import pytest
+
+from datetime import datetime, timedelta, timezone
+
+from src import response_cache, timerange
+from src.timerange import Boundary, fetch_digest, fetch_page, iter_range, plan_tables, to_db_time
+
+BASE = datetime(2025, 1, 1)
+
+class RangeCursor:
+    """build_range_query 조건을 메모리 테이블에 적용"""
+
+    def __init__(self, db):
+        self.db = db
+        self.result = []
+
+    def execute(self, sql, params=()):
+        params = list(params)
+        if "archive_checkpoint" in sql:
+            self.db.boundary_reads += 1
+            self.result = [self.db.checkpoint] if self.db.checkpoint else []
+            return
+        if "ROW_NUMBER()" in sql:
+            self.digest(sql, params)
+            return
+        table = sql.split(" FROM ")[1].split()[0]
+        self.db.queries.append(table)
+        rows = self.db.tables[table]
+        limit = params.pop()
+        if "category = %s" in sql:
+            category = params.pop(0)
+            rows = [r for r in rows if r["category"] == category]
+        if "fetched_at >= %s" in sql:
+            since = params.pop(0)
+            rows = [r for r in rows if r["fetched_at"] >= since]
+        ascending = "fetched_at ASC" in sql
+        if "id > %s" in sql or "id < %s" in sql:
+            at, _, last_id = params[-3:]
+            params = params[:-3]
+            key = (at, last_id)
+            rows = [r for r in rows if ((r["fetched_at"], r["id"]) > key) == ascending
+                    and (r["fetched_at"], r["id"]) != key]
+        if params:   # until
+            until = params.pop(0)
+            rows = [r for r in rows if r["fetched_at"] < until]
+        rows = sorted(rows, key=lambda r: (r["fetched_at"], r["id"]), reverse=not ascending)
+        self.result = [dict(r) for r in rows[:limit]]
+
+    def digest(self, sql, params):
+        """UNION 대상 테이블 → 구간 필터 → 전체 / 카테고리별 순위"""
+        tables = [part.split()[0] for part in sql.split(" FROM ")[1:] if part.startswith("articles")]
+        self.db.queries.append("digest:" + "+".join(tables))
+        since, until = params[:2]
+        overall, per_category = params[-2:]
+        rows = {(r["fetched_at"], r["id"]): r for t in tables for r in self.db.tables[t]
+                if since <= r["fetched_at"] < until}
+        counts, self.result = {}, []
+        for i, key in enumerate(sorted(rows), 1):
+            row = rows[key]
+            counts[row["category"]] = counts.get(row["category"], 0) + 1
+            if i <= overall or counts[row["category"]] <= per_category:
+                self.result.append(dict(row, overall_rank=i, category_rank=counts[row["category"]]))
+
+    def fetchone(self):
+        return self.result[0] if self.result else None
+
+    def fetchall(self):
+        return self.result
+
+    def close(self):
+        pass
+
+class RangeDB:
+    def __init__(self, old_ids, live_ids, checkpoint=None):
+        def row(i):
+            return {"id": i, "title": f"기사 {i}", "link": f"http://a/{i}", "category": "c",
+                    "fetched_at": BASE + timedelta(hours=i)}
+        self.tables = {"articles_old": [row(i) for i in old_ids], "articles": [row(i) for i in live_ids]}
+        self.checkpoint = checkpoint
+        self.queries = []
+        self.boundary_reads = 0
+
+    def cursor(self, *args, **kwargs):
+        return RangeCursor(self)
+
+@pytest.fixture(autouse=True)
+def boundary_cache(tmp_path, monkeypatch):
+    # 테스트마다 다른 가짜 DB → 경계 캐시 초기화, 아카이브 시작 신호 파일은 임시 경로
+    monkeypatch.setattr(response_cache, "ARTICLES_VERSION_PATH", str(tmp_path / "articles_version"))
+    timerange.clear_boundary_cache()
+    yield
+    timerange.clear_boundary_cache()
+
+def archived_db():
+    # 1~10번 아카이브 완료 (archived_upto = 10시), 11~20번은 articles
+    return RangeDB(range(1, 11), range(11, 21), ("done", BASE + timedelta(hours=10), BASE + timedelta(hours=10)))
+
+def test_plan_tables():
+    boundary = Boundary(BASE, BASE)
+    assert plan_tables(None) == ["articles", "articles_old"]
+    assert plan_tables(boundary, since=BASE + timedelta(hours=1)) == ["articles"]
+    assert plan_tables(boundary, until=BASE) == ["articles_old"]
+    assert plan_tables(boundary, until=BASE, ascending=True) == ["articles_old"]
+    assert plan_tables(boundary, ascending=True) == ["articles_old", "articles"]
+    # 진행 중인 아카이브: cutoff까지는 두 테이블 모두 가능
+    running = Boundary(BASE, BASE + timedelta(hours=5))
+    assert plan_tables(running, since=BASE + timedelta(hours=3)) == ["articles", "articles_old"]
+
+def test_recent_page_skips_archive():
+    db = archived_db()
+    rows = fetch_page(db, 5)
+    assert [r["id"] for r in rows] == [20, 19, 18, 17, 16]
+    assert db.queries == ["articles"]
+
+def test_page_crossing_boundary_merges():
+    db = archived_db()
+    rows = fetch_page(db, 5, after=(BASE + timedelta(hours=13), 13))
+    assert [r["id"] for r in rows] == [12, 11, 10, 9, 8]
+    assert db.queries == ["articles", "articles_old"]
+
+    db.queries.clear()
+    rows = fetch_page(db, 3, since=BASE + timedelta(hours=2), until=BASE + timedelta(hours=6), ascending=True)
+    assert [r["id"] for r in rows] == [2, 3, 4]
+    assert db.queries == ["articles_old"]
+
+def test_iter_range_streams_in_order_without_duplicates():
+    # 아카이브 진행 중: 9, 10번이 두 테이블에 모두 보임
+    db = RangeDB(range(1, 11), range(9, 21), ("running", BASE + timedelta(hours=10), None))
+    rows = list(iter_range(db, page_size=3))
+    assert [r["id"] for r in rows] == list(range(1, 21))
+    assert db.queries.count("articles_old") == 4   # 3 + 3 + 3 + 1건
+    rows = list(iter_range(db, ascending=False, since=BASE + timedelta(hours=15), page_size=3))
+    assert [r["id"] for r in rows] == [20, 19, 18, 17, 16, 15]
+
+def test_aware_range_converted_to_local():
+    # API 응답의 pub_date(…Z)를 그대로 since로 보내는 경우: naive 경계와 비교해도 TypeError 없음
+    db = archived_db()
+    local = BASE + timedelta(hours=12)
+    since = local.astimezone().astimezone(timezone.utc)   # 같은 시각의 UTC(Z) 표기
+    assert since.tzinfo is not None and to_db_time(since) == local
+    assert [r["id"] for r in fetch_page(db, 3, since=since, ascending=True)] == [12, 13, 14]
+    assert db.queries == ["articles"]
+    assert [r["id"] for r in iter_range(db, until=since)] == list(range(1, 12))
+
+def test_missing_checkpoint_reads_both():
+    db = RangeDB(range(1, 3), range(3, 5))
+    assert timerange.read_boundary(db) is None
+    assert [r["id"] for r in fetch_page(db, 10)] == [4, 3, 2, 1]
+
+def test_digest_single_query():
+    # 아카이브 진행 중 (9, 10번 양쪽), 짝수 id는 카테고리 d
+    db = RangeDB(range(1, 11), range(9, 21), ("running", BASE + timedelta(hours=10), None))
+    for table in db.tables.values():
+        for row in table:
+            row["category"] = "d" if row["id"] % 2 == 0 else "c"
+
+    top, by_category = fetch_digest(db, BASE + timedelta(hours=4), BASE + timedelta(hours=20), 3, 2)
+    assert [r["id"] for r in top] == [4, 5, 6]
+    assert {c: [r["id"] for r in rows] for c, rows in by_category.items()} == {"c": [5, 7], "d": [4, 6]}
+    assert "overall_rank" not in top[0]
+    assert db.queries == ["digest:articles_old+articles"]
+    assert db.boundary_reads == 0   # 경계 조회 없이 1회 왕복
+
+    db = archived_db()
+    top, _ = fetch_digest(db, BASE + timedelta(hours=12), BASE + timedelta(hours=20), 5, 3)
+    assert [r["id"] for r in top] == [12, 13, 14, 15, 16]
+    assert db.queries == ["digest:articles_old+articles"] and db.boundary_reads == 0
+
+def test_boundary_cached_until_archive_starts():
+    db = archived_db()
+    fetch_page(db, 5)
+    fetch_page(db, 5, after=(BASE + timedelta(hours=16), 16))
+    assert db.boundary_reads == 1   # 다음 페이지는 캐시된 경계 사용
+
+    # 새 아카이브 시작: 11~12번 이동 중 → 시작 신호 후 다음 조회에서 경계 재조회
+    db.checkpoint = ("running", BASE + timedelta(hours=12), BASE + timedelta(hours=10))
+    db.tables["articles_old"] += [r for r in db.tables["articles"] if r["id"] <= 12]
+    db.tables["articles"] = [r for r in db.tables["articles"] if r["id"] > 12]
+    response_cache.bump_archive_version()
+    rows = fetch_page(db, 5, since=BASE + timedelta(hours=11), ascending=True)
+    assert [r["id"] for r in rows] == [11, 12, 13, 14, 15]
+    assert db.boundary_reads == 2
@@ -0,0 +1,47 @@
+# tests/test_writer.py
+"""
+ArticleWriter 테스트 (DB 불필요, 가짜 커넥션 사용)
+- 크기 / 시간 기준 flush
+- 종료 시 남은 기사 저장
+- 저장 성공 후 on_saved / on_inserted(신규 기사만) 호출, 실패 시 on_failed
+"""
+
+import asyncio
+import pytest
+from src.writer import ArticleWriter
+from tests.test_db_batch import FakeConn, make_articles
+
+@pytest.mark.asyncio
+async def test_flush_by_size_and_close():
+    conn = FakeConn()
+    saved, inserted = [], []
+    async with ArticleWriter(conn, batch_size=2, flush_interval=60, on_saved=saved.extend,
+                             on_inserted=inserted.extend) as writer:
+        await writer.put_many(make_articles(5))
+
+    assert conn.batches == [1, 2, 1]   # http://a/0은 이미 저장됨
+    assert writer.totals["inserted"] == 4
+    assert writer.totals["ignored"] == 1
+    assert len(saved) == 5
+    assert [a["link"] for a in inserted] == [f"http://a/{i}" for i in range(1, 5)]
+
+@pytest.mark.asyncio
+async def test_flush_by_time():
+    conn = FakeConn()
+    writer = ArticleWriter(conn, batch_size=100, flush_interval=0.05)
+    writer.start()
+    await writer.put_many(make_articles(3))
+    await asyncio.sleep(0.2)
+    assert conn.batches == [2]
+    await writer.close()
+    assert conn.batches == [2]
+
+@pytest.mark.asyncio
+async def test_failed_batch_skips_on_saved():
+    conn = FakeConn(fail=True)
+    saved, failed = [], []
+    async with ArticleWriter(conn, on_saved=saved.extend, on_failed=failed.extend) as writer:
+        await writer.put_many(make_articles(2))
+    assert writer.totals["failed"] == 2
+    assert saved == []
+    assert len(failed) == 2